@@ -2,22 +2,24 @@
 """
 Fix all markdown linting issues for PR #88
 Addresses MD040 (code block languages), MD060 (table formatting), MD036 (emphasis as heading)
+
+PR-specific one-off; for general MD040/MD060/MD036 fixes over docs/ use
+scripts/fix-markdown.py, which finds the issues itself.
 """
 
-import re
 import os
+import sys
 
-def fix_file(filepath, fixes):
-    """Apply fixes to a file"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    for old, new in fixes:
-        content = content.replace(old, new)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from mdtools.replace import fix_file as apply_fixes
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print(f"Fixed: {filepath}")
+def fix_file(filepath, fixes):
+    """Apply fixes to a file in one pass (rewritten only if something changed)"""
+    count = apply_fixes(filepath, fixes)
+    if count:
+        print(f"Fixed: {filepath} ({count} replacements)")
+    else:
+        print(f"No changes: {filepath}")
 
 # Fix phase2-rivertemplate-task-breakdown.md - Remove duplicate heading
 fix_file(r'c:\Users\matth\Desktop\wvwo-storefront\docs\phase2-rivertemplate-task-breakdown.md', [
@@ -1,24 +1,23 @@
 #!/usr/bin/env python3
 """
 Final comprehensive fix for all markdown linting issues in PR #88
+
+PR-specific one-off; for general MD040/MD060/MD036 fixes over docs/ use
+scripts/fix-markdown.py, which finds the issues itself.
 """
 
-import re
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+from mdtools.replace import fix_file as apply_fixes
 
 def fix_file(filepath, fixes):
-    """Apply fixes to a file"""
+    """Apply fixes to a file in one pass (rewritten only if something changed)"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        original = content
-        for old, new in fixes:
-            content = content.replace(old, new)
-
-        if content != original:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"OK Fixed: {filepath}")
+        count = apply_fixes(filepath, fixes)
+        if count:
+            print(f"OK Fixed: {filepath} ({count} replacements)")
         else:
             print(f"  No changes: {filepath}")
     except Exception as e:
@@ -53,50 +52,20 @@ fix_file(r'c:\Users\matth\Desktop\wvwo-storefront\docs\architecture\SPEC-12-SCHE
 ])
 
 # Fix ERROR_HANDLING_AUDIT_PR16.md - Table formatting (lines 706, 777)
-error_handling_content = None
-try:
-    with open(r'c:\Users\matth\Desktop\wvwo-storefront\docs\ERROR_HANDLING_AUDIT_PR16.md', 'r', encoding='utf-8') as f:
-        error_handling_content = f.read()
-
-    # Fix line 706 table (Component|Line|Issue|Severity|Status|Recommendation)
-    error_handling_content = error_handling_content.replace(
-        '|Component|Line|Issue|Severity|Status|Recommendation|',
-        '| Component | Line | Issue | Severity | Status | Recommendation |'
-    )
-    # Fix line 777 table (Category|Current|Required)
-    error_handling_content = error_handling_content.replace(
-        '|Category|Current|Required|',
-        '| Category | Current | Required |'
-    )
-
-    with open(r'c:\Users\matth\Desktop\wvwo-storefront\docs\ERROR_HANDLING_AUDIT_PR16.md', 'w', encoding='utf-8') as f:
-        f.write(error_handling_content)
-    print("OK Fixed: ERROR_HANDLING_AUDIT_PR16.md")
-except Exception as e:
-    print(f"ERROR: {e}")
-
-# Fix HUNTING_TOURISM_MARKET_ANALYSIS.md - More table formatting
-hunting_content = None
-try:
-    with open(r'c:\Users\matth\Desktop\wvwo-storefront\docs\HUNTING_TOURISM_MARKET_ANALYSIS.md', 'r', encoding='utf-8') as f:
-        hunting_content = f.read()
-
-    # Fix all compact table headers
-    patterns = [
-        (r'\|Category\|Revenue\|Employment\|', '| Category | Revenue | Employment |'),
-        (r'\|State\|Hunters\|Revenue\|Days\|Trips\|Spend\|', '| State | Hunters | Revenue | Days | Trips | Spend |'),
-        (r'\|Category\|Spending\|Notes\|', '| Category | Spending | Notes |'),
-        (r'\|Recommendation\|Priority\|Effort\|Impact\|Implementation\|', '| Recommendation | Priority | Effort | Impact | Implementation |'),
-    ]
-
-    for old_pattern, new_pattern in patterns:
-        hunting_content = re.sub(old_pattern, new_pattern, hunting_content)
+fix_file(r'c:\Users\matth\Desktop\wvwo-storefront\docs\ERROR_HANDLING_AUDIT_PR16.md', [
+    ('|Component|Line|Issue|Severity|Status|Recommendation|',
+     '| Component | Line | Issue | Severity | Status | Recommendation |'),
+    ('|Category|Current|Required|',
+     '| Category | Current | Required |'),
+])
 
-    with open(r'c:\Users\matth\Desktop\wvwo-storefront\docs\HUNTING_TOURISM_MARKET_ANALYSIS.md', 'w', encoding='utf-8') as f:
-        f.write(hunting_content)
-    print("OK Fixed: HUNTING_TOURISM_MARKET_ANALYSIS.md")
-except Exception as e:
-    print(f"ERROR: {e}")
+# Fix HUNTING_TOURISM_MARKET_ANALYSIS.md - All compact table headers
+fix_file(r'c:\Users\matth\Desktop\wvwo-storefront\docs\HUNTING_TOURISM_MARKET_ANALYSIS.md', [
+    ('|Category|Revenue|Employment|', '| Category | Revenue | Employment |'),
+    ('|State|Hunters|Revenue|Days|Trips|Spend|', '| State | Hunters | Revenue | Days | Trips | Spend |'),
+    ('|Category|Spending|Notes|', '| Category | Spending | Notes |'),
+    ('|Recommendation|Priority|Effort|Impact|Implementation|', '| Recommendation | Priority | Effort | Impact | Implementation |'),
+])
 
 # Fix ROLLBACK-SCRIPT-SPEC-45.md
 fix_file(r'c:\Users\matth\Desktop\wvwo-storefront\docs\ROLLBACK-SCRIPT-SPEC-45.md', [
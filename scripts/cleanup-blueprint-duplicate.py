@@ -1,36 +1,50 @@
-import re
-
-# Read the file
-with open('docs/BLUEPRINT.md', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
-
-# Find the duplicate section starting at line 971 (0-indexed: 970)
-# The duplicate starts with the old Phase 3 content
-# We need to remove from line 972 to where the next proper section starts
-
-# Let's find where the duplicate section ends
-# It should be before "1. The Best Boots for Deer Hunting" or similar old content
-
-output_lines = []
-skip_mode = False
-for i, line in enumerate(lines):
-    line_num = i + 1
-    
-    # Start skipping from line 972 (the duplicate "The core pivot" line)
-    if line_num == 972 and "The core pivot" in line:
-        skip_mode = True
-        continue
-    
-    # Look for the old orphaned content that starts with numbered list
-    if skip_mode and (line.strip().startswith('1. "The Best Boots') or line.strip().startswith('**HUNTING (4 posts):**')):
-        skip_mode = False
-        # We've reached the old content that should be preserved
-    
-    if not skip_mode:
-        output_lines.append(line)
-
-# Write back
-with open('docs/BLUEPRINT.md', 'w', encoding='utf-8') as f:
-    f.writelines(output_lines)
-
-print(f"Removed duplicate content. Original lines: {len(lines)}, New lines: {len(output_lines)}")
+import sys
+
+from mdtools.duplicates import MIN_BLOCK_CHARS, find_duplicates, hash_lines, remove_repeats
+from mdtools.sections import SectionTree
+from mdtools.walk import DOCS_DIR
+
+BLUEPRINT = DOCS_DIR / "BLUEPRINT.md"
+
+# Same threshold as find-duplicate-blocks.py, so both agree on what is a repeated block
+MIN_CHARS = MIN_BLOCK_CHARS
+if "--min-chars" in sys.argv:
+    MIN_CHARS = int(sys.argv[sys.argv.index("--min-chars") + 1])
+
+original = BLUEPRINT.read_bytes()
+
+# A block repeated verbatim (e.g. the Phase 3 body pasted in again under the
+# Phase 4 heading) is dropped wherever it sits, keeping the first copy - the
+# same blocks find-duplicate-blocks.py --check reports
+text, removed = remove_repeats(original.decode("utf-8"), min_chars=MIN_CHARS)
+for block in removed:
+    (_, first, last), *copies = block.copies
+    lines = ", ".join(f"{start}-{end}" for _, start, end in copies)
+    print(f"Removed repeated block: lines {lines} (copy of lines {first}-{last})")
+
+# A section repeated with identical content but too short to count as a block
+tree = SectionTree(text, BLUEPRINT)
+for section in tree.dedupe():
+    print(f"Removed duplicate section: {' > '.join(section.path)}")
+data = tree.render()
+
+# Anything still repeated differs between copies - merging those needs a human
+remaining = 0
+for kept, repeats in SectionTree(data).duplicates():
+    remaining += 1
+    lines = ", ".join(str(section.line) for section in repeats)
+    print(f"Review by hand: '{kept.title}' (line {kept.line}) repeated with different content at line {lines}")
+for block in find_duplicates([("", *hash_lines(data.decode("utf-8").splitlines()))], min_chars=MIN_CHARS):
+    remaining += 1
+    (_, first, last), *copies = block.copies
+    lines = ", ".join(f"{start}-{end}" for _, start, end in copies)
+    print(f"Review by hand: lines {first}-{last} repeated with different markup at lines {lines}")
+
+# Write back (only if something was removed)
+if data != original:
+    BLUEPRINT.write_bytes(data)
+    original_lines, new_lines = original.count(b"\n"), data.count(b"\n")
+    print(f"Removed duplicate content. Original lines: {original_lines}, New lines: {new_lines}")
+elif not remaining:
+    print("No duplicate sections found")
+sys.exit(1 if remaining else 0)
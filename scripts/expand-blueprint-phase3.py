@@ -1,10 +1,9 @@
-import re
+from mdtools.sections import SectionTree
+from mdtools.walk import DOCS_DIR
 
-# Read the BLUEPRINT.md file
-with open('docs/BLUEPRINT.md', 'r', encoding='utf-8') as f:
-    content = f.read()
+BLUEPRINT = DOCS_DIR / "BLUEPRINT.md"
 
-# Define the new Phase 3 content
+# Define the new Phase 3 content (heading line through its closing rule)
 new_phase3 = """### PHASE 3: MOUNTAIN STATE ADVENTURE DESTINATION (Weeks 4-6)
 
 **The core pivot: Moving from a retail store to a geographic destination resource.**
@@ -60,7 +59,10 @@ new_phase3 = """### PHASE 3: MOUNTAIN STATE ADVENTURE DESTINATION (Weeks 4-6)
 
 ---
 
-### PHASE 4: CONTENT SEEDING & LEGACY CLEANUP (Week 7)
+"""
+
+# Heading that introduces the seeding content after Phase 3
+new_phase4_intro = """### PHASE 4: CONTENT SEEDING & LEGACY CLEANUP (Week 7)
 
 #### 4.1 Blog Posts (Ghost/Content Seeding)
 
@@ -70,26 +72,24 @@ new_phase3 = """### PHASE 3: MOUNTAIN STATE ADVENTURE DESTINATION (Weeks 4-6)
 
 """
 
-# Find and replace Phase 3 section
-# Pattern: Start with "### PHASE 3" and go until "### PHASE 4" or similar
-pattern = r'### PHASE 3: MOUNTAIN STATE ADVENTURE DESTINATION.*?(?=### PHASE 4|^[^\#])'
-match = re.search(pattern, content, re.DOTALL | re.MULTILINE)
+# Parse BLUEPRINT.md once into its heading tree
+tree = SectionTree.load(BLUEPRINT)
 
-if match:
-    # Replace the matched section
-    content = content[:match.start()] + new_phase3 + content[match.end():]
-    print(f"Replaced Phase 3 section (found at position {match.start()})")
-else:
+# Phase 3 runs from its heading to the next ### (or higher) heading
+phase3 = tree.find_title("PHASE 3: MOUNTAIN STATE ADVENTURE DESTINATION", prefix=True)
+if phase3 is None:
     print("Could not find Phase 3 section to replace")
-    # Try alternative pattern
-    pattern2 = r'### PHASE 3.*?(?=\n1\. "The Best Boots)'
-    match2 = re.search(pattern2, content, re.DOTALL | re.MULTILINE)
-    if match2:
-        content = content[:match2.start()] + new_phase3 + content[match2.end():]
-        print(f"Replaced Phase 3 section using alternative pattern")
-
-# Write back
-with open('docs/BLUEPRINT.md', 'w', encoding='utf-8') as f:
-    f.write(content)
-
-print("BLUEPRINT.md Phase 3 expansion complete")
+else:
+    tree.replace(phase3, new_phase3)
+    print(f"Replaced Phase 3 section (line {phase3.line}, byte {phase3.start})")
+
+    # Add the Phase 4 seeding heading right after Phase 3 unless it is already there
+    if tree.find_title("PHASE 4: CONTENT SEEDING & LEGACY CLEANUP", prefix=True) is None:
+        tree.insert_after(phase3, new_phase4_intro)
+        print("Inserted Phase 4 content seeding heading")
+
+# Write back (single pass, only if changed)
+if tree.write():
+    print("BLUEPRINT.md Phase 3 expansion complete")
+else:
+    print("BLUEPRINT.md already up to date")
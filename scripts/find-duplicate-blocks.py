@@ -0,0 +1,83 @@
+"""
+Duplicate content detector for docs/
+====================================
+Finds multi-line blocks repeated across or within markdown files (see
+mdtools.duplicates) - consolidation candidates, and pastes like the Phase 3
+section that once appeared twice in BLUEPRINT.md. Largest waste first.
+
+Whole docs/ tree (run from anywhere):
+    python scripts/find-duplicate-blocks.py
+
+Specific files or directories; smaller blocks; more results:
+    python scripts/find-duplicate-blocks.py docs/BLUEPRINT.md docs/specs --min-chars 150 --top 50
+
+Fail only on a block repeated inside one file (pre-commit):
+    python scripts/find-duplicate-blocks.py --check
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from mdtools.duplicates import MIN_BLOCK_CHARS, find_duplicates, hash_file
+from mdtools.walk import DOCS_DIR, iter_markdown, process_files
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BLUEPRINT = DOCS_DIR / "BLUEPRINT.md"
+TOP = 20
+
+
+def shown(path):
+    path = Path(path)
+    return path.relative_to(REPO_ROOT).as_posix() if path.is_relative_to(REPO_ROOT) else str(path)
+
+
+def main():
+    args = sys.argv[1:]
+    check = "--check" in args
+    options = {"--min-chars": MIN_BLOCK_CHARS, "--top": TOP, "--workers": None}
+    for option in options:
+        if option in args:
+            options[option] = int(args[args.index(option) + 1])
+            del args[args.index(option):args.index(option) + 2]
+    targets = [Path(arg).resolve() for arg in args if not arg.startswith("--")] or [DOCS_DIR]
+
+    started = time.perf_counter()
+    paths = []
+    for target in targets:
+        if target.is_dir():
+            paths.extend(path for path, _ in iter_markdown(target))
+        elif target.suffix.lower() == ".md":
+            paths.append(target)
+    files = [hashed for _, hashed in process_files(hash_file, paths, workers=options["--workers"])]
+    blocks = find_duplicates(files, min_chars=options["--min-chars"])
+    elapsed = time.perf_counter() - started
+
+    within = [block for block in blocks if block.within_file]
+    print("=" * 60)
+    print(f"DUPLICATE BLOCKS ({len(paths)} files, {elapsed:.2f}s)")
+    print("=" * 60)
+    for block in (within if check else blocks[:options["--top"]]):
+        tag = " [same file]" if block.within_file else ""
+        print(f"\n{block.lines} lines, ~{block.chars} chars x{len(block.copies)}{tag}")
+        for path, first, last in block.copies:
+            print(f"  {shown(path)}:{first}-{last}")
+
+    wasted = sum(block.wasted for block in blocks)
+    print(f"\n{len(blocks)} duplicated blocks ({len(within)} within a single file), "
+          f"~{wasted / 1024:.0f}KB repeated text")
+    if not check and len(blocks) > options["--top"]:
+        print(f"(showing the top {options['--top']}; --top N for more)")
+    if check and within:
+        files = {Path(path) for block in within for path, _, _ in block.copies}
+        print("\n[X] Blocks repeated within a file - merge or remove the extra copies by hand")
+        if BLUEPRINT in files:
+            # The cleanup script removes copies whose lines match exactly and lists the rest
+            min_chars = f" --min-chars {options['--min-chars']}" if options["--min-chars"] != MIN_BLOCK_CHARS else ""
+            print(f"    BLUEPRINT.md: python scripts/cleanup-blueprint-duplicate.py{min_chars}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
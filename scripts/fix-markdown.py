@@ -0,0 +1,106 @@
+"""
+Markdown lint autofixer - MD040, MD060, MD036
+==============================================
+Finds and fixes the markdownlint issues docs PRs keep tripping, instead of
+hard-coding before/after strings per file (see mdtools.rules):
+- MD040: bare ``` fences get a guessed language (text when unsure)
+- MD060: table rows get "| cell | cell |" pipe spacing
+- MD036: a lone **bold** line becomes a heading
+
+Each file is parsed once and every rule is applied in the same pass; files
+are only rewritten when something changed. Rules a .markdownlint.json turns
+off for a directory stay off.
+
+Runs are incremental: files that were clean last run and have not changed
+since are skipped (manifest in scripts/.cache/, see mdtools.walk), and the
+rest are spread over a process pool.
+
+Fix every docs/**/*.md (run from anywhere):
+    python scripts/fix-markdown.py
+
+Check only - exit 1 if anything needs fixing (pre-commit):
+    python scripts/fix-markdown.py --check
+
+Specific files or directories, selected rules:
+    python scripts/fix-markdown.py docs/rules.md docs/architecture --rules MD040,MD060
+
+Every file, ignoring the manifest; pool size:
+    python scripts/fix-markdown.py --no-cache --workers 4
+"""
+
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+from mdtools.rules import RULES, RULES_VERSION, autofix_file, enabled_rules
+from mdtools.walk import DOCS_DIR, Manifest, iter_markdown, process_files
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def main():
+    args = sys.argv[1:]
+    check = "--check" in args
+    rules = list(RULES)
+    if "--rules" in args:
+        rules = [rule.strip().upper() for rule in args[args.index("--rules") + 1].split(",")]
+        unknown = [rule for rule in rules if rule not in RULES]
+        if unknown:
+            print(f"Unknown rules {', '.join(unknown)} (expected {', '.join(RULES)})")
+            return 2
+        del args[args.index("--rules"):args.index("--rules") + 2]
+    workers = None
+    if "--workers" in args:
+        workers = int(args[args.index("--workers") + 1])
+        del args[args.index("--workers"):args.index("--workers") + 2]
+    targets = [Path(arg).resolve() for arg in args if not arg.startswith("--")]
+    full_walk = not targets
+
+    started = time.perf_counter()
+    manifest = Manifest("fix-markdown", REPO_ROOT, version=f"{RULES_VERSION}:{','.join(sorted(rules))}",
+                        enabled="--no-cache" not in args)
+    # Each file is keyed on the rules its .markdownlint.json files leave on, so
+    # re-enabling a rule in a directory rechecks that directory
+    applied = {}
+    files = []
+    for target in targets or [DOCS_DIR]:
+        if target.is_dir():
+            for path, stat in iter_markdown(target):
+                applied[path] = ",".join(enabled_rules(path.resolve(), REPO_ROOT, rules))
+                if manifest.changed(path, stat, applied[path]):
+                    files.append(path)
+        elif target.suffix.lower() == ".md":
+            # Named explicitly (pre-commit passes the staged files): always checked
+            applied[target] = ",".join(enabled_rules(target, REPO_ROOT, rules))
+            manifest.changed(target, extra=applied[target])
+            files.append(target)
+
+    fix = partial(autofix_file, rules=tuple(rules), root=REPO_ROOT, write=not check)
+    totals = {}
+    changed = []
+    for path, counts in process_files(fix, files, workers=workers):
+        if not counts or not check:
+            # Clean now (or just fixed): skip it until it changes again
+            manifest.record(path, applied[path])
+        if counts:
+            changed.append(path)
+            for rule, count in counts.items():
+                totals[rule] = totals.get(rule, 0) + count
+            detail = ", ".join(f"{rule} x{count}" for rule, count in sorted(counts.items()))
+            shown = path.relative_to(REPO_ROOT) if path.is_relative_to(REPO_ROOT) else path
+            print(f"{'Needs fixes' if check else 'Fixed'}: {shown} ({detail})")
+    manifest.save(prune=full_walk)
+
+    elapsed = time.perf_counter() - started
+    summary = ", ".join(f"{rule} x{totals[rule]}" for rule in rules if rule in totals) or "nothing to fix"
+    print(f"\n{len(files)} files checked ({manifest.unchanged} unchanged, skipped) in {elapsed:.2f}s: "
+          f"{len(changed)} {'need fixes' if check else 'fixed'} ({summary})")
+    if check and changed:
+        print("Run: python scripts/fix-markdown.py")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""
+Shared helpers for the Python markdown maintenance scripts (fix_markdown*.py
+at the repo root, scripts/*-blueprint-*.py).
+
+Scripts in scripts/ import it directly; scripts elsewhere put scripts/ on
+sys.path first.
+"""
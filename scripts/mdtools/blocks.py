@@ -0,0 +1,209 @@
+"""
+Lightweight markdown block model.
+
+Just enough structure for line-oriented lint fixes: one scan splits a
+document into top-level blocks (front matter, fenced code, headings,
+tables, paragraphs, blank runs), keeping every line exactly as written so
+unchanged blocks round-trip byte for byte:
+
+    doc = parse(Path("docs/rules.md").read_text(encoding="utf-8"))
+    for block in doc.blocks:
+        if block.kind == "fence" and not block.info:
+            ...
+    text = doc.render()
+
+Lists, block quotes and HTML are not modelled separately - their lines land
+in "paragraph" blocks, which is what the rules need (a paragraph that is one
+line of emphasis is MD036; a list item never is).
+"""
+
+import re
+
+# Any indent here; parse() only opens a fence up to 3 spaces past its container
+FENCE_RE = re.compile(r"^(\s*)(`{3,}|~{3,})(.*)$")
+LIST_ITEM_RE = re.compile(r"^( *)([-*+]|\d{1,9}[.)])( +|$)")
+HEADING_RE = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+|$)")
+# Delimiter row: | --- | :---: | ---: |
+DELIMITER_RE = re.compile(r"^ {0,3}\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+ROW_SPLIT_RE = re.compile(r"(?<!\\)\|")
+
+
+class Block:
+    """A run of lines with one kind; `lines` exclude line endings"""
+
+    __slots__ = ("kind", "start", "lines", "endings", "info", "level")
+
+    def __init__(self, kind, start, lines, endings, info=None, level=None):
+        self.kind = kind
+        self.start = start          # 0-based line number of the first line
+        self.lines = lines
+        self.endings = endings      # "\n", "\r\n" or "" per line
+        self.info = info            # fence: info string after the opening fence
+        self.level = level          # heading: 1-6
+
+    @property
+    def end(self):
+        return self.start + len(self.lines)
+
+    def render(self):
+        return "".join(line + ending for line, ending in zip(self.lines, self.endings))
+
+    def __repr__(self):
+        return f"Block({self.kind!r}, lines {self.start + 1}-{self.end})"
+
+
+class Document:
+    """Parsed markdown: the blocks, in order, covering every line"""
+
+    def __init__(self, blocks):
+        self.blocks = blocks
+
+    def render(self):
+        return "".join(block.render() for block in self.blocks)
+
+
+def split_row(line):
+    """Cells of a pipe table row (leading/trailing pipes dropped, cells stripped)"""
+    body = line.strip()
+    if body.startswith("|"):
+        body = body[1:]
+    if body.endswith("|") and not body.endswith("\\|"):
+        body = body[:-1]
+    return [cell.strip() for cell in ROW_SPLIT_RE.split(body)]
+
+
+def _split_lines(text):
+    lines, endings = [], []
+    for raw in text.splitlines(keepends=True):
+        line = raw.rstrip("\r\n")
+        lines.append(line)
+        endings.append(raw[len(line):])
+    return lines, endings
+
+
+def _indent(line):
+    expanded = line.expandtabs(4)
+    return len(expanded) - len(expanded.lstrip(" "))
+
+
+class _ListItems:
+    """Content columns of the list items open at the current line
+
+    A fence may sit at most 3 spaces past the start of its container (the
+    document, or a list item's content). Indented further it is an indented
+    code block, and its backticks are literal text.
+    """
+
+    def __init__(self):
+        self.columns = []
+        self.after_blank = False
+
+    def _open(self, indent):
+        # After a blank line, items the line is not indented into have ended
+        return [c for c in self.columns if c <= indent] if self.after_blank else self.columns
+
+    def see(self, line):
+        if not line.strip():
+            self.after_blank = True
+            return
+        indent = _indent(line)
+        self.columns = self._open(indent)
+        item = LIST_ITEM_RE.match(line.expandtabs(4))
+        if item:
+            # A sibling or outer item closes the deeper ones
+            self.columns = [c for c in self.columns if c <= indent]
+            spaces = len(item.group(3))
+            self.columns.append(indent + len(item.group(2)) + (spaces if 1 <= spaces <= 4 else 1))
+        self.after_blank = False
+
+    def allows_fence(self, line):
+        indent = _indent(line)
+        return indent <= 3 or any(c <= indent <= c + 3 for c in self._open(indent))
+
+
+def _is_table_start(lines, i):
+    """A header row followed by a delimiter row with the same cell count"""
+    if i + 1 >= len(lines) or "|" not in lines[i] or not DELIMITER_RE.match(lines[i + 1]):
+        return False
+    return "|" in lines[i + 1] and len(split_row(lines[i])) == len(split_row(lines[i + 1]))
+
+
+def parse(text):
+    """Split markdown into a Document of top-level blocks"""
+    lines, endings = _split_lines(text)
+    blocks = []
+    n = len(lines)
+    i = 0
+
+    lists = _ListItems()
+
+    def add(kind, start, stop, **extra):
+        blocks.append(Block(kind, start, lines[start:stop], endings[start:stop], **extra))
+
+    def opens_fence(line):
+        """FENCE_RE match if `line` opens a fenced code block where it sits, else None"""
+        fence = FENCE_RE.match(line)
+        if fence and lists.allows_fence(line) and not (fence.group(2)[0] == "`" and "`" in fence.group(3)):
+            return fence
+        return None
+
+    # YAML front matter
+    if n and lines[0] == "---":
+        for j in range(1, n):
+            if lines[j] in ("---", "..."):
+                add("frontmatter", 0, j + 1)
+                i = j + 1
+                break
+
+    while i < n:
+        line = lines[i]
+
+        if not line.strip():
+            j = i + 1
+            while j < n and not lines[j].strip():
+                j += 1
+            add("blank", i, j)
+            lists.see(line)
+            i = j
+            continue
+
+        fence = opens_fence(line)
+        lists.see(line)
+        if fence:
+            marker = fence.group(2)
+            j = i + 1
+            while j < n:
+                close = FENCE_RE.match(lines[j])
+                if (close and close.group(2)[0] == marker[0] and len(close.group(2)) >= len(marker)
+                        and not close.group(3).strip()):
+                    break
+                j += 1
+            # An unclosed fence runs to the end of the document
+            add("fence", i, min(j + 1, n), info=fence.group(3).strip())
+            i = j + 1
+            continue
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            add("heading", i, i + 1, level=len(heading.group(1)))
+            i += 1
+            continue
+
+        if _is_table_start(lines, i):
+            j = i + 2
+            while j < n and lines[j].strip() and "|" in lines[j] and not opens_fence(lines[j]):
+                lists.see(lines[j])
+                j += 1
+            add("table", i, j)
+            i = j
+            continue
+
+        j = i + 1
+        while j < n and lines[j].strip() and not opens_fence(lines[j]) and not HEADING_RE.match(lines[j]) \
+                and not _is_table_start(lines, j):
+            lists.see(lines[j])
+            j += 1
+        add("paragraph", i, j)
+        i = j
+
+    return Document(blocks)
@@ -0,0 +1,193 @@
+"""
+Repeated multi-line blocks across and within markdown files.
+
+The BLUEPRINT.md Phase 3 section was once pasted in twice and only noticed by
+reading. This finds such blocks mechanically, in near-linear time:
+
+1. Each file becomes a list of line hashes. Lines are normalized (whitespace
+   collapsed) and lines with no letters or digits ("---", "```", "| --- |")
+   dropped, so formatting noise neither creates nor hides matches.
+2. A rolling hash over every window of SHINGLE_LINES consecutive lines gives
+   one shingle per position, indexed {shingle: [(file, position), ...]}.
+3. Every repeat of a shingle is paired with its first occurrence; pairs on
+   the same diagonal (same two files, same position offset) at consecutive
+   positions merge into one maximal duplicated block.
+
+    files = [hash_file(path) for path in paths]      # or over a process pool
+    for block in find_duplicates(files):
+        print(block.lines, block.chars, block.copies)  # [(path, first, last), ...]
+
+Line hashes are verified after the shingle match, so a rolling-hash
+collision cannot produce a false report.
+
+remove_repeats(text) drops the later copies of blocks repeated within one
+document, whatever headings they sit under (cleanup-blueprint-duplicate.py).
+"""
+
+import hashlib
+import re
+from pathlib import Path
+
+SHINGLE_LINES = 6
+MIN_BLOCK_CHARS = 300
+
+WHITESPACE_RE = re.compile(r"\s+")
+CONTENT_RE = re.compile(r"\w")
+
+# Polynomial rolling hash over 64-bit line hashes, mod a Mersenne prime
+MODULUS = (1 << 61) - 1
+BASE = 1_000_003
+
+
+def _line_hash(line):
+    return int.from_bytes(hashlib.blake2b(line.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def hash_lines(lines):
+    """(line hashes, 1-based line numbers, normalized lengths) of the content lines in `lines`"""
+    hashes, numbers, lengths = [], [], []
+    for number, line in enumerate(lines, 1):
+        normalized = WHITESPACE_RE.sub(" ", line).strip()
+        if not CONTENT_RE.search(normalized):
+            continue
+        hashes.append(_line_hash(normalized))
+        numbers.append(number)
+        lengths.append(len(normalized))
+    return hashes, numbers, lengths
+
+
+def hash_file(path):
+    """(path, line hashes, 1-based line numbers, normalized lengths) of one file's content lines
+
+    Module-level so it can run in mdtools.walk.process_files() pool workers.
+    """
+    text = Path(path).read_bytes().decode("utf-8", errors="replace")
+    return (str(path), *hash_lines(text.splitlines()))
+
+
+def shingles(hashes, size=SHINGLE_LINES):
+    """Rolling hash of every window of `size` consecutive line hashes"""
+    if len(hashes) < size:
+        return []
+    top = pow(BASE, size - 1, MODULUS)
+    value = 0
+    for h in hashes[:size]:
+        value = (value * BASE + h) % MODULUS
+    out = [value]
+    for i in range(size, len(hashes)):
+        value = ((value - hashes[i - size] * top) * BASE + hashes[i]) % MODULUS
+        out.append(value)
+    return out
+
+
+class DuplicateBlock:
+    """A run of content lines that appears in two or more places"""
+
+    __slots__ = ("lines", "chars", "copies")
+
+    def __init__(self, lines, chars, copies):
+        self.lines = lines          # content lines (blank/markup-only lines not counted)
+        self.chars = chars          # normalized characters in one copy
+        self.copies = copies        # [(path, first line, last line)], first occurrence first
+
+    @property
+    def wasted(self):
+        """Characters that consolidating to one copy would remove"""
+        return self.chars * (len(self.copies) - 1)
+
+    @property
+    def within_file(self):
+        return len({path for path, _, _ in self.copies}) < len(self.copies)
+
+    def __repr__(self):
+        return f"DuplicateBlock({self.lines} lines x{len(self.copies)})"
+
+
+def find_duplicates(files, size=SHINGLE_LINES, min_chars=MIN_BLOCK_CHARS):
+    """DuplicateBlocks across `files` (hash_file results), largest waste first"""
+    index = {}
+    for f, (_, hashes, _, _) in enumerate(files):
+        for position, shingle in enumerate(shingles(hashes, size)):
+            index.setdefault(shingle, []).append((f, position))
+
+    # (file a, file b, offset) -> positions in a where a[p:p+size] == b[p+offset:...]
+    diagonals = {}
+    for occurrences in index.values():
+        if len(occurrences) < 2:
+            continue
+        fa, pa = occurrences[0]
+        for fb, pb in occurrences[1:]:
+            if files[fa][1][pa:pa + size] == files[fb][1][pb:pb + size]:
+                diagonals.setdefault((fa, fb, pb - pa), []).append(pa)
+
+    # Maximal runs of consecutive positions on a diagonal are one duplicated block
+    blocks = {}
+    for (fa, fb, offset), positions in diagonals.items():
+        positions.sort()
+        run_start = previous = positions[0]
+        for p in positions[1:] + [None]:
+            if p is not None and p == previous + 1:
+                previous = p
+                continue
+            length = previous - run_start + size
+            # A block overlapping its own copy is a repeated pattern (table rows), not a paste
+            if not (fa == fb and offset < length):
+                key = (fa, run_start, length)
+                blocks.setdefault(key, set()).add((fb, run_start + offset))
+            if p is not None:
+                run_start = previous = p
+
+    found = []
+    claimed = {}        # file -> [(start, end)] already covered by a larger block
+    for (fa, start, length), others in sorted(blocks.items(), key=lambda item: -item[0][2]):
+        # A shorter run inside a block already reported is the same duplication
+        if any(s <= start and start + length <= e for s, e in claimed.get(fa, ())):
+            continue
+        path, _, numbers, lengths = files[fa]
+        chars = sum(lengths[start:start + length])
+        if chars < min_chars:
+            continue
+        copies = [(path, numbers[start], numbers[start + length - 1])]
+        for fb, pb in sorted(others):
+            copies.append((files[fb][0], files[fb][2][pb], files[fb][2][pb + length - 1]))
+            claimed.setdefault(fb, []).append((pb, pb + length))
+        claimed.setdefault(fa, []).append((start, start + length))
+        found.append(DuplicateBlock(length, chars, copies))
+    found.sort(key=lambda block: -block.wasted)
+    return found
+
+
+def remove_repeats(text, size=SHINGLE_LINES, min_chars=MIN_BLOCK_CHARS):
+    """(text without the later copies of its repeated blocks, [DuplicateBlock per removal])
+
+    Each returned block lists the kept first copy, then the copies removed.
+
+    A copy is removed only when its raw lines equal the first copy's (trailing
+    whitespace aside), so a block that differs in markup is left for a human.
+    A copy separated from the previous one by blank lines only takes those
+    blank lines with it; otherwise one of its surrounding blank lines goes.
+    """
+    lines = text.splitlines(keepends=True)
+    drop = set()
+    removed = []
+    for block in find_duplicates([("", *hash_lines(lines))], size, min_chars):
+        (_, first, last), *repeats = block.copies
+        original = [line.rstrip() for line in lines[first - 1:last]]
+        previous_end = last
+        dropped = []
+        for _, start, end in repeats:
+            if any(n in drop for n in range(start, end + 1)) or \
+                    [line.rstrip() for line in lines[start - 1:end]] != original:
+                previous_end = end
+                continue
+            gap = range(previous_end + 1, start)
+            if all(not lines[n - 1].strip() for n in gap):
+                drop.update(gap)
+            elif end < len(lines) and not lines[start - 2].strip() and not lines[end].strip():
+                drop.add(end + 1)
+            drop.update(range(start, end + 1))
+            previous_end = end
+            dropped.append(("", start, end))
+        if dropped:
+            removed.append(DuplicateBlock(block.lines, block.chars, block.copies[:1] + dropped))
+    return "".join(line for n, line in enumerate(lines, 1) if n not in drop), removed
@@ -0,0 +1,66 @@
+"""
+Single-pass multi-pattern replacement.
+
+Applying N (old, new) pairs with N str.replace() calls copies the whole
+document N times. MultiReplacer compiles all the literal patterns into one
+alternation regex (longest pattern first, so a pattern beats its own prefix
+at the same position) and rewrites the text in a single scan:
+
+    replacer = MultiReplacer([("|Token|Hex|", "| Token | Hex |"), ...])
+    text, count = replacer.apply(text)
+
+    fix_file("docs/rules.md", fixes)       # writes only if something changed
+
+Patterns are matched against the original text only: a replacement is never
+re-scanned, and of two overlapping matches the leftmost wins. For the
+independent fixes these scripts apply that is the same result as chained
+str.replace(), in one pass.
+"""
+
+import re
+from pathlib import Path
+
+
+class MultiReplacer:
+    """A fixed set of literal (old, new) replacements, compiled once"""
+
+    def __init__(self, pairs):
+        self.table = {}
+        for old, new in pairs:
+            if old:
+                # First pair wins, as with chained replace() (the later one finds nothing)
+                self.table.setdefault(old, new)
+        patterns = sorted(self.table, key=len, reverse=True)
+        self.regex = re.compile("|".join(map(re.escape, patterns))) if patterns else None
+
+    def apply(self, text):
+        """(new text, number of replacements that changed the text)
+
+        A match whose replacement is identical (a pair that maps text to itself)
+        is not counted, so 0 always means the text is unchanged.
+        """
+        if self.regex is None:
+            return text, 0
+        changed = 0
+
+        def replace(match):
+            nonlocal changed
+            new = self.table[match.group(0)]
+            changed += new != match.group(0)
+            return new
+
+        return self.regex.sub(replace, text), changed
+
+
+def fix_file(path, fixes, encoding="utf-8"):
+    """Apply `fixes` to a file in one pass; rewrite it only if the content changed.
+
+    Returns the number of replacements made (0 means the file was left untouched).
+    """
+    path = Path(path)
+    text = path.read_text(encoding=encoding)
+    fixed, count = MultiReplacer(fixes).apply(text)
+    if fixed == text:
+        return 0
+    path.write_text(fixed, encoding=encoding)
+    return count
@@ -0,0 +1,250 @@
+"""
+Autofix rules for the markdownlint checks our docs PRs keep tripping.
+
+- MD040 fenced-code-language: a bare ``` fence gets a language guessed from
+  its content (json, bash, typescript, html, yaml ...; text when unsure)
+- MD060 table-column-style: table rows get one space of padding around each
+  cell, "| a | b |", and delimiter rows "| --- | :---: |"
+- MD036 no-emphasis-as-heading: a paragraph that is nothing but **bold** or
+  *italic* text (no trailing punctuation) becomes a heading one level below
+  the section it sits in
+
+Each rule looks at one block of the mdtools.blocks model and rewrites its
+lines in place; fix_document() runs every enabled rule over the blocks in a
+single walk:
+
+    doc = parse(text)
+    counts = fix_document(doc)              # {"MD040": 2, "MD060": 5}
+    text = doc.render()
+"""
+
+import json
+import re
+from pathlib import Path
+
+from .blocks import DELIMITER_RE, FENCE_RE, ROW_SPLIT_RE, parse, split_row
+
+# markdownlint's MD036 default: emphasis ending in these is a sentence, not a heading
+MD036_PUNCTUATION = ".,;:!。，；：！"
+EMPHASIS_RE = re.compile(r"^(\*\*|__|\*|_)(?P<text>[^*_\s](?:.*[^*_\s])?)\1\s*$")
+
+SHELL_COMMANDS = ("npm ", "npx ", "pnpm ", "yarn ", "git ", "cd ", "python ", "python3 ", "pip ", "curl ",
+                  "node ", "bash ", "sh ", "mkdir ", "rm ", "cp ", "mv ", "ls", "cat ", "grep ", "echo ",
+                  "export ", "wrangler ", "gh ", "docker ", "sudo ", "chmod ", "find ", "sed ")
+TS_RE = re.compile(r"^\s*(import .+ from |export (default |const |function |interface |type |async )|"
+                   r"(const|let|var) \w+(: [\w<>\[\]| ]+)? = |interface \w+|type \w+ = |function \w+\s*\(|"
+                   r"async function |await )")
+TS_TYPES_RE = re.compile(r"(: (string|number|boolean|any|unknown|void)\b|\binterface \w+|\btype \w+ = |<\w+>\()")
+ASTRO_RE = re.compile(r"^---\s*$")
+HTML_RE = re.compile(r"^\s*<(!DOCTYPE|html|head|body|div|section|a|img|script|link|meta|span|p|ul|li|nav|"
+                     r"header|footer|main|article|button|form|input|picture|source|template|svg)\b", re.I)
+YAML_RE = re.compile(r"^\s*(- )?[a-z_][\w-]*:( |$)")
+CSS_RE = re.compile(r"^\s*([.#@:]?[\w\-\[\]=\"':(), >*+~.#]+)\s*\{\s*$")
+SQL_RE = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP|WITH)\b", re.I)
+PYTHON_RE = re.compile(r"^\s*(def \w+\(|class \w+[(:]|from [\w.]+ import |import \w+$|if __name__)")
+ENV_RE = re.compile(r"^[A-Z][A-Z0-9_]*=")
+
+
+def guess_language(lines):
+    """Best-guess fence language for a code block's lines; "text" when unsure"""
+    code = [line for line in lines if line.strip()]
+    if not code:
+        return "text"
+    body = "\n".join(lines).strip()
+    first = code[0].strip()
+
+    if first[0] in "{[":
+        try:
+            json.loads(body)
+            return "json"
+        except ValueError:
+            pass
+    if ASTRO_RE.match(first) and any(HTML_RE.match(line) for line in code):
+        return "astro"
+    if first.startswith("$ ") or (first.startswith("#!") and "sh" in first):
+        return "bash"
+    if any(PYTHON_RE.match(line) for line in code):
+        return "python"
+    if any(TS_RE.match(line) for line in code):
+        return "typescript" if any(TS_TYPES_RE.search(line) for line in code) else "javascript"
+    if HTML_RE.match(first):
+        return "html"
+    if SQL_RE.match(first):
+        return "sql"
+    if CSS_RE.match(first):
+        return "css"
+    commands = [line.strip() for line in code if not line.lstrip().startswith("#")]
+    if commands and all(line.startswith(SHELL_COMMANDS) or line.startswith("./") for line in commands):
+        return "bash"
+    if all(ENV_RE.match(line) or line.lstrip().startswith("#") for line in code):
+        return "bash"
+    if all(YAML_RE.match(line) or line.startswith((" ", "\t", "#")) for line in code) and YAML_RE.match(first):
+        return "yaml"
+    return "text"
+
+
+def fix_md040(block, state):
+    """Bare opening fence -> fence with a guessed language"""
+    if block.info:
+        return 0
+    fence = FENCE_RE.match(block.lines[0])
+    closed = len(block.lines) > 1 and FENCE_RE.match(block.lines[-1]) is not None
+    content = block.lines[1:-1] if closed else block.lines[1:]
+    block.lines[0] = f"{fence.group(1)}{fence.group(2)}{guess_language(content)}"
+    block.info = block.lines[0][len(fence.group(1)) + len(fence.group(2)):]
+    return 1
+
+
+def format_row(line, delimiter=False):
+    """A table row with single-space cell padding, keeping its indent and outer pipes"""
+    indent = line[:len(line) - len(line.lstrip())]
+    cells = split_row(line)
+    if delimiter:
+        # Keep the alignment colons; three dashes is the shortest valid cell
+        cells = [cell.replace(" ", "") if len(cell.replace(" ", "").strip(":")) >= 3 else
+                 f"{':' if cell.startswith(':') else ''}---{':' if cell.endswith(':') else ''}" for cell in cells]
+    return indent + "|" + "|".join(f" {cell} " if cell else " " for cell in cells) + "|"
+
+
+def _pipe_columns(line):
+    return [m.start() for m in ROW_SPLIT_RE.finditer(line)]
+
+
+def is_aligned(lines):
+    """Every row's pipes line up (the "aligned" MD060 style, also valid)"""
+    columns = _pipe_columns(lines[0])
+    return all(_pipe_columns(line) == columns for line in lines[1:])
+
+
+def fix_md060(block, state):
+    """Normalize pipe spacing in every row of a table (aligned tables are left alone)"""
+    if is_aligned(block.lines):
+        return 0
+    # Rows without outer pipes are a different (valid) style; a table with any is
+    # left alone entirely, so it never ends up half in one style and half in another
+    for line in block.lines:
+        stripped = line.strip()
+        if not (stripped.startswith("|") and stripped.endswith("|") and not stripped.endswith("\\|")):
+            return 0
+    fixed = 0
+    for i, line in enumerate(block.lines):
+        new = format_row(line, delimiter=(i == 1 and DELIMITER_RE.match(line) is not None))
+        if new != line:
+            block.lines[i] = new
+            fixed += 1
+    return fixed
+
+
+def fix_md036(block, state):
+    """Single-line, all-emphasis paragraph -> heading under the current section"""
+    # Only a paragraph standing alone between blank lines can become a heading (MD022)
+    if len(block.lines) != 1 or not state["isolated"]:
+        return 0
+    match = EMPHASIS_RE.match(block.lines[0])
+    if not match:
+        return 0
+    text = match.group("text").strip()
+    if text[-1] in MD036_PUNCTUATION or "**" in text or "__" in text:
+        return 0
+    level = min(state["heading_level"] + 1, 6) if state["heading_level"] else 2
+    block.lines[0] = f"{'#' * level} {text}"
+    # The section level stays that of the last real heading, so siblings convert to siblings
+    block.kind, block.level = "heading", level
+    return 1
+
+
+# Bump when a fixer changes behaviour, so incremental runs recheck every file
+RULES_VERSION = 2
+
+# rule id -> (block kind it applies to, fixer)
+RULES = {
+    "MD040": ("fence", fix_md040),
+    "MD060": ("table", fix_md060),
+    "MD036": ("paragraph", fix_md036),
+}
+
+
+def fix_document(doc, rules=RULES):
+    """Apply `rules` (ids) to every block in one walk; returns {rule: fixes}"""
+    by_kind = {}
+    for rule in rules:
+        kind, fixer = RULES[rule]
+        by_kind.setdefault(kind, []).append((rule, fixer))
+
+    counts = {}
+    state = {"heading_level": 0, "isolated": False}
+    blocks = doc.blocks
+    for i, block in enumerate(blocks):
+        if block.kind == "heading":
+            state["heading_level"] = block.level
+        state["isolated"] = ((i == 0 or blocks[i - 1].kind == "blank")
+                             and (i == len(blocks) - 1 or blocks[i + 1].kind == "blank"))
+        for rule, fixer in by_kind.get(block.kind, ()):
+            fixed = fixer(block, state)
+            if fixed:
+                counts[rule] = counts.get(rule, 0) + fixed
+    return counts
+
+
+CONFIG_NAMES = (".markdownlint.json", ".markdownlint.jsonc")
+_config_cache = {}
+
+
+def _directory_config(directory):
+    if directory not in _config_cache:
+        config = None
+        for name in CONFIG_NAMES:
+            path = directory / name
+            if path.is_file():
+                text = path.read_text(encoding="utf-8")
+                # .jsonc: drop whole-line // comments
+                text = "\n".join(line for line in text.splitlines() if not line.lstrip().startswith("//"))
+                try:
+                    config = json.loads(text)
+                except ValueError:
+                    config = None
+                break
+        _config_cache[directory] = config
+    return _config_cache[directory]
+
+
+def enabled_rules(path, root, rules=RULES):
+    """The subset of `rules` markdownlint config files from `root` down to `path` leave enabled"""
+    enabled = set(rules)
+    directories = [path.parent]
+    while directories[-1] != root and directories[-1] != directories[-1].parent:
+        directories.append(directories[-1].parent)
+    # Outermost first, so nearer configs override
+    for directory in reversed(directories):
+        config = _directory_config(directory)
+        if not config:
+            continue
+        if "default" in config:
+            enabled = set(rules) if config["default"] else set()
+        for rule in rules:
+            if rule in config:
+                if config[rule] is False:
+                    enabled.discard(rule)
+                else:
+                    enabled.add(rule)
+    return [rule for rule in rules if rule in enabled]
+
+
+def autofix_file(path, rules=tuple(RULES), root=None, write=True):
+    """{rule: fixes} for one markdown file, rewriting it if `write` and anything changed
+
+    Module-level so it can run in mdtools.walk.process_files() pool workers.
+    """
+    path = Path(path).resolve()
+    rules = enabled_rules(path, Path(root).resolve() if root else path.parent, rules)
+    if not rules:
+        return {}
+    try:
+        text = path.read_bytes().decode("utf-8")
+    except UnicodeDecodeError:
+        return {}
+    doc = parse(text)
+    counts = fix_document(doc, rules)
+    if counts and write:
+        path.write_bytes(doc.render().encode("utf-8"))
+    return counts
@@ -0,0 +1,223 @@
+"""
+Section-aware editing of large markdown documents (docs/BLUEPRINT.md).
+
+The document is parsed once (via mdtools.blocks, so a "# comment" inside a
+code fence is not a heading) into a tree of sections. A section runs from
+its heading line to the next heading of the same or a higher level, and
+knows its byte offsets in the file:
+
+    tree = SectionTree.load(DOCS_DIR / "BLUEPRINT.md")
+    phase3 = tree.find_title("PHASE 3: MOUNTAIN STATE", prefix=True)
+    phase3 = tree.find("WV Wild Outdoors LLC – Complete Digital Footprint Blueprint",
+                       "SECTION 1", "PHASE 3", prefix=True)       # same, by path
+    tree.replace(phase3, NEW_PHASE_3)        # heading line included
+    tree.insert_after(phase3, PHASE_4_INTRO)
+    tree.dedupe()                            # drop repeated identical sections
+    tree.write()                             # one pass, one write
+
+Lookups by full heading path or exact title are a dict hit; prefix lookups
+walk one level of children per path element (find) or the section list
+(find_title); section_at(offset) bisects the sorted section starts. Edits
+are queued against the offsets of the parsed text and applied together by
+render()/write(), so they never shift each other - build a new tree to edit
+the result again.
+"""
+
+from bisect import bisect_right
+from pathlib import Path
+
+from .blocks import HEADING_RE, parse
+
+
+class Section:
+    """One heading and everything under it, as byte offsets into the document"""
+
+    __slots__ = ("level", "title", "path", "line", "start", "body_start", "end", "parent", "children")
+
+    def __init__(self, level, title, path, line, start, body_start, parent):
+        self.level = level
+        self.title = title
+        self.path = path            # titles from the outermost heading down to this one
+        self.line = line            # 1-based line of the heading
+        self.start = start          # offset of the heading line
+        self.body_start = body_start
+        self.end = None             # offset of the next same-or-higher heading (or EOF)
+        self.parent = parent
+        self.children = []
+
+    def contains(self, other):
+        return self.start <= other.start and other.end <= self.end and other is not self
+
+    def __repr__(self):
+        return f"Section({'#' * self.level} {self.title!r}, line {self.line})"
+
+
+def heading_title(line):
+    """'### PHASE 3: ... ###' -> 'PHASE 3: ...'"""
+    match = HEADING_RE.match(line)
+    title = line[match.end():].strip()
+    stripped = title.rstrip("#")
+    if stripped != title and (not stripped or stripped.endswith((" ", "\t"))):
+        title = stripped.strip()
+    return title
+
+
+def _normalized(data):
+    """Section bytes compared for dedupe: trailing whitespace and blank edge lines ignored"""
+    lines = [line.rstrip() for line in data.decode("utf-8").splitlines()]
+    while lines and not lines[-1]:
+        lines.pop()
+    return "\n".join(lines)
+
+
+def _as_bytes(text):
+    data = text.encode("utf-8") if isinstance(text, str) else text
+    return data if not data or data.endswith(b"\n") else data + b"\n"
+
+
+class SectionTree:
+    """Heading hierarchy of one markdown document, with batched edits"""
+
+    def __init__(self, text, path=None):
+        self.path = Path(path) if path else None
+        self.data = text.encode("utf-8") if isinstance(text, str) else text
+        self.root = Section(0, "", (), 0, 0, 0, None)
+        self.root.end = len(self.data)
+        self.sections = []          # document order, so starts are sorted
+        self._by_path = {}
+        self._by_title = {}
+        self._edits = []
+
+        offset = 0
+        stack = [self.root]
+        for block in parse(self.data.decode("utf-8")).blocks:
+            if block.kind == "heading":
+                # Close every open section at this level or deeper
+                while stack[-1].level >= block.level:
+                    stack.pop().end = offset
+                parent = stack[-1]
+                title = heading_title(block.lines[0])
+                heading_bytes = len((block.lines[0] + block.endings[0]).encode("utf-8"))
+                section = Section(block.level, title, parent.path + (title,), block.start + 1,
+                                  offset, offset + heading_bytes, parent)
+                parent.children.append(section)
+                self.sections.append(section)
+                self._by_path.setdefault(section.path, []).append(section)
+                self._by_title.setdefault(title, section)
+                stack.append(section)
+            offset += len(block.render().encode("utf-8"))
+        for section in stack[1:]:
+            section.end = len(self.data)
+        self._starts = [section.start for section in self.sections]
+
+    @classmethod
+    def load(cls, path):
+        path = Path(path)
+        return cls(path.read_bytes(), path)
+
+    # --- lookup ---
+
+    def find(self, *titles, prefix=False):
+        """Section at heading path `titles` (first of any duplicates), or None
+
+        With prefix=True each element only has to start the title, e.g. "PHASE 3".
+        """
+        if not prefix:
+            found = self._by_path.get(tuple(titles))
+            return found[0] if found else None
+        node = self.root
+        for title in titles:
+            node = next((child for child in node.children if child.title.startswith(title)), None)
+            if node is None:
+                return None
+        return node
+
+    def find_title(self, title, prefix=False):
+        """First section anywhere in the document with this title (or title prefix), or None"""
+        if not prefix:
+            return self._by_title.get(title)
+        return next((section for section in self.sections if section.title.startswith(title)), None)
+
+    def find_all(self, *titles):
+        """Every section at heading path `titles` - more than one means duplicates"""
+        return list(self._by_path.get(tuple(titles), ()))
+
+    def section_at(self, offset):
+        """Innermost section containing byte `offset` (None before the first heading)"""
+        i = bisect_right(self._starts, offset) - 1
+        section = self.sections[i] if i >= 0 else None
+        while section is not None and section is not self.root and offset >= section.end:
+            section = section.parent
+        return section if section is not self.root else None
+
+    def text(self, section, body_only=False):
+        start = section.body_start if body_only else section.start
+        return self.data[start:section.end].decode("utf-8")
+
+    # --- edits (applied by render/write) ---
+
+    def _edit(self, start, end, data):
+        self._edits.append((start, end, len(self._edits), data))
+
+    def replace(self, section, text):
+        """Replace the whole section (heading line included) with `text`"""
+        self._edit(section.start, section.end, _as_bytes(text))
+
+    def replace_body(self, section, text):
+        """Replace everything under the heading line, subsections included"""
+        self._edit(section.body_start, section.end, _as_bytes(text))
+
+    def insert_before(self, section, text):
+        self._edit(section.start, section.start, _as_bytes(text))
+
+    def insert_after(self, section, text):
+        """Insert `text` where `section` ends, after its last subsection"""
+        self._edit(section.end, section.end, _as_bytes(text))
+
+    def delete(self, section):
+        self._edit(section.start, section.end, b"")
+
+    def duplicates(self):
+        """[(kept, [repeats...])] for every heading path that occurs more than once"""
+        return [(found[0], found[1:]) for found in self._by_path.values() if len(found) > 1]
+
+    def dedupe(self):
+        """Delete repeats of a section whose content is identical to its first occurrence
+
+        Returns the deleted sections. Same heading with different content is left
+        for a human (see duplicates()).
+        """
+        deleted = []
+        for kept, repeats in self.duplicates():
+            original = _normalized(self.data[kept.start:kept.end])
+            for section in repeats:
+                if any(d.contains(section) for d in deleted):
+                    continue    # inside a section already being deleted
+                if _normalized(self.data[section.start:section.end]) == original:
+                    self.delete(section)
+                    deleted.append(section)
+        return deleted
+
+    def render(self):
+        """The document with every queued edit applied, in one pass"""
+        if not self._edits:
+            return self.data
+        out = []
+        position = 0
+        for start, end, _, data in sorted(self._edits):
+            if start < position:
+                raise ValueError(f"Overlapping edits at byte {start} (previous edit ends at {position})")
+            out.append(self.data[position:start])
+            out.append(data)
+            position = end
+        out.append(self.data[position:])
+        return b"".join(out)
+
+    def write(self, path=None):
+        """Write the edited document once; False (nothing written) if it is unchanged"""
+        path = Path(path) if path else self.path
+        data = self.render()
+        if data == self.data and path == self.path:
+            return False
+        path.write_bytes(data)
+        return True
@@ -0,0 +1,164 @@
+"""
+Incremental, parallel walks over the docs tree.
+
+Every repo-wide markdown tool used to re-read all of docs/ on every run. A
+Manifest remembers each file's (mtime, size, content hash) from the last run
+of a tool, so a run only hands the files that changed since to the tool - and
+process_files() spreads those over a process pool once there are enough:
+
+    manifest = Manifest("fix-markdown", DOCS_DIR, version=RULES_VERSION)
+    paths = changed_files(DOCS_DIR, manifest)          # usually a handful
+    for path, result in process_files(fix_one, paths):
+        if result_is_clean(result):
+            manifest.record(path)                      # skipped next run
+    manifest.save(prune=True)
+
+A tool can also key each file on what it applies to it (`extra`, e.g. the
+rules its .markdownlint.json leaves enabled); a different key counts as a
+change, so editing a directory's config rechecks exactly the files it affects.
+
+mtime and size are checked first; only when they differ is the file read and
+hashed, so a fresh checkout (new mtimes, same content) costs one hash per
+file and no tool work. A tool records only the files it is done with - one
+that still has problems is handed back next run. Manifests live in
+scripts/.cache/ (gitignored); delete it, pass --no-cache, or bump the tool's
+version to force a full run.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache"
+DOCS_DIR = Path(__file__).resolve().parents[2] / "docs"
+
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".cache"}
+
+# Below this many files a pool costs more to start than it saves
+PARALLEL_MIN_FILES = 32
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def iter_markdown(root, suffixes=(".md",), skip_dirs=SKIP_DIRS):
+    """(path, stat) of every markdown file under `root`, in sorted order"""
+    stack = [Path(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in skip_dirs:
+                    subdirs.append(Path(entry.path))
+            elif entry.name.lower().endswith(suffixes):
+                yield Path(entry.path), entry.stat()
+        stack.extend(reversed(subdirs))
+
+
+class Manifest:
+    """JSON file of {relative path: [mtime_ns, size, sha256, extra]} for one tool"""
+
+    def __init__(self, namespace, root, version="", cache_dir=CACHE_DIR, enabled=True):
+        self.path = Path(cache_dir) / f"{namespace}.json"
+        self.root = Path(root).resolve()
+        self.version = str(version)
+        self.enabled = enabled
+        self.unchanged = 0
+        self._entries = {}
+        self._seen = {}
+        if enabled and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") == self.version:
+                    self._entries = data.get("files", {})
+            except (OSError, json.JSONDecodeError, AttributeError):
+                self._entries = {}
+
+    def _key(self, path):
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def changed(self, path, stat=None, extra=""):
+        """True if `path` (or its `extra` key) differs from what was recorded, or was never recorded"""
+        stat = stat or os.stat(path)
+        key = self._key(path)
+        entry = self._entries.get(key) if self.enabled else None
+        self._seen[key] = (stat.st_mtime_ns, stat.st_size, None)
+        if not entry or len(entry) < 4 or entry[3] != extra:
+            return True
+        mtime, size, digest, _ = entry
+        if (mtime, size) == (stat.st_mtime_ns, stat.st_size):
+            self.unchanged += 1
+            return False
+        if size == stat.st_size:
+            current = file_digest(path)
+            self._seen[key] = (stat.st_mtime_ns, stat.st_size, current)
+            if current == digest:
+                # Touched, not edited: remember the new mtime so the next run skips the hash
+                self._entries[key] = [stat.st_mtime_ns, stat.st_size, digest, extra]
+                self.unchanged += 1
+                return False
+        return True
+
+    def record(self, path, extra=""):
+        """Mark `path` as done in its current state (call after the tool wrote it, if it did)"""
+        stat = os.stat(path)
+        key = self._key(path)
+        mtime, size, digest = self._seen.get(key, (None, None, None))
+        if digest is None or (mtime, size) != (stat.st_mtime_ns, stat.st_size):
+            digest = file_digest(path)
+        self._seen[key] = (stat.st_mtime_ns, stat.st_size, digest)
+        self._entries[key] = [stat.st_mtime_ns, stat.st_size, digest, extra]
+
+    def forget(self, path):
+        """Drop `path` so the next run hands it to the tool again"""
+        self._entries.pop(self._key(path), None)
+
+    def save(self, prune=False):
+        """Write the manifest; `prune` drops files not seen this run (after a full walk)"""
+        if not self.enabled:
+            return
+        entries = self._entries
+        if prune:
+            entries = {key: entry for key, entry in entries.items() if key in self._seen}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": self.version, "files": dict(sorted(entries.items()))}, indent=1),
+                       encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def changed_files(root, manifest, suffixes=(".md",)):
+    """Markdown files under `root` that changed since `manifest` last recorded them"""
+    return [path for path, stat in iter_markdown(root, suffixes) if manifest.changed(path, stat)]
+
+
+def process_files(func, paths, workers=None, min_parallel=PARALLEL_MIN_FILES):
+    """Yield (path, func(path)) in order; over a process pool when there are enough paths
+
+    `func` must be a module-level function, or a functools.partial of one (it is
+    pickled to the workers).
+    """
+    paths = list(paths)
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(paths) >= min_parallel:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from zip(paths, pool.map(func, paths, chunksize=max(1, len(paths) // (workers * 4))))
+    else:
+        for path in paths:
+            yield path, func(path)
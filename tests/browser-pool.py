@@ -0,0 +1,66 @@
+"""
+Shared Browser Pool
+===================
+One long-lived headless Chromium that every validator connects to over CDP
+(see wvwo_validation.browser_pool), so running the whole suite pays a single
+browser launch:
+
+    python tests/browser-pool.py start     # launch (no-op if already healthy)
+    python tests/browser-pool.py status    # health check via /json/version
+    python tests/browser-pool.py recycle   # dispose contexts crashed scripts left
+    python tests/browser-pool.py stop
+
+Validators fall back to launching their own browser when the pool is not
+running; pass --no-pool to any of them to force that.
+"""
+
+import sys
+from playwright.sync_api import sync_playwright
+
+from wvwo_validation.browser_pool import POOL_URL, health, owns_pool, pool_state, recycle_contexts, start_pool, stop_pool
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else "status"
+
+    if command == "start":
+        with sync_playwright() as p:
+            info = start_pool(p.chromium.executable_path)
+        print(f"[OK] {info.get('Browser')} serving CDP at {POOL_URL}")
+        return 0
+
+    if command == "stop":
+        if stop_pool():
+            print("[OK] Browser pool stopped")
+        else:
+            print("[!] No browser pool started from this checkout is running")
+        return 0
+
+    if command == "recycle":
+        if not health():
+            print(f"[X] No browser pool at {POOL_URL}")
+            return 1
+        if not owns_pool():
+            print(f"[X] The browser at {POOL_URL} was not started by this checkout - not recycling its contexts")
+            return 1
+        with sync_playwright() as p:
+            browser = p.chromium.connect_over_cdp(POOL_URL)
+            recycled = recycle_contexts(browser)
+            browser.close()
+        print(f"[OK] Recycled {recycled} abandoned contexts")
+        return 0
+
+    if command == "status":
+        info = health()
+        if not info:
+            print(f"[X] No browser pool at {POOL_URL} (start: python tests/browser-pool.py start)")
+            return 1
+        state = pool_state()
+        pid = f", pid {state['pid']}" if state else ""
+        print(f"[OK] {info.get('Browser')} at {POOL_URL}{pid}")
+        return 0
+
+    print(f"Unknown command {command!r} (expected start, status, recycle or stop)")
+    return 2
+
+if __name__ == "__main__":
+    sys.exit(main())
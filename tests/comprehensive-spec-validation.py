@@ -5,6 +5,12 @@ SPEC-12 & SPEC-13 Comprehensive Testing
 Advanced Swarm Validation Session
 
 Tests all components, pages, and WVWO compliance on live Cloudflare preview.
+Each URL is loaded once and shared by every suite (see wvwo_validation.snapshot).
+
+Validate the built site from disk instead (cd wv-wild-web && npm run build):
+    python tests/comprehensive-spec-validation.py --dist [path/to/dist]
+
+Add --trace for a per-suite timing breakdown and a Chrome trace JSON.
 """
 
 from playwright.sync_api import sync_playwright
@@ -12,37 +18,61 @@ import json
 import sys
 import io
 
+from wvwo_validation import SnapshotCache
+from wvwo_validation.browser_pool import launch_browser
+from wvwo_validation.screenshots import ScreenshotStore
+from wvwo_validation.static_site import StaticServer, dist_dir_from_argv
+from wvwo_validation.readiness import wait_until_ready
+from wvwo_validation.results import ResultSet
+from wvwo_validation.tracing import TRACER
+
 # Fix Windows console encoding
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
 BASE_URL = "https://spec-13-lake-template.wvwildoutdoors.pages.dev"
+if "--dist" in sys.argv:
+    DIST_SERVER = StaticServer(dist_dir_from_argv()).start()
+    BASE_URL = DIST_SERVER.url
+LAKE_URL = f"{BASE_URL}/near/summersville-lake"
+
+STATUS_ICONS = {"PASS": "✅", "FAIL": "❌", "WARN": "⚠️"}
 
 class ComprehensiveValidator:
     def __init__(self, browser):
         self.browser = browser
-        self.results = {
+        self.snapshots = SnapshotCache(browser)
+        self.screenshots = ScreenshotStore()
+        # Per-check results (JSON/JUnit/history); metrics feed the report
+        self.results = ResultSet("comprehensive-spec")
+        self.metrics = {
             "spec13": {},
             "spec12": {},
             "spec11": {},
             "wvwo_compliance": {},
             "responsive": {},
-            "accessibility": {},
-            "overall_pass": True
+            "accessibility": {}
         }
 
+    def check(self, check_id, ok, message, fail_message=None, level="WARN"):
+        """Print and record one check on LAKE_URL; a failure is recorded at `level`"""
+        status = "PASS" if ok else level
+        message = message if ok else (fail_message or message)
+        self.results.record(check_id, status, message, page=LAKE_URL)
+        print(f"  {STATUS_ICONS[status]} {message}")
+        return bool(ok)
+
     def test_spec13_lake_template(self):
         """Test SPEC-13 Lake Template on Summersville Lake page"""
         print("\n" + "="*60)
         print("SPEC-13: LAKE TEMPLATE VALIDATION")
         print("="*60 + "\n")
+        self.results.suite("spec13")
 
-        page = self.browser.new_page()
-        page.goto(f"{BASE_URL}/near/summersville-lake")
-        page.wait_for_load_state('networkidle')
+        page = self.snapshots.get(LAKE_URL).page
 
         # Take full-page screenshot
-        page.screenshot(path='tests/screenshots/spec13-summersville-full.png', full_page=True)
-        print("Screenshot: spec13-summersville-full.png")
+        shot = self.screenshots.capture(page, 'spec13-summersville-full', full_page=True)
+        print(f"Screenshot: spec13-summersville-full.png ({shot['status']})")
 
         tests_passed = 0
         tests_total = 0
@@ -53,24 +83,15 @@ class ComprehensiveValidator:
         tests_total += 3
 
         hero_h1 = page.locator('h1').first
-        if hero_h1.is_visible() and "Summersville" in hero_h1.text_content():
-            print("  ✅ Lake name in h1")
-            tests_passed += 1
-        else:
-            print("  ❌ Lake name missing")
-            self.results["overall_pass"] = False
+        tests_passed += self.check("US3-lake-name", hero_h1.is_visible() and "Summersville" in hero_h1.text_content(),
+                                   "Lake name in h1", "Lake name missing", level="FAIL")
 
         stats = page.locator('text=/Acres|Depth|County/i').count()
-        if stats >= 2:
-            print(f"  ✅ Stats displayed ({stats} labels)")
-            tests_passed += 1
-        else:
-            print(f"  ❌ Stats missing (found {stats})")
+        tests_passed += self.check("US3-stats", stats >= 2,
+                                   f"Stats displayed ({stats} labels)", f"Stats missing (found {stats})")
 
         badges = page.locator('[class*="sign-green"]').count()
-        if badges > 0:
-            print(f"  ✅ Highlight badges ({badges})")
-            tests_passed += 1
+        tests_passed += self.check("US3-badges", badges > 0, f"Highlight badges ({badges})")
 
         # US1: Fishing Display
         print("\nUS1: Fishing Information Display")
@@ -78,27 +99,18 @@ class ComprehensiveValidator:
         tests_total += 4
 
         what_to_fish = page.locator('h2:has-text("What to Fish")').count()
-        if what_to_fish > 0:
-            print("  ✅ What to Fish section")
-            tests_passed += 1
+        tests_passed += self.check("US1-what-to-fish", what_to_fish > 0, "What to Fish section")
 
         where_to_fish = page.locator('h2:has-text("Where to Fish")').count()
-        if where_to_fish > 0:
-            print("  ✅ Where to Fish section")
-            tests_passed += 1
+        tests_passed += self.check("US1-where-to-fish", where_to_fish > 0, "Where to Fish section")
 
         fish_h3 = page.locator('h3').all()
         fish_count = sum(1 for h3 in fish_h3 if any(fish in h3.text_content() for fish in ['Bass', 'Walleye', 'Muskie', 'Crappie']))
-        if fish_count >= 3:
-            print(f"  ✅ Fish species ({fish_count} found)")
-            tests_passed += 1
-        else:
-            print(f"  ❌ Fish species ({fish_count} found, expected 3+)")
+        tests_passed += self.check("US1-species", fish_count >= 3, f"Fish species ({fish_count} found)",
+                                   f"Fish species ({fish_count} found, expected 3+)")
 
         kim_tips = page.locator('.font-hand, [class*="font-hand"]').count()
-        if kim_tips > 0:
-            print(f"  ✅ Kim's tips ({kim_tips} instances)")
-            tests_passed += 1
+        tests_passed += self.check("US1-kims-tips", kim_tips > 0, f"Kim's tips ({kim_tips} instances)")
 
         # US2: Marina & Camping
         print("\nUS2: Marina & Camping Facilities")
@@ -106,19 +118,13 @@ class ComprehensiveValidator:
         tests_total += 3
 
         camping = page.locator('h2:has-text("Camping")').count()
-        if camping > 0:
-            print("  ✅ Camping section")
-            tests_passed += 1
+        tests_passed += self.check("US2-camping", camping > 0, "Camping section")
 
         marina = page.locator('h2:has-text("Marina"), h2:has-text("Boat")').count()
-        if marina > 0:
-            print("  ✅ Marina section")
-            tests_passed += 1
+        tests_passed += self.check("US2-marina", marina > 0, "Marina section")
 
         tel_links = page.locator('a[href^="tel:"]').count()
-        if tel_links > 0:
-            print(f"  ✅ Phone links ({tel_links})")
-            tests_passed += 1
+        tests_passed += self.check("US2-phone", tel_links > 0, f"Phone links ({tel_links})")
 
         # US5: Safety & Regulations
         print("\nUS5: Safety & Regulations")
@@ -126,14 +132,10 @@ class ComprehensiveValidator:
         tests_total += 2
 
         regulations = page.locator('h2:has-text("Safety"), h2:has-text("Regulations")').count()
-        if regulations > 0:
-            print("  ✅ Regulations section")
-            tests_passed += 1
+        tests_passed += self.check("US5-regulations", regulations > 0, "Regulations section")
 
         orange_accents = page.locator('[class*="border-l-brand-orange"]').count()
-        if orange_accents > 0:
-            print(f"  ✅ Orange warning accents ({orange_accents})")
-            tests_passed += 1
+        tests_passed += self.check("US5-orange-accents", orange_accents > 0, f"Orange warning accents ({orange_accents})")
 
         # US4: Activities & Seasonal
         print("\nUS4: Activities & Seasonal Guide")
@@ -141,30 +143,24 @@ class ComprehensiveValidator:
         tests_total += 2
 
         activities = page.locator('text=/Swimming|Diving|Kayak/i').count()
-        if activities > 0:
-            print(f"  ✅ Activities ({activities} found)")
-            tests_passed += 1
+        tests_passed += self.check("US4-activities", activities > 0, f"Activities ({activities} found)")
 
         seasonal = page.locator('text=/Spring|Summer|Fall|Winter/i').count()
-        if seasonal >= 2:
-            print(f"  ✅ Seasonal content ({seasonal} references)")
-            tests_passed += 1
+        tests_passed += self.check("US4-seasonal", seasonal >= 2, f"Seasonal content ({seasonal} references)")
 
         spec13_score = (tests_passed / tests_total * 100) if tests_total > 0 else 0
         print(f"\nSPEC-13 Score: {tests_passed}/{tests_total} ({spec13_score:.1f}%)")
-        self.results["spec13"] = {"pass": tests_passed, "total": tests_total, "score": spec13_score}
-
-        page.close()
+        self.metrics["spec13"] = {"pass": tests_passed, "total": tests_total, "score": spec13_score}
 
     def test_wvwo_compliance(self):
         """Test WVWO compliance across entire site"""
         print("\n" + "="*60)
         print("WVWO COMPLIANCE VALIDATION (SITE-WIDE)")
         print("="*60 + "\n")
+        self.results.suite("wvwo-compliance")
 
-        page = self.browser.new_page()
-        page.goto(f"{BASE_URL}/near/summersville-lake")
-        page.wait_for_load_state('networkidle')
+        # Every WVWO rule evaluated in one DOM pass (see wvwo_validation.rules)
+        report = self.snapshots.get(LAKE_URL).rules()
 
         violations = []
 
@@ -172,136 +168,88 @@ class ComprehensiveValidator:
         print("Border Radius Compliance")
         print("-" * 40)
 
-        forbidden_rounded = page.locator('[class*="rounded-md"], [class*="rounded-lg"], [class*="rounded-xl"]').count()
-        if forbidden_rounded == 0:
-            print("  ✅ ZERO forbidden rounded classes")
-        else:
-            print(f"  ❌ {forbidden_rounded} forbidden rounded classes found")
+        forbidden_rounded = report.count("rounded-class")
+        if not self.check("WVWO-rounded-class", forbidden_rounded == 0, "ZERO forbidden rounded classes",
+                          f"{forbidden_rounded} forbidden rounded classes found: {report['rounded-class']['matched']}",
+                          level="FAIL"):
             violations.append(f"rounded violations: {forbidden_rounded}")
-            self.results["overall_pass"] = False
 
-        rounded_sm = page.locator('[class*="rounded-sm"]').count()
+        rounded_sm = report.count("rounded-sm")
         print(f"  ✅ rounded-sm usage: {rounded_sm} elements")
 
         # Font Compliance
         print("\nFont Compliance")
         print("-" * 40)
 
-        font_display = page.locator('.font-display, [class*="font-display"]').count()
-        print(f"  ✅ font-display (Bitter): {font_display} usages")
-
-        font_hand = page.locator('.font-hand, [class*="font-hand"]').count()
-        print(f"  ✅ font-hand (Permanent Marker): {font_hand} usages (Kim's tips)")
-
-        font_body = page.locator('.font-body, [class*="font-body"]').count()
-        print(f"  ✅ font-body (Noto Sans): {font_body} usages")
+        print(f"  ✅ font-display (Bitter): {report.count('font-display')} usages")
+        print(f"  ✅ font-hand (Permanent Marker): {report.count('font-hand')} usages (Kim's tips)")
+        print(f"  ✅ font-body (Noto Sans): {report.count('font-body')} usages")
 
         # Check for forbidden fonts in computed styles
-        forbidden_fonts = page.evaluate('''() => {
-            const elements = Array.from(document.querySelectorAll('*'));
-            const forbidden = ['Inter', 'Poppins', 'DM Sans', 'system-ui', 'Montserrat', 'Space Grotesk'];
-            let violations = [];
-
-            for (let elem of elements.slice(0, 50)) {
-                const font = window.getComputedStyle(elem).fontFamily;
-                if (font && forbidden.some(f => font.includes(f))) {
-                    violations.push(font);
-                }
-            }
-            return violations;
-        }''')
-
-        if len(forbidden_fonts) == 0:
-            print("  ✅ NO forbidden fonts in computed styles")
-        else:
-            print(f"  ❌ Forbidden fonts detected: {set(forbidden_fonts)}")
-            violations.append(f"forbidden fonts: {forbidden_fonts}")
-            self.results["overall_pass"] = False
+        forbidden_fonts = report["forbidden-font"]
+        if not self.check("WVWO-forbidden-font", forbidden_fonts["passed"],
+                          f"NO forbidden fonts in computed styles ({report.elements} elements)",
+                          f"Forbidden fonts detected on {forbidden_fonts['count']} elements: {set(forbidden_fonts['matched'])}",
+                          level="FAIL"):
+            violations.append(f"forbidden fonts: {list(forbidden_fonts['matched'])}")
 
         # Border Accent Compliance
         print("\nBorder Accent Compliance")
         print("-" * 40)
 
-        green_accents = page.locator('[class*="border-l-sign-green"]').count()
-        brown_accents = page.locator('[class*="border-l-brand-brown"]').count()
-        orange_accents = page.locator('[class*="border-l-brand-orange"]').count()
+        green_accents = report.count("accent-green")
+        brown_accents = report.count("accent-brown")
+        orange_accents = report.count("accent-orange")
 
         print(f"  ✅ Green (fishing): {green_accents}")
         print(f"  ✅ Brown (camping/marina): {brown_accents}")
         print(f"  ✅ Orange (safety): {orange_accents}")
 
-        if orange_accents > 0:
-            total_elements = page.locator('*').count()
-            orange_pct = (orange_accents / total_elements * 100) if total_elements > 0 else 0
-            if orange_pct < 5:
-                print(f"  ✅ Orange usage: {orange_pct:.2f}% (within <5% limit)")
-            else:
-                print(f"  ⚠️ Orange usage: {orange_pct:.2f}% (exceeds 5% guideline)")
+        # Share of page area painted brand-orange
+        orange_pct = report["orange-area"]["pct"]
+        self.check("WVWO-orange-area", report["orange-area"]["passed"],
+                   f"Orange area: {orange_pct:.2f}% (within <5% limit)",
+                   f"Orange area: {orange_pct:.2f}% (exceeds 5% guideline)")
 
         # Glassmorphism Check
         print("\nGlassmorphism Check")
         print("-" * 40)
 
-        backdrop_blur = page.locator('[class*="backdrop-blur"]').count()
-        if backdrop_blur == 0:
-            print("  ✅ NO glassmorphism (backdrop-blur)")
-        else:
-            print(f"  ❌ {backdrop_blur} backdrop-blur instances")
+        # Class usage plus computed backdrop-filter (catches non-Tailwind CSS)
+        backdrop_blur = max(report.count("glass-class"), report.count("glass-computed"))
+        if not self.check("WVWO-glassmorphism", backdrop_blur == 0, "NO glassmorphism (backdrop-blur)",
+                          f"{backdrop_blur} backdrop-blur instances", level="FAIL"):
             violations.append(f"glassmorphism: {backdrop_blur}")
-            self.results["overall_pass"] = False
 
         # Computed Border-Radius Check (actual CSS values)
         print("\nComputed Border-Radius Validation")
         print("-" * 40)
 
-        large_radius_violations = page.evaluate('''() => {
-            const elements = Array.from(document.querySelectorAll('*'));
-            let violations = [];
-
-            for (let elem of elements.slice(0, 100)) {
-                const br = window.getComputedStyle(elem).borderRadius;
-                if (br && br !== '0px') {
-                    const px = parseFloat(br);
-                    if (px > 2.5) {  // Allow 2px (0.125rem) + small margin
-                        violations.push({
-                            tag: elem.tagName,
-                            value: br,
-                            classes: elem.className.substring(0, 50)
-                        });
-                    }
-                }
-            }
-            return violations;
-        }''')
-
-        if len(large_radius_violations) == 0:
-            print("  ✅ ALL border-radius values <= 2.5px")
-        else:
-            print(f"  ❌ {len(large_radius_violations)} elements exceed 2.5px:")
-            for v in large_radius_violations[:5]:
+        radius = report["rounded-computed"]
+        if not self.check("WVWO-computed-radius", radius["passed"],
+                          f"ALL border-radius values <= 2px (max: {radius['max']:.1f}px)",
+                          f"{radius['count']} elements exceed 2px:", level="FAIL"):
+            for v in radius["samples"][:5]:
                 print(f"      {v['tag']}: {v['value']} - {v['classes']}")
-            violations.append(f"large radius: {len(large_radius_violations)}")
-            self.results["overall_pass"] = False
+            violations.append(f"large radius: {radius['count']}")
 
-        self.results["wvwo_compliance"] = {
+        self.metrics["wvwo_compliance"] = {
             "forbidden_rounded": forbidden_rounded,
             "rounded_sm_count": rounded_sm,
             "glassmorphism": backdrop_blur,
             "border_accents": f"G:{green_accents}, B:{brown_accents}, O:{orange_accents}",
+            "orange_area_pct": round(orange_pct, 2),
             "violations": violations
         }
 
-        page.close()
-
     def test_responsive_layouts(self):
         """Test responsive behavior across viewports"""
         print("\n" + "="*60)
         print("RESPONSIVE LAYOUT TESTING")
         print("="*60 + "\n")
+        self.results.suite("responsive")
 
-        page = self.browser.new_page()
-        page.goto(f"{BASE_URL}/near/summersville-lake")
-        page.wait_for_load_state('networkidle')
+        page = self.snapshots.get(LAKE_URL).page
 
         viewports = [
             ("Mobile", 375, 667),
@@ -313,32 +261,32 @@ class ComprehensiveValidator:
         for name, width, height in viewports:
             print(f"{name} ({width}x{height})")
             page.set_viewport_size({"width": width, "height": height})
-            page.wait_for_timeout(500)
+            wait_until_ready(page)
 
             # Take screenshot
-            filename = f'tests/screenshots/spec13-{name.lower().replace(" ", "-")}.png'
-            page.screenshot(path=filename)
-            print(f"  📸 {filename}")
+            shot = self.screenshots.capture(page, f'spec13-{name.lower().replace(" ", "-")}')
+            print(f"  📸 {shot['path']} ({shot['status']})")
 
             # Check for horizontal scroll
             has_scroll = page.evaluate('() => document.documentElement.scrollWidth > window.innerWidth')
-            if has_scroll:
-                print(f"  ⚠️ Horizontal scroll detected")
-            else:
-                print(f"  ✅ No horizontal scroll")
+            self.check(f"RESP-{width}-scroll", not has_scroll, "No horizontal scroll", "Horizontal scroll detected")
 
-        self.results["responsive"] = {"viewports_tested": len(viewports), "screenshots": len(viewports)}
-        page.close()
+        # Restore the default viewport - later suites share this page
+        page.set_viewport_size({"width": 1280, "height": 720})
 
+        self.metrics["responsive"] = {
+            "viewports_tested": len(viewports),
+            "screenshots": len(viewports),
+            "changed": len(self.screenshots.changed())
+        }
     def test_interactive_elements(self):
         """Test all interactive elements work"""
         print("\n" + "="*60)
         print("INTERACTIVE ELEMENTS TESTING")
         print("="*60 + "\n")
+        self.results.suite("interactive")
 
-        page = self.browser.new_page()
-        page.goto(f"{BASE_URL}/near/summersville-lake")
-        page.wait_for_load_state('networkidle')
+        page = self.snapshots.get(LAKE_URL).page
 
         # CTAs and buttons
         ctas = page.locator('a.bg-sign-green, a.bg-brand-orange, button').all()
@@ -367,24 +315,21 @@ class ComprehensiveValidator:
         nav_links = page.locator('nav a, header a').count()
         print(f"Navigation Links: {nav_links}")
 
-        self.results["interactive"] = {
+        self.metrics["interactive"] = {
             "ctas": len(ctas),
             "tel_links": len(tel_links),
             "secure_external": external_links,
             "nav_links": nav_links
         }
 
-        page.close()
-
     def test_accessibility(self):
         """Quick accessibility validation"""
         print("\n" + "="*60)
         print("ACCESSIBILITY VALIDATION")
         print("="*60 + "\n")
+        self.results.suite("accessibility")
 
-        page = self.browser.new_page()
-        page.goto(f"{BASE_URL}/near/summersville-lake")
-        page.wait_for_load_state('networkidle')
+        page = self.snapshots.get(LAKE_URL).page
 
         # Semantic HTML
         sections = page.locator('section').count()
@@ -418,24 +363,21 @@ class ComprehensiveValidator:
         for h in heading_order:
             print(f"  {h['tag']}: {h['text']}")
 
-        self.results["accessibility"] = {
+        self.metrics["accessibility"] = {
             "sections": sections,
             "headings": headings,
             "aria_labels": aria_labels,
             "labels_inputs": f"{labels}/{inputs}"
         }
 
-        page.close()
-
     def test_spec11_components(self):
         """Test SPEC-11 Adventure Shared Components integration"""
         print("\n" + "="*60)
         print("SPEC-11: ADVENTURE COMPONENTS VALIDATION")
         print("="*60 + "\n")
+        self.results.suite("spec11")
 
-        page = self.browser.new_page()
-        page.goto(f"{BASE_URL}/near/summersville-lake")
-        page.wait_for_load_state('networkidle')
+        page = self.snapshots.get(LAKE_URL).page
 
         components_found = 0
 
@@ -464,9 +406,9 @@ class ComprehensiveValidator:
             components_found += 1
 
         print(f"\nSPEC-11 Components: {components_found}/4 detected")
-        self.results["spec11"] = {"components_found": components_found, "total_expected": 4}
-
-        page.close()
+        self.results.record("SPEC11-components", "PASS" if components_found == 4 else "WARN",
+                            f"{components_found}/4 components detected", page=LAKE_URL)
+        self.metrics["spec11"] = {"components_found": components_found, "total_expected": 4}
 
     def generate_report(self):
         """Generate final comprehensive report"""
@@ -475,18 +417,18 @@ class ComprehensiveValidator:
         print("="*60 + "\n")
 
         print("SPEC-13 LAKE TEMPLATE:")
-        if "spec13" in self.results:
-            spec13 = self.results["spec13"]
+        if "spec13" in self.metrics:
+            spec13 = self.metrics["spec13"]
             print(f"  User Stories: {spec13['pass']}/{spec13['total']} ({spec13['score']:.1f}%)")
 
         print("\nSPEC-11 COMPONENTS:")
-        if "spec11" in self.results:
-            spec11 = self.results["spec11"]
+        if "spec11" in self.metrics:
+            spec11 = self.metrics["spec11"]
             print(f"  Components: {spec11['components_found']}/{spec11['total_expected']}")
 
         print("\nWVWO COMPLIANCE:")
-        if "wvwo_compliance" in self.results:
-            wvwo = self.results["wvwo_compliance"]
+        if "wvwo_compliance" in self.metrics:
+            wvwo = self.metrics["wvwo_compliance"]
             print(f"  Forbidden rounded: {wvwo['forbidden_rounded']} (should be 0)")
             print(f"  rounded-sm usage: {wvwo['rounded_sm_count']}")
             print(f"  Glassmorphism: {wvwo['glassmorphism']} (should be 0)")
@@ -497,33 +439,43 @@ class ComprehensiveValidator:
                 print(f"  ✅ ZERO violations")
 
         print("\nRESPONSIVE:")
-        if "responsive" in self.results:
-            resp = self.results["responsive"]
+        if "responsive" in self.metrics:
+            resp = self.metrics["responsive"]
             print(f"  Viewports tested: {resp['viewports_tested']}")
-            print(f"  Screenshots: {resp['screenshots']}")
+            print(f"  Screenshots: {resp['screenshots']} ({resp['changed']} changed vs baseline)")
 
         print("\nACCESSIBILITY:")
-        if "accessibility" in self.results:
-            a11y = self.results["accessibility"]
+        if "accessibility" in self.metrics:
+            a11y = self.metrics["accessibility"]
             print(f"  Sections: {a11y['sections']}")
             print(f"  Headings: {a11y['headings']}")
             print(f"  ARIA labels: {a11y['aria_labels']}")
 
+        print(f"\nPage loads: {self.snapshots.loads}")
+        self.screenshots.print_summary()
+
+        json_path, junit_path = self.results.write()
+        counts = self.results.counts()
+        print(f"\nChecks: {counts['pass']} passed, {counts['fail']} failed, {counts['warn']} warnings "
+              f"in {self.results.duration:.1f}s -> {json_path} ({junit_path.name})")
+        self.results.print_trends()
+        TRACER.report(self.results.run)
+
         print("\n" + "="*60)
-        if self.results["overall_pass"]:
+        if self.results.ok:
             print("OVERALL: ✅ PASS - All tests successful!")
         else:
             print("OVERALL: ❌ FAIL - Violations detected")
         print("="*60)
 
-        return 0 if self.results["overall_pass"] else 1
+        return 0 if self.results.ok else 1
 
 def main():
     print("🐝 SPEC-12 & SPEC-13 Comprehensive Validation")
     print("Queen-Led Advanced Testing Swarm\n")
 
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+        browser = launch_browser(p)
         validator = ComprehensiveValidator(browser)
 
         # Run all test suites
@@ -537,6 +489,7 @@ def main():
         # Generate final report
         exit_code = validator.generate_report()
 
+        validator.snapshots.close()
         browser.close()
         return exit_code
 
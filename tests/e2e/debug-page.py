@@ -1,18 +1,23 @@
 """Debug script to inspect what's on the preview page."""
 from playwright.sync_api import sync_playwright
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from wvwo_validation.browser_pool import launch_browser
+from wvwo_validation.readiness import goto_ready
 
 PREVIEW_URL = "https://feature-spec-11-adventure-sh.wvwildoutdoors.pages.dev/near/summersville-lake"
 SCREENSHOT_DIR = "c:/Users/matth/Desktop/wvwo-storefront/tests/e2e/screenshots"
 
 def debug_page():
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+        browser = launch_browser(p)
         context = browser.new_context(viewport={"width": 1280, "height": 3000})
         page = context.new_page()
 
         print("Loading page...")
-        page.goto(PREVIEW_URL, wait_until="networkidle")
+        goto_ready(page, PREVIEW_URL)
 
         # Save full page screenshot
         os.makedirs(SCREENSHOT_DIR, exist_ok=True)
@@ -5,6 +5,13 @@ on the live Cloudflare Pages preview.
 """
 from playwright.sync_api import sync_playwright
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from wvwo_validation.browser_pool import launch_browser
+from wvwo_validation.readiness import goto_ready, wait_until_ready
+from wvwo_validation.rules import evaluate_rules
+from wvwo_validation.tracing import TRACER, traced
 
 PREVIEW_URL = "https://feature-spec-11-adventure-sh.wvwildoutdoors.pages.dev/near/summersville-lake"
 SCREENSHOT_DIR = "c:/Users/matth/Desktop/wvwo-storefront/tests/e2e/screenshots"
@@ -14,9 +21,9 @@ def ensure_screenshot_dir():
 
 def test_spec_11_components():
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
+        browser = launch_browser(p)
         context = browser.new_context(viewport={"width": 1280, "height": 720})
-        page = context.new_page()
+        page = traced(context.new_page())
 
         print("")
         print("=" * 60)
@@ -26,7 +33,8 @@ def test_spec_11_components():
 
         # Navigate to the page
         print("[1] Navigating to: " + PREVIEW_URL)
-        page.goto(PREVIEW_URL, wait_until="networkidle")
+        TRACER.section("navigate")
+        goto_ready(page, PREVIEW_URL)
         print("    [OK] Page loaded successfully")
 
         # Take full page screenshot
@@ -37,11 +45,12 @@ def test_spec_11_components():
         # Test AdventureGettingThere component
         print("")
         print("[2] Testing AdventureGettingThere Component")
+        TRACER.section("getting-there")
         getting_there = page.locator('section[aria-labelledby^="adventure-getting-there"]')
         if getting_there.count() > 0:
             print("    [OK] Section found with aria-labelledby")
             getting_there.scroll_into_view_if_needed()
-            page.wait_for_timeout(500)
+            wait_until_ready(page)
             getting_there.screenshot(path=SCREENSHOT_DIR + "/02-getting-there.png")
             print("    [OK] Screenshot saved")
 
@@ -72,11 +81,12 @@ def test_spec_11_components():
         # Test AdventureGearChecklist component
         print("")
         print("[3] Testing AdventureGearChecklist Component")
+        TRACER.section("gear-checklist")
         gear_checklist = page.locator('section[aria-labelledby^="adventure-gear-checklist"]')
         if gear_checklist.count() > 0:
             print("    [OK] Section found with aria-labelledby")
             gear_checklist.scroll_into_view_if_needed()
-            page.wait_for_timeout(500)
+            wait_until_ready(page)
             gear_checklist.screenshot(path=SCREENSHOT_DIR + "/03-gear-checklist.png")
             print("    [OK] Screenshot saved")
 
@@ -108,11 +118,12 @@ def test_spec_11_components():
         # Test AdventureRelatedShop component
         print("")
         print("[4] Testing AdventureRelatedShop Component")
+        TRACER.section("related-shop")
         related_shop = page.locator('section[aria-labelledby^="adventure-related-shop"]')
         if related_shop.count() > 0:
             print("    [OK] Section found with aria-labelledby")
             related_shop.scroll_into_view_if_needed()
-            page.wait_for_timeout(500)
+            wait_until_ready(page)
             related_shop.screenshot(path=SCREENSHOT_DIR + "/04-related-shop.png")
             print("    [OK] Screenshot saved")
 
@@ -142,6 +153,7 @@ def test_spec_11_components():
         # Test hover effects on category cards
         print("")
         print("[5] Testing Hover Effects")
+        TRACER.section("hover")
         if related_shop.count() > 0:
             category_cards = related_shop.locator('a.block.border-l-4')
             if category_cards.count() > 0:
@@ -153,7 +165,7 @@ def test_spec_11_components():
 
                 # Hover over card
                 first_card.hover()
-                page.wait_for_timeout(400)
+                wait_until_ready(page)
 
                 # Screenshot after hover
                 first_card.screenshot(path=SCREENSHOT_DIR + "/06-card-after-hover.png")
@@ -163,24 +175,26 @@ def test_spec_11_components():
         # Check WVWO aesthetic compliance
         print("")
         print("[6] WVWO Aesthetic Compliance Checks")
+        TRACER.section("wvwo-compliance")
+
+        # All WVWO rules in one DOM pass over class attributes and computed styles
+        report = evaluate_rules(page)
 
         # Check for forbidden rounded classes
-        page_html = page.content()
-        forbidden_rounded = ["rounded-md", "rounded-lg", "rounded-xl", "rounded-2xl", "rounded-3xl"]
-        found_forbidden = [r for r in forbidden_rounded if r in page_html]
+        found_forbidden = list(report["rounded-class"]["matched"])
         if found_forbidden:
             print("    [FAIL] FORBIDDEN rounded classes found: " + str(found_forbidden))
         else:
             print("    [OK] No forbidden rounded classes (only rounded-sm allowed)")
 
         # Check for brand colors in use
-        brand_colors = ["sign-green", "brand-brown", "brand-mud", "brand-cream", "brand-orange"]
-        found_colors = [c for c in brand_colors if c in page_html]
+        found_colors = list(report["brand-colors"]["matched"])
         print("    [OK] Brand colors in use: " + str(found_colors))
 
         # Check for forbidden colors
-        forbidden_colors = ["purple", "pink-", "backdrop-blur", "glassmorphism"]
-        found_forbidden_colors = [c for c in forbidden_colors if c in page_html.lower()]
+        found_forbidden_colors = list(report["forbidden-color"]["matched"])
+        found_forbidden_colors += list(report["glass-class"]["matched"])
+        found_forbidden_colors += list(report["glass-computed"]["matched"])
         if found_forbidden_colors:
             print("    [FAIL] Forbidden styles found: " + str(found_forbidden_colors))
         else:
@@ -189,22 +203,24 @@ def test_spec_11_components():
         # Mobile viewport test
         print("")
         print("[7] Mobile Viewport Test (375px)")
+        TRACER.section("mobile")
         context.close()
         mobile_context = browser.new_context(viewport={"width": 375, "height": 667})
-        mobile_page = mobile_context.new_page()
-        mobile_page.goto(PREVIEW_URL, wait_until="networkidle")
+        mobile_page = traced(mobile_context.new_page())
+        goto_ready(mobile_page, PREVIEW_URL)
 
         # Scroll to gear checklist and screenshot
         gear_mobile = mobile_page.locator('section[aria-labelledby^="adventure-gear-checklist"]')
         if gear_mobile.count() > 0:
             gear_mobile.scroll_into_view_if_needed()
-            mobile_page.wait_for_timeout(500)
+            wait_until_ready(mobile_page)
             gear_mobile.screenshot(path=SCREENSHOT_DIR + "/07-gear-mobile.png")
             print("    [OK] Mobile gear checklist screenshot saved")
             print("    [OK] Verify single-column layout in screenshot")
 
         mobile_context.close()
         browser.close()
+        TRACER.report("spec-11-visual")
 
         print("")
         print("=" * 60)
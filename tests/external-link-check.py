@@ -0,0 +1,105 @@
+"""
+External Link Check
+===================
+Verifies that the outbound links in the built site (recreation.gov,
+wvdnr.gov, Google Maps, state park sites ...) still work:
+- 404/410, unknown hosts and refused connections fail
+- bot walls (401/403), rate limits and timeouts are warnings
+
+Links are collected from dist/ by the link graph (no browser), checked in one
+batched pass with at most a couple of requests per second per host, and
+cached in tests/.cache/external-links.json for a day (failures for an hour).
+
+Build first, then run from the repo root:
+    cd wv-wild-web && npm run build && cd ..
+    python tests/external-link-check.py
+    python tests/external-link-check.py --dist path/to/dist --no-cache
+"""
+
+import sys
+import time
+
+from wvwo_validation.external_links import ExternalLinkChecker, LinkStatusCache
+from wvwo_validation.link_graph import LinkGraph
+from wvwo_validation.results import ResultSet
+from wvwo_validation.static_site import DIST_DIR, dist_dir_from_argv
+
+results = ResultSet("external-link-check")
+
+def log_pass(test_id, message, page=None):
+    print(results.record(test_id, "PASS", message, page=page))
+
+def log_fail(test_id, message, page=None):
+    print(results.record(test_id, "FAIL", message, page=page))
+
+def log_warn(test_id, message, page=None):
+    print(results.record(test_id, "WARN", message, page=page))
+
+def describe(result):
+    detail = result["error"] or f"HTTP {result['status']} ({result['method']})"
+    if result["final_url"] != result["url"]:
+        detail += f" via {result['final_url']}"
+    return detail
+
+def main():
+    dist = dist_dir_from_argv() or DIST_DIR
+    if not (dist / "index.html").exists():
+        print(f"[X] No built site at {dist} (run: cd wv-wild-web && npm run build)")
+        return 1
+
+    print("="*60)
+    print("EXTERNAL LINK CHECK")
+    print(f"dist: {dist}")
+    print("="*60)
+
+    graph = LinkGraph.from_dist(dist)
+    urls = sorted(url for url in graph.external if url.startswith(("http://", "https://")))
+    hosts = {url.split("/")[2] for url in urls}
+    print(f"\n{len(urls)} external links to {len(hosts)} hosts from {len(graph.pages)} pages")
+
+    checker = ExternalLinkChecker(cache=LinkStatusCache(enabled="--no-cache" not in sys.argv))
+    start = time.perf_counter()
+    checked = checker.check(urls)
+    elapsed = time.perf_counter() - start
+
+    results.suite("external-links")
+    fresh = checker.fresh
+    if fresh and all((r["error"] or "").startswith("dns:") for r in fresh.values()):
+        # Every host checked this run failing to resolve means we are offline, not that
+        # every site is gone (cache hits say nothing about the network now); the cache is
+        # not saved, or the next online run would replay these failures
+        results.record("EXT-LINK", "SKIP", f"No network: all {len(fresh)} uncached links failed DNS resolution")
+        print("[!] No network - external links not checked")
+    else:
+        checker.cache.save()
+        for url, result in sorted(checked.items()):
+            pages = sorted(graph.external[url])
+            where = f" (on {', '.join(pages[:3])}{' ...' if len(pages) > 3 else ''})"
+            if result["verdict"] == "broken":
+                log_fail("EXT-LINK", f"{url}: {describe(result)}{where}", page=pages[0])
+            elif result["verdict"] == "unverified":
+                log_warn("EXT-LINK", f"{url}: {describe(result)}{where}", page=pages[0])
+        ok = sum(r["verdict"] == "ok" for r in checked.values())
+        if ok:
+            log_pass("EXT-LINK", f"{ok}/{len(checked)} external links OK")
+
+    print("\n" + "="*60)
+    print("TEST SUMMARY")
+    print("="*60)
+    print(f"\nLinks: {len(checked)} in {elapsed:.2f}s ({checker.cache.hits} from cache, "
+          f"{checker.requests} requests over {checker.connections} connections)")
+    print(f"Broken: {len(results.failed)}")
+    print(f"Unverified: {len(results.warnings)}")
+
+    json_path, junit_path = results.write()
+    print(f"Results: {json_path} ({junit_path.name})")
+    results.print_trends()
+
+    if results.failed:
+        print("\n[X] OVERALL: SOME CHECKS FAILED")
+        return 1
+    print("\n[OK] OVERALL: ALL CHECKS PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
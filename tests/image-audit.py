@@ -0,0 +1,123 @@
+"""
+Image Optimization Audit
+========================
+Every discovered page at mobile, tablet and desktop (DPR 2/2/1) through the
+viewport matrix runner, checking each <img> against the BLUEPRINT's image
+rules (see wvwo_validation.image_audit):
+- Intrinsic size vs rendered size - wasted bytes on oversized images
+- WebP/AVIF rather than JPEG/PNG/GIF
+- loading="lazy" below the fold (and not above it)
+- srcset/sizes on wide images
+
+Reports the potential byte savings per page (worst viewport) and fails a page
+whose savings exceed SAVINGS_BUDGET.
+
+Local dev server (default; requires: cd wv-wild-web && npm run dev):
+    python tests/image-audit.py
+
+Built site from disk (requires npm run build) - the optimized images:
+    python tests/image-audit.py --dist [path/to/dist]
+"""
+
+import asyncio
+import sys
+
+from wvwo_validation.crawl import CrawlError
+from wvwo_validation.discovery import discover_pages
+from wvwo_validation.image_audit import AUDIT_DPR, AUDIT_VIEWPORTS, async_collect_images, page_savings
+from wvwo_validation.results import ResultSet
+from wvwo_validation.static_site import StaticServer, dist_dir_from_argv
+from wvwo_validation.tracing import TRACER
+from wvwo_validation.viewport_matrix import run_matrix
+
+BASE_URL = "http://localhost:4321"
+if "--dist" in sys.argv:
+    DIST_SERVER = StaticServer(dist_dir_from_argv()).start()
+    BASE_URL = DIST_SERVER.url
+    print(f"[DIST] Serving {DIST_SERVER.root}: {BASE_URL}")
+
+# A page that could shed more than this by resizing/re-encoding fails
+SAVINGS_BUDGET = 200 * 1024
+
+WORKERS_PER_VIEWPORT = 2
+
+results = ResultSet("image-audit")
+
+async def audit_visit(page, url, viewport_name):
+    return await async_collect_images(page)
+
+def main():
+    print("="*60)
+    print("IMAGE OPTIMIZATION AUDIT")
+    print(f"Site: {BASE_URL}")
+    print("="*60)
+
+    pages, source = discover_pages(BASE_URL)
+    print(f"\n{len(pages)} pages (from {source}) x {len(AUDIT_VIEWPORTS)} viewports")
+    if not pages:
+        print("[X] No pages found - is the site running?")
+        return 1
+
+    urls = [f"{BASE_URL}{path}" for path in pages]
+    options = {name: {"device_scale_factor": dpr} for name, dpr in AUDIT_DPR.items()}
+    matrix = asyncio.run(run_matrix(urls, AUDIT_VIEWPORTS, audit_visit,
+                                    workers_per_viewport=WORKERS_PER_VIEWPORT, context_options=options))
+
+    results.suite("images")
+    total_savings = 0
+    image_count = 0
+    for path, url in zip(pages, urls):
+        by_viewport = {}
+        for name, _, _ in AUDIT_VIEWPORTS:
+            r = matrix[(url, name)]
+            if isinstance(r, CrawlError):
+                print(results.record("IMG-LOAD", "FAIL", f"{path} @ {name}: {r.error}", page=path))
+            else:
+                by_viewport[name] = r
+        if not by_viewport:
+            continue
+
+        analyzed, worst = page_savings(by_viewport)
+        total_savings += worst
+        image_count += max(len(images) for images in by_viewport.values())
+
+        # The same finding usually shows at every viewport; report it once
+        merged = {}
+        for name, (findings, _) in analyzed.items():
+            for kind, message, index, wasted in findings:
+                entry = merged.setdefault((kind, index), [message, wasted, []])
+                if wasted > entry[1]:
+                    entry[0], entry[1] = message, wasted
+                entry[2].append(name)
+        for (kind, _), (message, wasted, viewports) in sorted(merged.items(), key=lambda m: -m[1][1]):
+            where = "" if len(viewports) == len(analyzed) else f" [{', '.join(viewports)}]"
+            print(results.record(f"IMG-{kind.upper()}", "WARN", f"{path}: {message}{where}", page=path))
+
+        if worst > SAVINGS_BUDGET:
+            print(results.record("IMG-SAVINGS", "FAIL", f"{path}: ~{worst / 1024:.0f}KB of image bytes could be saved "
+                                 f"(budget {SAVINGS_BUDGET / 1024:.0f}KB)", page=path, data={"wasted": worst}))
+        else:
+            print(results.record("IMG-SAVINGS", "PASS", f"{path}: ~{worst / 1024:.0f}KB potential savings",
+                                 page=path, data={"wasted": worst}))
+
+    print("\n" + "="*60)
+    print("TEST SUMMARY")
+    print("="*60)
+    print(f"\nPages: {len(pages)}, images: {image_count}")
+    print(f"Potential savings: ~{total_savings / 1024:.0f}KB (worst viewport per page)")
+    print(f"Findings: {len(results.warnings)}")
+    print(f"Pages over savings budget: {len(results.failed)}")
+
+    json_path, junit_path = results.write()
+    print(f"Results: {json_path} ({junit_path.name})")
+    results.print_trends()
+    TRACER.report("image-audit")
+
+    if results.failed:
+        print("\n[X] OVERALL: SOME CHECKS FAILED")
+        return 1
+    print("\n[OK] OVERALL: ALL CHECKS PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
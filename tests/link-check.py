@@ -0,0 +1,94 @@
+"""
+Internal Link Check (offline)
+=============================
+Verifies the cross-links between adventures, products and services in the
+built site, without a browser or an HTTP request per link:
+- Every internal <a href> resolves to a built page or file in dist/
+- Every #anchor points at an id on its target page
+- Every adventure page is reachable from the home page (no orphans)
+
+Build first, then run from the repo root:
+    cd wv-wild-web && npm run build && cd ..
+    python tests/link-check.py
+    python tests/link-check.py --dist path/to/dist
+"""
+
+import sys
+import time
+
+from wvwo_validation.link_graph import LinkGraph
+from wvwo_validation.results import ResultSet
+from wvwo_validation.static_site import DIST_DIR, dist_dir_from_argv
+
+results = ResultSet("link-check")
+
+def log_pass(test_id, message, page=None):
+    print(results.record(test_id, "PASS", message, page=page))
+
+def log_fail(test_id, message, page=None):
+    print(results.record(test_id, "FAIL", message, page=page))
+
+def log_warn(test_id, message, page=None):
+    print(results.record(test_id, "WARN", message, page=page))
+
+def main():
+    dist = dist_dir_from_argv() or DIST_DIR
+    if not (dist / "index.html").exists():
+        print(f"[X] No built site at {dist} (run: cd wv-wild-web && npm run build)")
+        return 1
+
+    print("="*60)
+    print("INTERNAL LINK CHECK")
+    print(f"dist: {dist}")
+    print("="*60)
+
+    start = time.perf_counter()
+    graph = LinkGraph.from_dist(dist)
+    elapsed = time.perf_counter() - start
+    print(f"\nParsed {len(graph.pages)} pages, {len(graph.links)} internal links in {elapsed:.2f}s")
+
+    results.suite("broken-links")
+    broken = graph.broken_links()
+    for source, href, target in broken:
+        log_fail("LINK-404", f"{source}: {href} -> {target} is not in the build", page=source)
+    if not broken:
+        log_pass("LINK-404", f"All {len(graph.links)} internal links resolve")
+
+    results.suite("anchors")
+    missing = graph.missing_anchors()
+    for source, href, target, fragment in missing:
+        log_fail("LINK-ANCHOR", f"{source}: {href} -> no id=\"{fragment}\" on {target}", page=source)
+    if not missing:
+        log_pass("LINK-ANCHOR", "All #anchor targets exist")
+
+    results.suite("orphans")
+    adventures = graph.adventure_pages()
+    orphans = graph.orphans(adventures)
+    for path in orphans:
+        inbound = sorted(graph.inbound(path))
+        via = f"only linked from {', '.join(inbound[:3])}" if inbound else "no inbound links"
+        log_warn("LINK-ORPHAN", f"{path}: not reachable from / ({via})", page=path)
+    if not orphans:
+        log_pass("LINK-ORPHAN", f"All {len(adventures)} adventure pages reachable from /")
+
+    print("\n" + "="*60)
+    print("TEST SUMMARY")
+    print("="*60)
+    print(f"\nPages: {len(graph.pages)} ({len(adventures)} adventure), link check in {results.duration:.2f}s")
+    print(f"Broken links: {len(broken)}")
+    print(f"Missing anchors: {len(missing)}")
+    print(f"Orphan adventure pages: {len(orphans)}")
+    print(f"External links (not checked here): {len(graph.external)}")
+
+    json_path, junit_path = results.write()
+    print(f"Results: {json_path} ({junit_path.name})")
+    results.print_trends()
+
+    if results.failed:
+        print("\n[X] OVERALL: SOME CHECKS FAILED")
+        return 1
+    print("\n[OK] OVERALL: ALL CHECKS PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
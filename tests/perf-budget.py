@@ -0,0 +1,117 @@
+"""
+Performance Budget Check
+========================
+Loads every /near/ adventure page cold on an emulated phone under throttled
+3G (network and 4x CPU, via CDP) and checks it against its template's budget
+(wvwo_validation.perf.PERF_BUDGETS: lake, wma, ski, river):
+- LCP, CLS and TBT from PerformanceObserver
+- Transfer bytes by resource type and request count
+
+Local dev server (default; requires: cd wv-wild-web && npm run dev):
+    python tests/perf-budget.py
+
+Built site from disk (closer to production; requires npm run build):
+    python tests/perf-budget.py --dist [path/to/dist]
+
+Other network presets (3g, slow-3g, none):
+    python tests/perf-budget.py --network slow-3g
+
+Pages are measured one at a time - parallel loads would share the CPU and
+skew TBT and LCP.
+"""
+
+import sys
+from playwright.sync_api import sync_playwright
+
+from wvwo_validation.browser_pool import launch_browser
+from wvwo_validation.discovery import adventure_types, discover_pages
+from wvwo_validation.perf import NETWORK_PROFILES, PERF_BUDGETS, check_budget, format_metric, measure_page, template_for
+from wvwo_validation.results import ResultSet
+from wvwo_validation.static_site import StaticServer, dist_dir_from_argv
+from wvwo_validation.tracing import TRACER
+
+BASE_URL = "http://localhost:4321"
+if "--dist" in sys.argv:
+    DIST_SERVER = StaticServer(dist_dir_from_argv()).start()
+    BASE_URL = DIST_SERVER.url
+    print(f"[DIST] Serving {DIST_SERVER.root}: {BASE_URL}")
+
+NETWORK = "3g"
+if "--network" in sys.argv:
+    NETWORK = sys.argv[sys.argv.index("--network") + 1]
+    if NETWORK not in NETWORK_PROFILES:
+        sys.exit(f"Unknown --network {NETWORK!r} (expected one of {', '.join(NETWORK_PROFILES)})")
+
+results = ResultSet("perf-budget")
+
+def log_pass(test_id, message, page=None, data=None):
+    print(results.record(test_id, "PASS", message, page=page, data=data))
+
+def log_fail(test_id, message, page=None, data=None):
+    print(results.record(test_id, "FAIL", message, page=page, data=data))
+
+def main():
+    print("="*60)
+    print(f"PERFORMANCE BUDGETS ({NETWORK}, mobile)")
+    print(f"Site: {BASE_URL}")
+    print("="*60)
+
+    pages, source = discover_pages(BASE_URL)
+    near = [path for path in pages if path.startswith("/near/")]
+    print(f"\n{len(near)} /near/ pages (from {source})")
+    if not near:
+        print("[X] No /near/ pages found - is the site running?")
+        return 1
+
+    types = adventure_types()
+    by_template = {}
+    for path in near:
+        by_template.setdefault(template_for(path, types), []).append(path)
+
+    rows = []
+    with sync_playwright() as p:
+        browser = launch_browser(p)
+        for template, paths in sorted(by_template.items()):
+            results.suite(template)
+            budget = PERF_BUDGETS[template]
+            for path in paths:
+                try:
+                    m = measure_page(browser, f"{BASE_URL}{path}", NETWORK)
+                except Exception as e:
+                    log_fail("PERF-LOAD", f"{path}: {e}", page=path)
+                    continue
+                rows.append((path, template, m))
+                over = check_budget(m, budget)
+                data = {k: m[k] for k in ("fcp", "lcp", "cls", "tbt", "total", "requests", "bytes")}
+                if over:
+                    detail = ", ".join(f"{metric} {format_metric(metric, value)} > {format_metric(metric, limit)}"
+                                       for metric, value, limit in over)
+                    log_fail("PERF-BUDGET", f"{path}: {detail}", page=path, data=data)
+                else:
+                    log_pass("PERF-BUDGET", f"{path}: within {template} budget", page=path, data=data)
+        browser.close()
+
+    print("\n" + "="*60)
+    print("PAGE WEIGHT AND WEB VITALS")
+    print("="*60)
+    print(f"\n  {'page':<40} {'tmpl':<8} {'LCP':>7} {'CLS':>6} {'TBT':>6} {'KB':>6} {'req':>4}  top types")
+    for path, template, m in rows:
+        lcp = format_metric("lcp", m["lcp"]) if m["lcp"] is not None else "-"
+        top = ", ".join(f"{kind} {size / 1024:.0f}KB" for kind, size in list(m["bytes"].items())[:3])
+        print(f"  {path[:40]:<40} {template:<8} {lcp:>7} {m['cls']:>6.3f} {m['tbt']:>4.0f}ms "
+              f"{m['total'] / 1024:>6.0f} {m['requests']:>4}  {top}")
+
+    print(f"\nWithin budget: {len(results.passed)}/{len(results.passed) + len(results.failed)}")
+    json_path, junit_path = results.write()
+    print(f"Results: {json_path} ({junit_path.name})")
+    results.print_trends()
+    TRACER.report("perf-budget")
+
+    if results.failed:
+        print("\n[X] OVERALL: BUDGETS EXCEEDED")
+        return 1
+    print("\n[OK] OVERALL: ALL PAGES WITHIN BUDGET")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Batch Performance Score
+=======================
+Lighthouse-style mobile performance score for every adventure page of every
+template (lake, wma, ski, river, campground, historic), run locally against
+the built site - no per-URL PageSpeed runs:
+- FCP, Speed Index, LCP, TBT and CLS measured under throttled 3G on an
+  emulated phone (wvwo_validation.perf)
+- Scored on Lighthouse's log-normal curves and weights (wvwo_validation.scoring)
+- Ranked slowest first, with deltas against the previous run
+
+Build first, then run from the repo root:
+    cd wv-wild-web && npm run build && cd ..
+    python tests/perf-score.py
+    python tests/perf-score.py --dist path/to/dist --workers 2 --network slow-3g
+
+Pages are scored in parallel browser contexts (--workers, default 4). CPU
+throttling is per page but the workers share real cores, so keep --workers
+at or below the core count for stable TBT numbers.
+"""
+
+import asyncio
+import sys
+from playwright.async_api import async_playwright
+
+from wvwo_validation.browser_pool import async_launch_browser
+from wvwo_validation.crawl import CrawlError
+from wvwo_validation.discovery import adventure_types, discover_pages
+from wvwo_validation.perf import NETWORK_PROFILES, async_measure_page, format_metric, template_for
+from wvwo_validation.results import ResultSet, load_results
+from wvwo_validation.scoring import SCORING, performance_score
+from wvwo_validation.static_site import DIST_DIR, StaticServer, dist_dir_from_argv
+from wvwo_validation.tracing import TRACER
+
+SCORED_TEMPLATES = ("lake", "wma", "ski", "river", "campground", "historic")
+
+# Lighthouse's colour bands: 90+ good, 50-89 needs improvement, below 50 poor
+TARGET_SCORE = 90
+POOR_SCORE = 50
+
+WORKERS = 4
+if "--workers" in sys.argv:
+    WORKERS = int(sys.argv[sys.argv.index("--workers") + 1])
+
+NETWORK = "3g"
+if "--network" in sys.argv:
+    NETWORK = sys.argv[sys.argv.index("--network") + 1]
+    if NETWORK not in NETWORK_PROFILES:
+        sys.exit(f"Unknown --network {NETWORK!r} (expected one of {', '.join(NETWORK_PROFILES)})")
+
+results = ResultSet("perf-score")
+
+async def measure_all(urls, workers=WORKERS):
+    """{url: measurement or CrawlError}, measured by `workers` concurrent cold loads"""
+    measured = {}
+    queue = asyncio.Queue()
+    for url in urls:
+        queue.put_nowait(url)
+
+    async def worker(browser):
+        while True:
+            try:
+                url = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                measured[url] = await async_measure_page(browser, url, NETWORK)
+            except Exception as e:
+                measured[url] = CrawlError(url, e)
+
+    async with async_playwright() as p:
+        browser = await async_launch_browser(p)
+        try:
+            await asyncio.gather(*(worker(browser) for _ in range(max(1, min(workers, len(urls))))))
+        finally:
+            await browser.close()
+    return measured
+
+def delta(value, previous, metric=None):
+    if value is None or previous is None:
+        return ""
+    diff = value - previous
+    if metric == "cls":
+        return f"{diff:+.3f}" if abs(diff) >= 0.001 else "="
+    return f"{diff:+.0f}" if round(diff) else "="
+
+def main():
+    dist = dist_dir_from_argv() or DIST_DIR
+    try:
+        server = StaticServer(dist).start()
+    except FileNotFoundError as e:
+        print(f"[X] {e}")
+        return 1
+
+    print("="*60)
+    print(f"BATCH PERFORMANCE SCORE ({NETWORK}, mobile, {WORKERS} workers)")
+    print(f"dist: {dist}")
+    print("="*60)
+
+    base_url = server.url
+    try:
+        pages, source = discover_pages(base_url)
+        types = adventure_types()
+        templates = {path: template_for(path, types, SCORED_TEMPLATES) for path in pages}
+        paths = sorted((path for path, template in templates.items() if template != "default"),
+                       key=lambda path: (templates[path], path))
+        print(f"\n{len(paths)} adventure pages (from {source})")
+        if not paths:
+            print("[X] No adventure pages found")
+            return 1
+        measured = asyncio.run(measure_all([f"{base_url}{path}" for path in paths]))
+    finally:
+        server.stop()
+
+    previous = load_results("perf-score") or {"results": []}
+    previous = {r["page"]: r["data"] for r in previous["results"] if r.get("page") and r.get("data")}
+
+    rows = []
+    for path in paths:
+        results.suite(templates[path])
+        m = measured[f"{base_url}{path}"]
+        if isinstance(m, CrawlError):
+            print(results.record("PERF-SCORE", "FAIL", f"{path}: {m}", page=path, duration=0.0))
+            continue
+        score, parts = performance_score(m)
+        data = {"score": score, **{metric: m.get(metric) for metric in SCORING}}
+        if score is None:
+            status = "SKIP"
+        else:
+            status = "PASS" if score >= TARGET_SCORE else "WARN" if score >= POOR_SCORE else "FAIL"
+        results.record("PERF-SCORE", status, f"{path}: {score}", page=path, data=data, duration=0.0)
+        rows.append((path, templates[path], data, previous.get(path, {})))
+
+    print("\n" + "="*60)
+    print("SLOWEST PAGES FIRST (delta vs previous run)")
+    print("="*60)
+    print(f"\n  {'page':<38} {'tmpl':<10} {'score':>9} {'FCP':>7} {'SI':>7} {'LCP':>13} {'TBT':>11} {'CLS':>6}")
+    for path, template, data, before in sorted(rows, key=lambda r: (r[2]["score"] is None, r[2]["score"] or 0)):
+        cells = []
+        for metric in ("fcp", "speed_index"):
+            cells.append(format_metric(metric, data[metric]) if data[metric] is not None else "-")
+        for metric in ("lcp", "tbt"):
+            value = format_metric(metric, data[metric]) if data[metric] is not None else "-"
+            cells.append(f"{value} {delta(data[metric], before.get(metric))}".strip())
+        score = "-" if data["score"] is None else str(data["score"])
+        print(f"  {path[:38]:<38} {template:<10} {score:>4} {delta(data['score'], before.get('score')):>4} "
+              f"{cells[0]:>7} {cells[1]:>7} {cells[2]:>13} {cells[3]:>11} {data['cls'] or 0:>6.3f}")
+
+    scores = [data["score"] for _, _, data, _ in rows if data["score"] is not None]
+    if scores:
+        print(f"\nMedian score: {sorted(scores)[len(scores) // 2]}, "
+              f"{sum(s >= TARGET_SCORE for s in scores)}/{len(scores)} pages at {TARGET_SCORE}+")
+    json_path, junit_path = results.write()
+    print(f"Results: {json_path} ({junit_path.name})")
+    TRACER.report("perf-score")
+
+    if results.failed:
+        print(f"\n[X] OVERALL: PAGES SCORING BELOW {POOR_SCORE}")
+        return 1
+    print("\n[OK] OVERALL: NO POOR SCORES")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,73 +12,96 @@ Production (default):
 Local dev server:
     python tests/phase3a-validation.py --local
     (requires: cd wv-wild-web && npm run dev)
+
+Built site from disk (no network; requires: cd wv-wild-web && npm run build):
+    python tests/phase3a-validation.py --dist [path/to/dist]
+
+Every /near/ page in the sitemap (or reachable by links from / and /near) is
+validated, crawled in parallel:
+    python tests/phase3a-validation.py --concurrency 8
+
+Re-crawl only /near/ pages whose sitemap lastmod changed since the last run:
+    python tests/phase3a-validation.py --changed-only
+
+/near/ pages load asset-free (no images, fonts, CSS or third-party requests),
+the homepage with first-party styles only; load everything as a browser would
+with:
+    python tests/phase3a-validation.py --full-load
+
+Connects to the shared browser when one is running (python tests/browser-pool.py
+start) instead of launching Chromium; --no-pool launches its own.
+
+Time every navigation, wait, locator and evaluate() (flame summary plus a
+Chrome trace under tests/results/):
+    python tests/phase3a-validation.py --trace
 """
 
-import json
+import asyncio
 import re
 import os
 import sys
 from pathlib import Path
 from playwright.sync_api import sync_playwright
 
+from wvwo_validation.browser_pool import launch_browser
+from wvwo_validation.crawl import Crawler, CrawlError, DEFAULT_CONCURRENCY, near_links
+from wvwo_validation.discovery import DiscoveryState, discover_pages
+from wvwo_validation.readiness import goto_ready
+from wvwo_validation.results import ResultSet
+from wvwo_validation.routing import RequestRouter
+from wvwo_validation.tracing import TRACER, traced
+from wvwo_validation.schema import async_extract_schemas, extract_schemas
+from wvwo_validation.static_site import StaticServer, dist_dir_from_argv
+
 # Base URL - production by default, --local flag for dev server
 BASE_URL = "https://wvwildoutdoors.pages.dev"
-if "--local" in sys.argv:
+if "--dist" in sys.argv:
+    DIST_SERVER = StaticServer(dist_dir_from_argv()).start()
+    BASE_URL = DIST_SERVER.url
+    print(f"[DIST] Serving {DIST_SERVER.root}: {BASE_URL}")
+elif "--local" in sys.argv:
     BASE_URL = "http://localhost:4321"
     print(f"[LOCAL] Using dev server: {BASE_URL}")
 else:
     print(f"[PROD] Using production: {BASE_URL}")
 
-# Test results tracking
-results = {
-    "passed": [],
-    "failed": [],
-    "warnings": []
-}
+# Browser contexts used to crawl /near/ pages in parallel
+CONCURRENCY = DEFAULT_CONCURRENCY
+if "--concurrency" in sys.argv:
+    CONCURRENCY = int(sys.argv[sys.argv.index("--concurrency") + 1])
 
-def log_pass(test_id, message):
-    results["passed"].append(f"[PASS] {test_id}: {message}")
-    print(f"[PASS] {test_id}: {message}")
+# The /near/ crawl only reads HTML and schema, so those pages load without images,
+# fonts, CSS or third-party requests (see wvwo_validation.routing). The homepage
+# checks read inner_text(), which depends on CSS (hidden elements, text-transform),
+# so that page keeps first-party styles. --full-load opts out of both
+ROUTE_PROFILE = "full" if "--full-load" in sys.argv else "dom"
+PAGE_ROUTE_PROFILE = "full" if "--full-load" in sys.argv else "styles"
 
-def log_fail(test_id, message):
-    results["failed"].append(f"[FAIL] {test_id}: {message}")
-    print(f"[FAIL] {test_id}: {message}")
+# Only re-crawl /near/ pages whose sitemap lastmod changed since the last run
+CHANGED_ONLY = "--changed-only" in sys.argv
 
-def log_warn(test_id, message):
-    results["warnings"].append(f"[WARN] {test_id}: {message}")
-    print(f"[WARN] {test_id}: {message}")
+# Test results tracking (JSON, JUnit XML and run history under tests/results/)
+results = ResultSet("phase3a")
+
+def log_pass(test_id, message, page=None):
+    print(results.record(test_id, "PASS", message, page=page))
+
+def log_fail(test_id, message, page=None):
+    print(results.record(test_id, "FAIL", message, page=page))
+
+def log_warn(test_id, message, page=None):
+    print(results.record(test_id, "WARN", message, page=page))
+
+def log_skip(test_id, message, page=None):
+    print(results.record(test_id, "SKIP", message, page=page))
 
 def extract_jsonld(page):
-    """Extract all JSON-LD scripts from a page"""
-    scripts = page.locator('script[type="application/ld+json"]').all()
-    schemas = []
-    for script in scripts:
-        try:
-            content = script.inner_text()
-            data = json.loads(content)
-            # Handle @graph arrays
-            if isinstance(data, dict) and "@graph" in data:
-                schemas.extend(data["@graph"])
-            elif isinstance(data, list):
-                schemas.extend(data)
-            else:
-                schemas.append(data)
-        except json.JSONDecodeError as e:
-            log_warn("JSON-LD", f"Invalid JSON-LD: {e}")
+    """Extract all JSON-LD from a page as a SchemaIndex (one evaluate call)"""
+    schemas = extract_schemas(page)
+    for error in schemas.errors:
+        log_warn("JSON-LD", f"Invalid JSON-LD: {error}")
     return schemas
 
-def find_schema_by_type(schemas, schema_type):
-    """Find a schema by @type"""
-    for schema in schemas:
-        if isinstance(schema, dict):
-            s_type = schema.get("@type", "")
-            if isinstance(s_type, list):
-                if schema_type in s_type:
-                    return schema
-            elif s_type == schema_type:
-                return schema
-    return None
-
 # =====================================================
 # SPEC 01: LocalBusiness Schema Tests
 # =====================================================
@@ -88,29 +111,21 @@ def test_localbusiness_schema(page):
     print("\n" + "="*60)
     print("SPEC 01: LocalBusiness Schema Validation")
     print("="*60)
+    results.suite("localbusiness")
 
-    page.goto(f"{BASE_URL}/")
-    page.wait_for_load_state("networkidle")
+    goto_ready(page, f"{BASE_URL}/")
 
     schemas = extract_jsonld(page)
 
-    # SportingGoodsStore is a subtype of LocalBusiness in schema.org hierarchy
-    # Also check for GunStore which may be used
-    local_biz_types = ["LocalBusiness", "SportingGoodsStore", "GunStore", "Store"]
-    local_biz = None
-    found_type = None
-
-    for biz_type in local_biz_types:
-        local_biz = find_schema_by_type(schemas, biz_type)
-        if local_biz:
-            found_type = biz_type
-            break
+    # SportingGoodsStore/GunStore are subtypes of LocalBusiness in the schema.org
+    # hierarchy; the index resolves them under "LocalBusiness"
+    local_biz = schemas.first("LocalBusiness")
 
     if not local_biz:
-        log_fail("SC-001", f"LocalBusiness/Store schema not found on homepage (checked: {', '.join(local_biz_types)})")
+        log_fail("SC-001", f"LocalBusiness/Store schema not found on homepage (found: {', '.join(sorted(schemas.types())) or 'none'})")
         return
 
-    print(f"   Found schema type: {found_type}")
+    print(f"   Found schema type: {local_biz.get('@type')}")
 
     # SC-001: Coordinates check
     geo = local_biz.get("geo", {})
@@ -181,63 +196,61 @@ def test_localbusiness_schema(page):
 # SPEC 02: Navigation Schema Tests
 # =====================================================
 
-def test_navigation_schema(page):
-    """Test BreadcrumbList and CollectionPage schemas on /near/ pages"""
+def test_navigation_schema(near_hub, near_pages, partial=False):
+    """Test BreadcrumbList and CollectionPage schemas on /near/ pages
+
+    `partial`: near_pages is only the --changed-only subset, so site-wide
+    coverage is not judged from it.
+    """
     print("\n" + "="*60)
     print("SPEC 02: Navigation Schema Validation")
     print("="*60)
-
-    # List of /near/ pages to test
-    near_pages = [
-        "elk-river",
-        "sutton-lake",
-        "summersville-lake",
-        "burnsville-lake",
-        "stonewall-jackson-lake",
-        "bulltown",
-        "i79-corridor",
-        "birch-river"
-    ]
+    results.suite("navigation")
 
     breadcrumb_count = 0
     area_served_count = 0
+    missing_breadcrumbs = []
 
-    # SC-001: Test BreadcrumbList on sample of /near/ pages
-    for slug in near_pages[:3]:  # Test first 3 as sample
-        url = f"{BASE_URL}/near/{slug}"
-        page.goto(url)
-        page.wait_for_load_state("networkidle")
+    # SC-001: Test BreadcrumbList on every /near/ page
+    for path, visited in near_pages.items():
+        if isinstance(visited, CrawlError):
+            print(f"   [-] {path}: failed to load ({visited.error})")
+            missing_breadcrumbs.append(path)
+            continue
 
-        schemas = extract_jsonld(page)
-        breadcrumb = find_schema_by_type(schemas, "BreadcrumbList")
+        schemas = visited["schemas"]
+        breadcrumb = schemas.first("BreadcrumbList")
 
         if breadcrumb:
             items = breadcrumb.get("itemListElement", [])
             if len(items) >= 2:
                 breadcrumb_count += 1
-                print(f"   [+] /near/{slug}: BreadcrumbList with {len(items)} items")
+                print(f"   [+] {path}: BreadcrumbList with {len(items)} items")
             else:
-                print(f"   [-] /near/{slug}: BreadcrumbList has only {len(items)} items")
+                print(f"   [-] {path}: BreadcrumbList has only {len(items)} items")
+                missing_breadcrumbs.append(path)
         else:
-            print(f"   [-] /near/{slug}: No BreadcrumbList found")
+            print(f"   [-] {path}: No BreadcrumbList found")
+            missing_breadcrumbs.append(path)
 
         # SC-003: Check areaServed
-        # Look in WebPage or CollectionPage schema
-        webpage = find_schema_by_type(schemas, "WebPage")
+        # Look in WebPage or any subtype (CollectionPage, ItemPage, ...)
+        webpage = schemas.first("WebPage")
         if webpage and webpage.get("areaServed"):
             area_served_count += 1
 
-    if breadcrumb_count >= 2:
-        log_pass("SC-001", f"BreadcrumbList found on {breadcrumb_count}/3 sampled /near/ pages")
+    total = len(near_pages)
+    if total and not missing_breadcrumbs:
+        log_pass("SC-001", f"BreadcrumbList found on all {total} {'changed ' if partial else ''}/near/ pages")
+    elif partial and not total:
+        log_skip("SC-001", "No changed /near/ pages to check (--changed-only)")
     else:
-        log_fail("SC-001", f"BreadcrumbList only found on {breadcrumb_count}/3 pages (need 2+)")
+        log_fail("SC-001", f"BreadcrumbList only found on {breadcrumb_count}/{total} pages (missing: {', '.join(missing_breadcrumbs)})")
 
     # SC-002: CollectionPage on /near/ hub
-    page.goto(f"{BASE_URL}/near")
-    page.wait_for_load_state("networkidle")
-
-    schemas = extract_jsonld(page)
-    collection = find_schema_by_type(schemas, "CollectionPage")
+    collection = None
+    if not isinstance(near_hub, CrawlError):
+        collection = near_hub["schemas"].first("CollectionPage")
 
     if collection:
         log_pass("SC-002", "CollectionPage schema found on /near/ hub")
@@ -245,23 +258,25 @@ def test_navigation_schema(page):
         log_fail("SC-002", "CollectionPage schema NOT found on /near/ hub")
 
     # SC-003: areaServed on /near/ pages
-    if area_served_count >= 2:
-        log_pass("SC-003", f"areaServed found on {area_served_count}/3 sampled pages")
+    if total and area_served_count == total:
+        log_pass("SC-003", f"areaServed found on all {total} {'changed ' if partial else ''}/near/ pages")
+    elif partial and not total:
+        log_skip("SC-003", "No changed /near/ pages to check (--changed-only)")
     else:
-        log_warn("SC-003", f"areaServed only found on {area_served_count}/3 pages")
+        log_warn("SC-003", f"areaServed only found on {area_served_count}/{total} pages")
 
 # =====================================================
 # SPEC 03: Gateway Optimization Tests
 # =====================================================
 
-def test_gateway_optimization(page):
-    """Test I-79 gateway optimization"""
+def test_gateway_optimization(page, near_pages, partial=False):
+    """Test I-79 gateway optimization (`partial`: near_pages is a --changed-only subset)"""
     print("\n" + "="*60)
     print("SPEC 03: Gateway Optimization Validation")
     print("="*60)
+    results.suite("gateway")
 
-    page.goto(f"{BASE_URL}/")
-    page.wait_for_load_state("networkidle")
+    goto_ready(page, f"{BASE_URL}/")
 
     # SC-001 & SC-002: Meta description has I-79 and under 160 chars
     meta_desc = page.locator('meta[name="description"]').get_attribute("content")
@@ -291,26 +306,74 @@ def test_gateway_optimization(page):
         log_fail("HERO-I79", "Hero section missing I-79 reference above fold")
 
     # SC-008: Check /near/ pages for I-79 references
-    near_pages_with_i79 = []
-    test_pages = ["sutton-lake", "elk-river", "summersville-lake", "i79-corridor"]
-
-    for slug in test_pages:
-        page.goto(f"{BASE_URL}/near/{slug}")
-        page.wait_for_load_state("networkidle")
-        content = page.content()
-        if "I-79" in content or "I79" in content:
-            near_pages_with_i79.append(slug)
-
-    if len(near_pages_with_i79) >= 3:
-        log_pass("SC-008", f"{len(near_pages_with_i79)} /near/ pages mention I-79: {', '.join(near_pages_with_i79)}")
+    near_pages_with_i79 = [
+        path for path, visited in near_pages.items()
+        if not isinstance(visited, CrawlError) and visited["mentions_i79"]
+    ]
+
+    if partial:
+        # A count across the site can't be judged from the changed pages alone
+        log_skip("SC-008", f"Needs every /near/ page; {len(near_pages_with_i79)}/{len(near_pages)} "
+                           "changed pages mention I-79 (--changed-only)")
+    elif len(near_pages_with_i79) >= 3:
+        log_pass("SC-008", f"{len(near_pages_with_i79)}/{len(near_pages)} /near/ pages mention I-79: {', '.join(near_pages_with_i79)}")
     else:
         log_fail("SC-008", f"Only {len(near_pages_with_i79)} /near/ pages mention I-79 (need 3+)")
 
+async def visit_near_page(page, url):
+    """Collect everything SPEC 02/03 need from one /near/ page in a single pass"""
+    schemas = await async_extract_schemas(page)
+    for error in schemas.errors:
+        log_warn("JSON-LD", f"Invalid JSON-LD on {url}: {error}", page=url)
+    content = await page.content()
+    return {
+        "schemas": schemas,
+        "links": await near_links(page),
+        "mentions_i79": "I-79" in content or "I79" in content
+    }
+
+async def crawl_near_pages():
+    """Discover every /near/ page (sitemap, else a link walk) and crawl them in parallel
+
+    Returns (hub result, {path: result}, partial) - partial when --changed-only
+    crawled a subset.
+    """
+    results.suite("near-crawl")
+    pages, source = discover_pages(BASE_URL)
+    paths = [path for path in pages if path.startswith("/near/")]
+    print(f"   Discovered {len(pages)} pages from {source}, {len(paths)} under /near/")
+
+    # --dist serves on a random port, so key its state by "dist" rather than the URL
+    state = DiscoveryState("phase3a-dist" if "--dist" in sys.argv else f"phase3a-{BASE_URL}")
+    if CHANGED_ONLY:
+        paths = [path for path in state.changed(pages) if path.startswith("/near/")]
+        print(f"   --changed-only: {len(paths)} /near/ pages new or updated since the last run")
+
+    async with Crawler(concurrency=CONCURRENCY, profile=ROUTE_PROFILE) as crawler:
+        hub_url = f"{BASE_URL}/near"
+        near_hub = (await crawler.run([hub_url], visit_near_page))[hub_url]
+
+        if not paths and not CHANGED_ONLY:
+            log_warn("NEAR-DISCOVERY", "No /near/ pages discovered, using the hub's links")
+            paths = [] if isinstance(near_hub, CrawlError) else near_hub["links"]
+
+        print(f"   Crawling {len(paths)} /near/ pages ({CONCURRENCY} parallel contexts)")
+        visited = await crawler.run([f"{BASE_URL}{path}" for path in paths], visit_near_page)
+
+        crawler.router.print_summary()
+
+    near_pages = {url[len(BASE_URL):]: result for url, result in visited.items()}
+    # Pages that failed to load keep no lastmod, so the next --changed-only run retries them
+    failed = {path for path, result in near_pages.items() if isinstance(result, CrawlError)}
+    state.save({path: lastmod for path, lastmod in pages.items() if path not in failed})
+    return near_hub, near_pages, CHANGED_ONLY
+
 def test_gbp_document():
     """Test GBP-OPTIMIZATION.md exists and has required content"""
     print("\n" + "="*60)
     print("GBP Document Validation")
     print("="*60)
+    results.suite("gbp-document")
 
     gbp_path = Path("docs/GBP-OPTIMIZATION.md")
 
@@ -378,9 +441,9 @@ def test_visit_section(page):
     print("\n" + "="*60)
     print("Visit Section Validation")
     print("="*60)
+    results.suite("visit-section")
 
-    page.goto(f"{BASE_URL}/")
-    page.wait_for_load_state("networkidle")
+    goto_ready(page, f"{BASE_URL}/")
 
     # Find the Visit section
     visit_section = page.locator("#visit")
@@ -417,29 +480,34 @@ def print_summary():
     print("TEST SUMMARY")
     print("="*60)
 
-    total = len(results["passed"]) + len(results["failed"])
+    total = len(results.passed) + len(results.failed)
 
-    print(f"\nPassed: {len(results['passed'])}/{total}")
-    print(f"Failed: {len(results['failed'])}/{total}")
-    print(f"Warnings: {len(results['warnings'])}")
+    print(f"\nPassed: {len(results.passed)}/{total}")
+    print(f"Failed: {len(results.failed)}/{total}")
+    print(f"Warnings: {len(results.warnings)}")
 
-    if results["failed"]:
+    if results.failed:
         print("\n--- FAILURES ---")
-        for fail in results["failed"]:
+        for fail in results.failed:
             print(f"   {fail}")
 
-    if results["warnings"]:
+    if results.warnings:
         print("\n--- WARNINGS ---")
-        for warn in results["warnings"]:
+        for warn in results.warnings:
             print(f"   {warn}")
 
-    if results["passed"]:
+    if results.passed:
         print("\n--- PASSED ---")
-        for passed in results["passed"]:
+        for passed in results.passed:
             print(f"   {passed}")
 
+    json_path, junit_path = results.write()
+    print(f"\nResults: {json_path} ({junit_path.name}), {results.duration:.1f}s")
+    results.print_trends()
+    TRACER.report(results.run)
+
     # Exit code
-    if results["failed"]:
+    if results.failed:
         print("\n[X] OVERALL: SOME TESTS FAILED")
         return 1
     else:
@@ -455,16 +523,21 @@ def main():
     # Test GBP document first (doesn't need browser)
     test_gbp_document()
 
+    # Crawl all /near/ pages up front; SPEC 02 and SPEC 03 share the results
+    near_hub, near_pages, partial = asyncio.run(crawl_near_pages())
+    test_navigation_schema(near_hub, near_pages, partial)
+
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+        browser = launch_browser(p)
+        router = RequestRouter(PAGE_ROUTE_PROFILE)
+        page = traced(router.install(browser.new_page()))
 
         try:
             # Run all browser-based tests
             test_localbusiness_schema(page)
-            test_navigation_schema(page)
-            test_gateway_optimization(page)
+            test_gateway_optimization(page, near_pages, partial)
             test_visit_section(page)
+            router.print_summary()
 
         finally:
             browser.close()
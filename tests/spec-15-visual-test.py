@@ -1,17 +1,32 @@
 """
 SPEC-15 Ski Resort Template Visual Testing
-Tests both Snowshoe Mountain and Canaan Valley pages
+Tests every ski resort page the site serves (e.g. Snowshoe Mountain, Canaan Valley)
+
+Every ski page on the site is tested: pages are discovered from the sitemap
+(or by walking links) and kept when their slug is an adventure with
+`type: ski` in wv-wild-web/src/content/adventures/.
+
+Pages x viewports run through the viewport matrix runner: one warm browser
+context per viewport, all viewports in parallel.
 """
-from playwright.sync_api import sync_playwright
-import os
+import asyncio
+from functools import partial
 
-# Create screenshots directory
-os.makedirs('tests/screenshots/spec-15', exist_ok=True)
+from wvwo_validation.crawl import CrawlError
+from wvwo_validation.discovery import discover_pages, pages_of_type
+from wvwo_validation.rules import async_evaluate_rules
+from wvwo_validation.screenshots import ScreenshotStore
+from wvwo_validation.tracing import TRACER
+from wvwo_validation.viewport_matrix import run_matrix
 
-PAGES = [
-    ('snowshoe-mountain', 'http://localhost:4321/near/snowshoe-mountain'),
-    ('canaan-valley', 'http://localhost:4321/near/canaan-valley'),
-]
+BASE_URL = 'http://localhost:4321'
+
+def discover_ski_pages():
+    """(slug, url) for every discovered page whose adventure type is ski"""
+    pages, source = discover_pages(BASE_URL)
+    ski = pages_of_type(pages, 'ski')
+    print(f"Discovered {len(pages)} pages from {source}; {len(ski)} ski: {', '.join(ski) or 'none'}")
+    return [(path.rsplit('/', 1)[-1], BASE_URL + path) for path in ski]
 
 VIEWPORTS = [
     ('mobile', 320, 568),
@@ -19,142 +34,137 @@ VIEWPORTS = [
     ('desktop', 1280, 800),
 ]
 
-def test_ski_pages():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-
-        results = []
-
-        for page_name, url in PAGES:
-            print(f"\n{'='*60}")
-            print(f"Testing: {page_name}")
-            print(f"{'='*60}")
-
-            for viewport_name, width, height in VIEWPORTS:
-                context = browser.new_context(viewport={'width': width, 'height': height})
-                page = context.new_page()
-
-                try:
-                    # Navigate and wait for content
-                    page.goto(url, timeout=30000)
-                    page.wait_for_load_state('networkidle')
-
-                    # Take full page screenshot
-                    screenshot_path = f'tests/screenshots/spec-15/{page_name}-{viewport_name}.png'
-                    page.screenshot(path=screenshot_path, full_page=True)
-                    print(f"  [{viewport_name}] Screenshot saved: {screenshot_path}")
-
-                    # Test 1: Hero Section
-                    hero = page.locator('section').first
-                    hero_visible = hero.is_visible()
-                    print(f"  [{viewport_name}] Hero section visible: {hero_visible}")
-
-                    # Test 2: Check for elevation stats (should contain "ft" or "feet")
-                    elevation_text = page.locator('text=/\\d+.*ft|vertical|summit|base/i').first
-                    has_elevation = elevation_text.is_visible() if elevation_text.count() > 0 else False
-                    print(f"  [{viewport_name}] Elevation stats visible: {has_elevation}")
-
-                    # Test 3: Trail difficulty colors - look for trail breakdown section
-                    # Check for green (beginner), blue (intermediate), black/brown (advanced)
-                    trail_section = page.locator('text=/beginner|intermediate|advanced|expert/i').first
-                    has_trails = trail_section.is_visible() if trail_section.count() > 0 else False
-                    print(f"  [{viewport_name}] Trail breakdown visible: {has_trails}")
-
-                    # Test 4: Kim's Tips section (should have font-hand class)
-                    kims_tips = page.locator('text=/Kim.*Insider|Kim.*Tips/i')
-                    has_kims_tips = kims_tips.count() > 0 and kims_tips.first.is_visible()
-                    print(f"  [{viewport_name}] Kim's Tips visible: {has_kims_tips}")
-
-                    # Test 5: Check for required sections
-                    sections_to_check = [
-                        ('Lifts', 'text=/lifts?|chair/i'),
-                        ('Snow Conditions', 'text=/snow|conditions|snowfall/i'),
-                        ('Pricing', 'text=/pricing|ticket|pass/i'),
-                        ('Lodging', 'text=/lodging|stay|hotel/i'),
-                    ]
-
-                    for section_name, selector in sections_to_check:
-                        el = page.locator(selector).first
-                        visible = el.is_visible() if el.count() > 0 else False
-                        print(f"  [{viewport_name}] {section_name} section: {visible}")
-
-                    # Test 6: Check blue color for intermediate trails (bg-blue-700)
-                    blue_elements = page.locator('.bg-blue-700')
-                    has_blue = blue_elements.count() > 0
-                    print(f"  [{viewport_name}] Blue trail color (bg-blue-700): {has_blue}")
-
-                    # Test 7: Check WVWO aesthetic - no rounded-md/lg/xl in class attributes
-                    # Note: These patterns exist in Tailwind CSS definitions, but we check actual usage
-                    forbidden_classes = ['rounded-md', 'rounded-lg', 'rounded-xl', 'rounded-2xl', 'rounded-3xl']
-                    has_forbidden_rounded = False
-                    for fc in forbidden_classes:
-                        elements = page.locator(f'.{fc}')
-                        if elements.count() > 0:
-                            has_forbidden_rounded = True
-                            print(f"    Found {elements.count()} elements with {fc}")
-                    print(f"  [{viewport_name}] Forbidden rounded classes: {has_forbidden_rounded} (should be False)")
-
-                    results.append({
-                        'page': page_name,
-                        'viewport': viewport_name,
-                        'hero': hero_visible,
-                        'elevation': has_elevation,
-                        'trails': has_trails,
-                        'kims_tips': has_kims_tips,
-                        'blue_color': has_blue,
-                        'forbidden_rounded': has_forbidden_rounded,
-                    })
-
-                except Exception as e:
-                    print(f"  [{viewport_name}] ERROR: {e}")
-                    results.append({
-                        'page': page_name,
-                        'viewport': viewport_name,
-                        'error': str(e),
-                    })
-                finally:
-                    context.close()
-
-        browser.close()
-
-        # Summary
+SCREENSHOTS = ScreenshotStore()
+
+async def is_visible(locator):
+    """First match is visible (False when nothing matches)"""
+    return await locator.count() > 0 and await locator.first.is_visible()
+
+async def check_ski_page(page, url, viewport_name, page_names):
+    """All SPEC-15 checks for one page at one viewport; log lines are printed in order later"""
+    page_name = page_names[url]
+    log = []
+
+    # Take full page screenshot
+    shot = await SCREENSHOTS.async_capture(page, f'spec-15/{page_name}-{viewport_name}', full_page=True)
+    log.append(f"  [{viewport_name}] Screenshot: {shot['path']} ({shot['status']})")
+
+    # Test 1: Hero Section
+    hero_visible = await page.locator('section').first.is_visible()
+    log.append(f"  [{viewport_name}] Hero section visible: {hero_visible}")
+
+    # Test 2: Check for elevation stats (should contain "ft" or "feet")
+    has_elevation = await is_visible(page.locator('text=/\\d+.*ft|vertical|summit|base/i'))
+    log.append(f"  [{viewport_name}] Elevation stats visible: {has_elevation}")
+
+    # Test 3: Trail difficulty colors - look for trail breakdown section
+    # Check for green (beginner), blue (intermediate), black/brown (advanced)
+    has_trails = await is_visible(page.locator('text=/beginner|intermediate|advanced|expert/i'))
+    log.append(f"  [{viewport_name}] Trail breakdown visible: {has_trails}")
+
+    # Test 4: Kim's Tips section (should have font-hand class)
+    has_kims_tips = await is_visible(page.locator('text=/Kim.*Insider|Kim.*Tips/i'))
+    log.append(f"  [{viewport_name}] Kim's Tips visible: {has_kims_tips}")
+
+    # Test 5: Check for required sections
+    sections_to_check = [
+        ('Lifts', 'text=/lifts?|chair/i'),
+        ('Snow Conditions', 'text=/snow|conditions|snowfall/i'),
+        ('Pricing', 'text=/pricing|ticket|pass/i'),
+        ('Lodging', 'text=/lodging|stay|hotel/i'),
+    ]
+
+    for section_name, selector in sections_to_check:
+        visible = await is_visible(page.locator(selector))
+        log.append(f"  [{viewport_name}] {section_name} section: {visible}")
+
+    # Test 6: Check blue color for intermediate trails (bg-blue-700)
+    has_blue = await page.locator('.bg-blue-700').count() > 0
+    log.append(f"  [{viewport_name}] Blue trail color (bg-blue-700): {has_blue}")
+
+    # Test 7: Check WVWO aesthetic - no rounded-md/lg/xl in class attributes
+    # Note: These patterns exist in Tailwind CSS definitions, but we check actual usage
+    report = await async_evaluate_rules(page)
+    has_forbidden_rounded = not report["rounded-class"]["passed"]
+    for fc, count in report["rounded-class"]["matched"].items():
+        log.append(f"    Found {count} elements with {fc}")
+    log.append(f"  [{viewport_name}] Forbidden rounded classes: {has_forbidden_rounded} (should be False)")
+
+    return {
+        'page': page_name,
+        'viewport': viewport_name,
+        'log': log,
+        'hero': hero_visible,
+        'elevation': has_elevation,
+        'trails': has_trails,
+        'kims_tips': has_kims_tips,
+        'blue_color': has_blue,
+        'forbidden_rounded': has_forbidden_rounded,
+    }
+
+def test_ski_pages(pages):
+    """Run the matrix over `pages` [(slug, url)] and print per-page results; (passed, failed)"""
+    if not pages:
+        print(f"FAIL: no ski pages found at {BASE_URL} (is the dev server running?)")
+        return 0, 1
+    visit = partial(check_ski_page, page_names={url: name for name, url in pages})
+    matrix = asyncio.run(run_matrix([url for _, url in pages], VIEWPORTS, visit))
+
+    results = []
+    for page_name, url in pages:
         print(f"\n{'='*60}")
-        print("TEST SUMMARY")
+        print(f"Testing: {page_name}")
         print(f"{'='*60}")
 
-        passed = 0
-        failed = 0
-
-        for r in results:
-            if 'error' in r:
-                failed += 1
-                print(f"FAIL: {r['page']} @ {r['viewport']} - {r['error']}")
+        for viewport_name, _, _ in VIEWPORTS:
+            r = matrix[(url, viewport_name)]
+            if isinstance(r, CrawlError):
+                print(f"  [{viewport_name}] ERROR: {r.error}")
+                r = {'page': page_name, 'viewport': viewport_name, 'error': str(r.error)}
             else:
-                checks = [
-                    r.get('hero', False),
-                    r.get('elevation', False),
-                    r.get('trails', False),
-                    r.get('kims_tips', False),
-                    r.get('blue_color', False),
-                    not r.get('forbidden_rounded', True),  # Should be False
-                ]
-                if all(checks):
-                    passed += 1
-                    print(f"PASS: {r['page']} @ {r['viewport']}")
-                else:
-                    failed += 1
-                    failed_checks = []
-                    if not r.get('hero'): failed_checks.append('hero')
-                    if not r.get('elevation'): failed_checks.append('elevation')
-                    if not r.get('trails'): failed_checks.append('trails')
-                    if not r.get('kims_tips'): failed_checks.append('kims_tips')
-                    if not r.get('blue_color'): failed_checks.append('blue_color')
-                    if r.get('forbidden_rounded'): failed_checks.append('forbidden_rounded')
-                    print(f"FAIL: {r['page']} @ {r['viewport']} - Missing: {', '.join(failed_checks)}")
-
-        print(f"\nTotal: {passed} passed, {failed} failed")
-        return passed, failed
+                print("\n".join(r['log']))
+            results.append(r)
+
+    # Summary
+    print(f"\n{'='*60}")
+    print("TEST SUMMARY")
+    print(f"{'='*60}")
+
+    passed = 0
+    failed = 0
+
+    for r in results:
+        if 'error' in r:
+            failed += 1
+            print(f"FAIL: {r['page']} @ {r['viewport']} - {r['error']}")
+        else:
+            checks = [
+                r.get('hero', False),
+                r.get('elevation', False),
+                r.get('trails', False),
+                r.get('kims_tips', False),
+                r.get('blue_color', False),
+                not r.get('forbidden_rounded', True),  # Should be False
+            ]
+            if all(checks):
+                passed += 1
+                print(f"PASS: {r['page']} @ {r['viewport']}")
+            else:
+                failed += 1
+                failed_checks = []
+                if not r.get('hero'): failed_checks.append('hero')
+                if not r.get('elevation'): failed_checks.append('elevation')
+                if not r.get('trails'): failed_checks.append('trails')
+                if not r.get('kims_tips'): failed_checks.append('kims_tips')
+                if not r.get('blue_color'): failed_checks.append('blue_color')
+                if r.get('forbidden_rounded'): failed_checks.append('forbidden_rounded')
+                print(f"FAIL: {r['page']} @ {r['viewport']} - Missing: {', '.join(failed_checks)}")
+
+    SCREENSHOTS.print_summary()
+    TRACER.report("spec-15-visual")
+    print(f"\nTotal: {passed} passed, {failed} failed")
+    return passed, failed
 
 if __name__ == '__main__':
-    passed, failed = test_ski_pages()
+    passed, failed = test_ski_pages(discover_ski_pages())
     exit(0 if failed == 0 else 1)
@@ -12,6 +12,12 @@ import json
 import sys
 import io
 
+from wvwo_validation.browser_pool import launch_browser
+from wvwo_validation.readiness import goto_ready, wait_until_ready
+from wvwo_validation.rules import evaluate_rules
+from wvwo_validation.screenshots import ScreenshotStore
+from wvwo_validation.tracing import TRACER, traced
+
 # Fix Windows console encoding
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
@@ -27,9 +33,11 @@ def main():
         "overall_pass": True
     }
 
+    screenshots = ScreenshotStore()
+
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+        browser = launch_browser(p)
+        page = traced(browser.new_page())
 
         print("🚀 SPEC-13 Lake Template - Manual Validation")
         print("=" * 60)
@@ -37,18 +45,18 @@ def main():
 
         # Navigate and wait for page load
         print("📄 Loading page...")
-        page.goto(PREVIEW_URL)
-        page.wait_for_load_state('networkidle')
+        goto_ready(page, PREVIEW_URL)
         print("✅ Page loaded\n")
 
         # Take full page screenshot
-        page.screenshot(path='tests/screenshots/spec13-full-page.png', full_page=True)
-        print("📸 Screenshot saved: tests/screenshots/spec13-full-page.png\n")
+        shot = screenshots.capture(page, 'spec13-full-page', full_page=True)
+        print(f"📸 Screenshot: {shot['path']} ({shot['status']})\n")
 
         # =====================================================================
         # US3: HERO SECTION WITH LAKE STATS (P1)
         # =====================================================================
         print("🎯 Testing US3: Hero Section with Lake Stats")
+        TRACER.section("us3-hero")
         print("-" * 60)
 
         try:
@@ -91,6 +99,7 @@ def main():
         # US1: FISHING INFORMATION DISPLAY (P1)
         # =====================================================================
         print("🎯 Testing US1: Fishing Information Display")
+        TRACER.section("us1-fishing")
         print("-" * 60)
 
         try:
@@ -131,6 +140,7 @@ def main():
         # US2: MARINA & CAMPING FACILITIES (P2)
         # =====================================================================
         print("🎯 Testing US2: Marina & Camping Facilities")
+        TRACER.section("us2-marina")
         print("-" * 60)
 
         try:
@@ -170,6 +180,7 @@ def main():
         # US5: SAFETY & REGULATIONS (P2)
         # =====================================================================
         print("🎯 Testing US5: Safety & Regulations")
+        TRACER.section("us5-safety")
         print("-" * 60)
 
         try:
@@ -202,6 +213,7 @@ def main():
         # US4: ACTIVITIES & SEASONAL GUIDE (P3)
         # =====================================================================
         print("🎯 Testing US4: Activities & Seasonal Guide")
+        TRACER.section("us4-activities")
         print("-" * 60)
 
         try:
@@ -233,12 +245,16 @@ def main():
         # WVWO COMPLIANCE VALIDATION
         # =====================================================================
         print("🎨 Testing WVWO Compliance")
+        TRACER.section("wvwo-compliance")
         print("-" * 60)
 
+        # Every WVWO rule (classes and computed styles) in one DOM pass
+        report = evaluate_rules(page)
+
         # Check for forbidden rounded classes in DOM
-        forbidden_rounded = page.locator('[class*="rounded-md"], [class*="rounded-lg"], [class*="rounded-xl"]').count()
+        forbidden_rounded = report.count("rounded-class")
         if forbidden_rounded == 0:
-            print("  ✅ Border radius: ZERO forbidden classes (rounded-md/lg/xl)")
+            print("  ✅ Border radius: ZERO forbidden classes (rounded-md/lg/xl/2xl/3xl)")
             results["wvwo_compliance"]["border_radius"] = "PASS"
         else:
             print(f"  ❌ Border radius: Found {forbidden_rounded} violations")
@@ -246,23 +262,23 @@ def main():
             results["overall_pass"] = False
 
         # Check rounded-sm usage
-        rounded_sm_count = page.locator('[class*="rounded-sm"]').count()
+        rounded_sm_count = report.count("rounded-sm")
         print(f"  ✅ rounded-sm usage: {rounded_sm_count} elements")
 
         # Check for font-hand (Permanent Marker) on Kim's tips
-        font_hand_count = page.locator('.font-hand, [class*="font-hand"]').count()
+        font_hand_count = report.count("font-hand")
         print(f"  ✅ font-hand (Kim's tips): {font_hand_count} instances")
         results["wvwo_compliance"]["fonts"] = f"PASS ({font_hand_count} Kim's tips)"
 
         # Check for border-left accents
-        green_accents = page.locator('[class*="border-l-sign-green"]').count()
-        brown_accents = page.locator('[class*="border-l-brand-brown"]').count()
-        orange_accents = page.locator('[class*="border-l-brand-orange"]').count()
+        green_accents = report.count("accent-green")
+        brown_accents = report.count("accent-brown")
+        orange_accents = report.count("accent-orange")
         print(f"  ✅ Border accents: Green={green_accents}, Brown={brown_accents}, Orange={orange_accents}")
         results["wvwo_compliance"]["border_accents"] = f"PASS (G:{green_accents}, B:{brown_accents}, O:{orange_accents})"
 
         # Check for glassmorphism violations
-        backdrop_blur = page.locator('[class*="backdrop-blur"]').count()
+        backdrop_blur = report.count("glass-class")
         if backdrop_blur == 0:
             print("  ✅ Glassmorphism: ZERO backdrop-blur detected")
             results["wvwo_compliance"]["glassmorphism"] = "PASS"
@@ -277,26 +293,27 @@ def main():
         # RESPONSIVE TESTING
         # =====================================================================
         print("📱 Testing Responsive Layouts")
+        TRACER.section("responsive")
         print("-" * 60)
 
         # Mobile (375px)
         page.set_viewport_size({"width": 375, "height": 667})
-        page.wait_for_timeout(500)
-        page.screenshot(path='tests/screenshots/spec13-mobile.png', full_page=False)
+        wait_until_ready(page)
+        screenshots.capture(page, 'spec13-mobile', full_page=False)
         print("  ✅ Mobile (375px): Screenshot captured")
         results["responsive"]["mobile"] = "TESTED"
 
         # Tablet (768px)
         page.set_viewport_size({"width": 768, "height": 1024})
-        page.wait_for_timeout(500)
-        page.screenshot(path='tests/screenshots/spec13-tablet.png', full_page=False)
+        wait_until_ready(page)
+        screenshots.capture(page, 'spec13-tablet', full_page=False)
         print("  ✅ Tablet (768px): Screenshot captured")
         results["responsive"]["tablet"] = "TESTED"
 
         # Desktop (1280px)
         page.set_viewport_size({"width": 1280, "height": 720})
-        page.wait_for_timeout(500)
-        page.screenshot(path='tests/screenshots/spec13-desktop.png', full_page=False)
+        wait_until_ready(page)
+        screenshots.capture(page, 'spec13-desktop', full_page=False)
         print("  ✅ Desktop (1280px): Screenshot captured")
         results["responsive"]["desktop"] = "TESTED"
 
@@ -306,6 +323,7 @@ def main():
         # INTERACTIVE ELEMENTS
         # =====================================================================
         print("🖱️ Testing Interactive Elements")
+        TRACER.section("interactive")
         print("-" * 60)
 
         # Reset to desktop
@@ -336,42 +354,47 @@ def main():
         print("🎨 Validating Computed Styles (WVWO)")
         print("-" * 60)
 
-        # Check actual border-radius values in DOM
-        all_elements = page.locator('*').all()
-        max_border_radius = 0
-        violated_elements = []
-
-        # Sample first 50 visible elements for performance
-        for i, elem in enumerate(all_elements[:50]):
-            try:
-                if elem.is_visible():
-                    border_radius = elem.evaluate('el => window.getComputedStyle(el).borderRadius')
-                    if border_radius and border_radius != '0px':
-                        # Parse border-radius value (e.g., "2px" or "0.125rem")
-                        if 'px' in border_radius:
-                            px_value = float(border_radius.replace('px', '').split()[0])
-                            if px_value > 2.1:  # Allow 2px (0.125rem) + tiny margin
-                                violated_elements.append((i, border_radius))
-                            max_border_radius = max(max_border_radius, px_value)
-            except:
-                pass  # Skip elements that can't be evaluated
-
-        if len(violated_elements) == 0:
-            print(f"  ✅ Border-radius validation: All values <= 2px (max: {max_border_radius:.1f}px)")
+        # Computed-style rules came from the same single pass as the class rules
+        radius = report["rounded-computed"]
+        if radius["passed"]:
+            print(f"  ✅ Border-radius validation: All {report.elements} elements <= 2px (max: {radius['max']:.1f}px)")
             results["wvwo_compliance"]["computed_border_radius"] = "PASS"
         else:
-            print(f"  ❌ Border-radius violations: {len(violated_elements)} elements exceed 2px")
-            for idx, radius in violated_elements[:5]:  # Show first 5
-                print(f"      Element {idx}: {radius}")
-            results["wvwo_compliance"]["computed_border_radius"] = f"FAIL ({len(violated_elements)} violations)"
+            print(f"  ❌ Border-radius violations: {radius['count']} elements exceed 2px")
+            for v in radius["samples"][:5]:  # Show first 5
+                print(f"      {v['tag']}: {v['value']} - {v['classes']}")
+            results["wvwo_compliance"]["computed_border_radius"] = f"FAIL ({radius['count']} violations)"
+            results["overall_pass"] = False
+
+        fonts = report["forbidden-font"]
+        if fonts["passed"]:
+            print("  ✅ Fonts: NO forbidden fonts in computed styles")
+            results["wvwo_compliance"]["computed_fonts"] = "PASS"
+        else:
+            print(f"  ❌ Forbidden fonts on {fonts['count']} elements: {set(fonts['matched'])}")
+            results["wvwo_compliance"]["computed_fonts"] = f"FAIL ({fonts['count']} elements)"
             results["overall_pass"] = False
 
+        blur = report["glass-computed"]
+        if blur["passed"]:
+            print("  ✅ Computed backdrop-filter: no blur")
+        else:
+            print(f"  ❌ Computed backdrop-filter blur on {blur['count']} elements")
+            results["wvwo_compliance"]["computed_glassmorphism"] = f"FAIL ({blur['count']} elements)"
+            results["overall_pass"] = False
+
+        orange = report["orange-area"]
+        orange_status = "PASS" if orange["passed"] else "WARN"
+        print(f"  {'✅' if orange['passed'] else '⚠️'} Orange area: {orange['pct']:.2f}% (guideline <5%)")
+        results["wvwo_compliance"]["orange_area"] = f"{orange_status} ({orange['pct']:.2f}%)"
+
         print()
 
         # =====================================================================
         # ACCESSIBILITY QUICK CHECK
         # =====================================================================
         print("♿ Accessibility Quick Check")
+        TRACER.section("accessibility")
         print("-" * 60)
 
         # Check for semantic HTML
@@ -388,6 +411,7 @@ def main():
         print()
 
         browser.close()
+        TRACER.report("spec13-manual")
 
         # =====================================================================
         # FINAL REPORT
@@ -407,7 +431,7 @@ def main():
         print()
         print("WVWO COMPLIANCE:")
         for check, result in results["wvwo_compliance"].items():
-            status_emoji = "✅" if "PASS" in result else "❌"
+            status_emoji = "✅" if "PASS" in result else "⚠️" if "WARN" in result else "❌"
             print(f"  {status_emoji} {check}: {result}")
 
         print()
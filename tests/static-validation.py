@@ -0,0 +1,121 @@
+"""
+Static Build Validation (offline)
+=================================
+DOM-only checks straight from the built site on disk - no browser, no network,
+no dev server:
+- JSON-LD parses on every page
+- Meta description present and under 160 chars
+- WVWO class rules from the shared rule pack (wvwo_validation.rules);
+  computed-style rules need a browser and are skipped here
+
+Build first, then run from the repo root:
+    cd wv-wild-web && npm run build && cd ..
+    python tests/static-validation.py
+    python tests/static-validation.py --dist path/to/dist
+
+Results are cached per page in tests/.cache/, keyed by the page HTML, its
+linked stylesheets and the check/rule-pack versions; only changed pages are
+re-checked. Force a full run with --no-cache.
+"""
+
+import sys
+import time
+
+from wvwo_validation.html_page import HtmlPage
+from wvwo_validation.result_cache import ResultCache, StylesheetHashes, linked_stylesheets
+from wvwo_validation.results import ResultSet
+from wvwo_validation.rules import WVWO_PACK, evaluate_rules_html
+from wvwo_validation.static_site import DIST_DIR, dist_dir_from_argv, iter_pages
+
+META_DESCRIPTION_LIMIT = 160
+
+# Bump when validate_page() changes so cached results are re-checked
+CHECKS_VERSION = 1
+
+results = ResultSet("static-validation")
+
+def log_fail(test_id, message, page=None):
+    print(results.record(test_id, "FAIL", message, page=page))
+
+def log_warn(test_id, message, page=None):
+    print(results.record(test_id, "WARN", message, page=page))
+
+def validate_page(page):
+    """Run every DOM-only check on one parsed page; returns its findings"""
+    path = page.url_path
+    findings = []
+
+    for error in page.jsonld_errors:
+        findings.append(("FAIL", "JSON-LD", f"{path}: invalid JSON-LD: {error}"))
+
+    desc = page.meta_description
+    if desc is None:
+        findings.append(("WARN", "META-DESC", f"{path}: no meta description"))
+    elif len(desc) > META_DESCRIPTION_LIMIT:
+        findings.append(("FAIL", "META-DESC", f"{path}: meta description is {len(desc)} chars (over {META_DESCRIPTION_LIMIT})"))
+
+    report = evaluate_rules_html(page, WVWO_PACK)
+    for rule in report.failures():
+        findings.append(("FAIL", f"WVWO-{rule['id']}", f"{path}: {rule['count']} elements - {rule['message']}"))
+
+    return findings
+
+def main():
+    dist = dist_dir_from_argv() or DIST_DIR
+    if not (dist / "index.html").exists():
+        print(f"[X] No built site at {dist} (run: cd wv-wild-web && npm run build)")
+        return 1
+
+    print("="*60)
+    print("STATIC BUILD VALIDATION")
+    print(f"dist: {dist}")
+    print("="*60)
+
+    # Pages whose HTML, linked CSS and checks are unchanged replay their last result
+    cache = ResultCache("static-validation", enabled="--no-cache" not in sys.argv)
+    css_hashes = StylesheetHashes(dist)
+    version = f"{CHECKS_VERSION}:{WVWO_PACK['name']}@{WVWO_PACK['version']}"
+
+    start = time.perf_counter()
+    pages = 0
+    for url_path, html_file in iter_pages(dist):
+        pages += 1
+        raw = html_file.read_bytes()
+        html = raw.decode("utf-8")
+        key = cache.key(raw, [css_hashes(href) for href in linked_stylesheets(html)], version)
+
+        findings = cache.get(url_path, key)
+        if findings is None:
+            findings = validate_page(HtmlPage(html, url_path))
+            cache.put(url_path, key, findings)
+
+        for level, test_id, message in findings:
+            if level == "FAIL":
+                log_fail(test_id, message, page=url_path)
+            else:
+                log_warn(test_id, message, page=url_path)
+        if not any(level == "FAIL" for level, _, _ in findings):
+            results.record("PAGE", "PASS", "clean", page=url_path)
+    cache.save()
+    elapsed = time.perf_counter() - start
+
+    print("\n" + "="*60)
+    print("TEST SUMMARY")
+    print("="*60)
+    print(f"\nPages: {pages} in {elapsed:.2f}s ({cache.misses} checked, {cache.hits} unchanged from cache)")
+    print(f"Clean pages: {len(results.passed)}/{pages}")
+    print(f"Failures: {len(results.failed)}")
+    print(f"Warnings: {len(results.warnings)}")
+
+    json_path, junit_path = results.write()
+    print(f"Results: {json_path} ({junit_path.name})")
+    results.print_trends()
+
+    if results.failed:
+        print("\n[X] OVERALL: SOME CHECKS FAILED")
+        return 1
+    print("\n[OK] OVERALL: ALL CHECKS PASSED")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,11 @@
+"""
+Shared helpers for the Python Playwright validators in tests/.
+
+The validator scripts (phase3a-validation.py, comprehensive-spec-validation.py,
+spec13-manual-validation.py, ...) have hyphenated filenames, so anything they
+share lives here as a regular importable package.
+"""
+
+from .snapshot import PageSnapshot, SnapshotCache
+
+__all__ = ["PageSnapshot", "SnapshotCache"]
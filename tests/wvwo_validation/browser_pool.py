@@ -0,0 +1,207 @@
+"""
+Shared long-lived Chromium for the validators.
+
+Every validator used to cold-launch its own Chromium. Start one browser for
+the whole session instead and every script connects to it over CDP:
+
+    python tests/browser-pool.py start      # once per session
+    python tests/phase3a-validation.py      # connects, no launch
+    python tests/spec13-manual-validation.py
+    python tests/browser-pool.py stop
+
+In a script, launch_browser(p) replaces p.chromium.launch():
+
+    with sync_playwright() as p:
+        browser = launch_browser(p)        # pooled browser, or a local launch
+        ...
+        browser.close()                    # pooled: closes our contexts, disconnects
+
+The pool is used when its /json/version health check answers within
+HEALTH_TIMEOUT; otherwise (not started, crashed, --no-pool) the script
+launches Chromium itself as before. Set WVWO_BROWSER_POOL to use a pool at
+another address.
+
+Contexts a script leaves behind when it crashes would live as long as the
+browser, so connecting recycles them: browser contexts whose pages no client
+is attached to any more are disposed. That only happens for the pool this
+checkout started (pool_state()); a browser someone else runs at the address
+is used as is, never cleaned up.
+"""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+from .result_cache import CACHE_DIR
+
+# Not 9222: that is where developers' own Chrome usually serves remote debugging
+POOL_URL = os.environ.get("WVWO_BROWSER_POOL", "http://127.0.0.1:9347")
+STATE_FILE = CACHE_DIR / "browser-pool.json"
+PROFILE_DIR = CACHE_DIR / "browser-pool-profile"
+
+HEALTH_TIMEOUT = 1.0
+START_TIMEOUT = 15
+
+CHROMIUM_ARGS = [
+    "--headless=new",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-dev-shm-usage",
+    "--remote-debugging-address=127.0.0.1",
+]
+
+
+def health(url=POOL_URL, timeout=HEALTH_TIMEOUT):
+    """/json/version of a running pool (Browser, webSocketDebuggerUrl ...), or None"""
+    try:
+        with urllib.request.urlopen(f"{url.rstrip('/')}/json/version", timeout=timeout) as response:
+            return json.loads(response.read())
+    except (urllib.error.URLError, OSError, ValueError):
+        return None
+
+
+def _use_pool(argv=None):
+    argv = sys.argv if argv is None else argv
+    return "--no-pool" not in argv
+
+
+def owns_pool(url=POOL_URL, info=None):
+    """True if the browser at `url` is the pool start_pool() launched from this checkout
+
+    The browser's webSocketDebuggerUrl carries an id unique to each launch, so a
+    different Chromium on the same port (or a restarted one) never matches.
+    """
+    state = pool_state()
+    info = info or health(url)
+    return bool(state and info and state.get("url") == url
+                and state.get("ws") == info.get("webSocketDebuggerUrl"))
+
+
+def _stale_contexts(targets):
+    """Browser context ids whose page targets have no client attached"""
+    contexts = {}
+    for target in targets:
+        context = target.get("browserContextId")
+        if context and target.get("type") == "page":
+            contexts.setdefault(context, []).append(target.get("attached", False))
+    return [context for context, attached in contexts.items() if not any(attached)]
+
+
+def recycle_contexts(browser):
+    """Dispose abandoned contexts in a pooled (CDP-connected) sync browser; returns how many"""
+    session = browser.new_browser_cdp_session()
+    try:
+        default = session.send("Target.getBrowserContexts").get("defaultBrowserContextId")
+        stale = [c for c in _stale_contexts(session.send("Target.getTargets")["targetInfos"]) if c != default]
+        for context in stale:
+            session.send("Target.disposeBrowserContext", {"browserContextId": context})
+        return len(stale)
+    finally:
+        session.detach()
+
+
+async def async_recycle_contexts(browser):
+    """Dispose abandoned contexts in a pooled (CDP-connected) async browser; returns how many"""
+    session = await browser.new_browser_cdp_session()
+    try:
+        default = (await session.send("Target.getBrowserContexts")).get("defaultBrowserContextId")
+        targets = (await session.send("Target.getTargets"))["targetInfos"]
+        stale = [c for c in _stale_contexts(targets) if c != default]
+        for context in stale:
+            await session.send("Target.disposeBrowserContext", {"browserContextId": context})
+        return len(stale)
+    finally:
+        await session.detach()
+
+
+def launch_browser(p, headless=True, url=POOL_URL):
+    """Sync Playwright: the pooled browser if one is healthy, else a fresh local launch"""
+    info = health(url) if _use_pool() else None
+    if info:
+        browser = p.chromium.connect_over_cdp(url)
+        recycled = recycle_contexts(browser) if owns_pool(url, info) else 0
+        print(f"[POOL] Connected to shared browser at {url}"
+              + (f" (recycled {recycled} abandoned contexts)" if recycled else ""))
+        return browser
+    return p.chromium.launch(headless=headless)
+
+
+async def async_launch_browser(p, headless=True, url=POOL_URL):
+    """Async Playwright: the pooled browser if one is healthy, else a fresh local launch"""
+    info = health(url) if _use_pool() else None
+    if info:
+        browser = await p.chromium.connect_over_cdp(url)
+        recycled = await async_recycle_contexts(browser) if owns_pool(url, info) else 0
+        print(f"[POOL] Connected to shared browser at {url}"
+              + (f" (recycled {recycled} abandoned contexts)" if recycled else ""))
+        return browser
+    return await p.chromium.launch(headless=headless)
+
+
+def _port(url):
+    return int(url.rstrip("/").rsplit(":", 1)[-1])
+
+
+def start_pool(executable, url=POOL_URL):
+    """Launch a detached Chromium serving CDP at `url`; returns its /json/version"""
+    info = health(url)
+    if info:
+        return info
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    args = [executable, *CHROMIUM_ARGS, f"--remote-debugging-port={_port(url)}",
+            f"--user-data-dir={PROFILE_DIR}", "about:blank"]
+    # Detached so the browser outlives this process (and its console on Windows)
+    if os.name == "nt":
+        flags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        process = subprocess.Popen(args, creationflags=flags, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        process = subprocess.Popen(args, start_new_session=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        info = health(url)
+        if info:
+            STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            STATE_FILE.write_text(json.dumps({"pid": process.pid, "url": url, "ws": info.get("webSocketDebuggerUrl"),
+                                              "started": time.time()}), encoding="utf-8")
+            return info
+        if process.poll() is not None:
+            break
+        time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"Chromium did not start serving CDP at {url}")
+
+
+def pool_state():
+    """{"pid", "url", "ws", "started"} of the pool this checkout started, or None"""
+    try:
+        return json.loads(STATE_FILE.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def stop_pool():
+    """Terminate the pool started by start_pool(); False if it was not running
+
+    The recorded pid is only signalled while the browser at the recorded address
+    is still that launch (owns_pool()). A state file left by a pool that died is
+    just removed: its pid may belong to an unrelated process by now.
+    """
+    state = pool_state()
+    if not state:
+        return False
+    stopped = False
+    if owns_pool(state.get("url")):
+        try:
+            os.kill(state["pid"], signal.SIGTERM)
+            stopped = True
+        except OSError:
+            pass  # exited since the health check
+    STATE_FILE.unlink(missing_ok=True)
+    return stopped
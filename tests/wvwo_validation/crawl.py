@@ -0,0 +1,110 @@
+"""
+Parallel multi-URL crawl engine.
+
+Fans a list of URLs out over a pool of browser contexts with the async
+Playwright API. Each context owns one page and pulls URLs from a shared queue,
+so a crawl over N pages takes roughly N / concurrency page loads of wall time.
+
+    async with Crawler(concurrency=6) as crawler:
+        results = await crawler.run(urls, visit)
+
+visit(page, url) is an async callable that runs once the page is ready (see
+readiness.py) and returns whatever the caller wants to keep for that URL. A URL whose load or
+visit raised maps to a CrawlError instead.
+
+Pass a routing profile (see routing.py) to crawl asset-free, e.g.
+Crawler(profile="dom") for schema and link checks.
+"""
+
+import asyncio
+
+from playwright.async_api import async_playwright
+
+from .browser_pool import async_launch_browser
+from .readiness import GOTO_WAIT_UNTIL, async_goto_ready
+from .routing import RequestRouter
+from .tracing import traced
+
+DEFAULT_CONCURRENCY = 6
+
+# Every same-site link under /near/, as pathnames without trailing slashes
+NEAR_LINKS_JS = """() => Array.from(
+    new Set(
+        Array.from(document.querySelectorAll('a[href]'), a => a.href)
+            .map(href => new URL(href, location.href))
+            .filter(u => u.origin === location.origin && u.pathname.startsWith('/near/'))
+            .map(u => u.pathname.replace(/\\/+$/, ''))
+            .filter(path => path !== '/near')
+    )
+)"""
+
+
+class CrawlError:
+    """Stands in for a visit result when loading or visiting a URL failed"""
+
+    def __init__(self, url, error):
+        self.url = url
+        self.error = error
+
+    def __str__(self):
+        return f"{self.url}: {self.error}"
+
+
+class Crawler:
+    """Async browser with a fixed pool of contexts shared by successive runs"""
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, wait_until=GOTO_WAIT_UNTIL, timeout=30000,
+                 profile="full"):
+        self.concurrency = max(1, concurrency)
+        self.wait_until = wait_until
+        self.timeout = timeout
+        self.router = RequestRouter(profile)
+        self._playwright = None
+        self._browser = None
+        self._contexts = []
+
+    async def __aenter__(self):
+        self._playwright = await async_playwright().start()
+        self._browser = await async_launch_browser(self._playwright)
+        self._contexts = [await self._browser.new_context() for _ in range(self.concurrency)]
+        for context in self._contexts:
+            await self.router.async_install(context)
+        return self
+
+    async def __aexit__(self, *exc):
+        for context in self._contexts:
+            await context.close()
+        await self._browser.close()
+        await self._playwright.stop()
+
+    async def run(self, urls, visit):
+        """Visit every URL once; returns {url: result} in input order"""
+        queue = asyncio.Queue()
+        for url in dict.fromkeys(urls):
+            queue.put_nowait(url)
+        results = {}
+
+        async def worker(context):
+            page = traced(await context.new_page())
+            try:
+                while True:
+                    try:
+                        url = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    try:
+                        await async_goto_ready(page, url, timeout=self.timeout, wait_until=self.wait_until)
+                        results[url] = await visit(page, url)
+                    except Exception as e:
+                        results[url] = CrawlError(url, e)
+            finally:
+                await page.close()
+
+        workers = self._contexts[:queue.qsize()]
+        await asyncio.gather(*(worker(context) for context in workers))
+        return {url: results[url] for url in dict.fromkeys(urls)}
+
+
+async def near_links(page):
+    """/near/ pathnames linked from the loaded page (e.g. the /near hub)"""
+    return await page.evaluate(NEAR_LINKS_JS)
@@ -0,0 +1,211 @@
+"""
+Site page discovery.
+
+Validators get their URL lists from the site itself, not from hard-coded
+lists, so a new adventure page is validated as soon as it ships:
+
+    pages, source = discover_pages(BASE_URL)      # {path: lastmod or None}
+    near = [p for p in pages if p.startswith("/near/")]
+
+discover_pages() reads /sitemap-index.xml (the @astrojs/sitemap index) or
+/sitemap.xml, following child sitemaps. Sitemap <loc>s point at the production
+domain, so only their paths are kept and they are re-based on whatever
+BASE_URL is under test (preview, dev server or --dist). If there is no
+sitemap, or it lists nothing under /near (the dev server only serves the
+hand-written static sitemap), it also walks same-site links breadth-first
+from / and /near with a bounded pool of fetchers. Both sources are deduped
+on the normalised path.
+
+For incremental re-crawls, DiscoveryState remembers each path's sitemap
+lastmod between runs; changed() returns only new or updated pages.
+"""
+
+import json
+import os
+import re
+import urllib.error
+import urllib.request
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+from .html_page import HtmlPage
+from .result_cache import CACHE_DIR
+
+SITEMAP_PATHS = ("/sitemap-index.xml", "/sitemap.xml")
+SEED_PATHS = ("/", "/near")
+ADVENTURES_DIR = Path(__file__).resolve().parents[2] / "wv-wild-web" / "src" / "content" / "adventures"
+
+DEFAULT_WORKERS = 8
+MAX_PAGES = 1000
+MAX_SITEMAPS = 50
+FETCH_TIMEOUT = 15
+
+# Paths that are files rather than pages
+_ASSET_RE = re.compile(r"\.(?:xml|txt|json|pdf|png|jpe?g|gif|webp|avif|svg|ico|css|js|woff2?|mp4|webm|zip)$", re.IGNORECASE)
+_FRONTMATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---", re.DOTALL)
+_FIELD_RE = r'^{}:\s*["\']?([\w-]+)'
+
+
+def normalize_path(url):
+    """Site path for a URL or path: no query/fragment, no trailing slash (except /)"""
+    path = urlsplit(url).path or "/"
+    path = re.sub(r"/{2,}", "/", path)
+    if path.endswith("/index.html"):
+        path = path[:-len("index.html")]
+    return path.rstrip("/") or "/"
+
+
+def fetch(url, timeout=FETCH_TIMEOUT):
+    """(body bytes, content type, final URL after redirects); (None, None, url) on error"""
+    request = urllib.request.Request(url, headers={"User-Agent": "wvwo-validation"})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.read(), response.headers.get_content_type(), response.geturl()
+    except (urllib.error.URLError, OSError, ValueError):
+        return None, None, url
+
+
+def parse_sitemap(xml):
+    """("index", [child sitemap locs]) or ("urlset", [(loc, lastmod)]) from sitemap XML"""
+    root = ET.fromstring(xml)
+    tag = root.tag.rsplit("}", 1)[-1]
+    if tag == "sitemapindex":
+        return "index", [loc.text.strip() for loc in root.iterfind("{*}sitemap/{*}loc") if loc.text]
+    entries = []
+    for url in root.iterfind("{*}url"):
+        loc = url.find("{*}loc")
+        lastmod = url.find("{*}lastmod")
+        if loc is not None and loc.text:
+            entries.append((loc.text.strip(), lastmod.text.strip() if lastmod is not None and lastmod.text else None))
+    return "urlset", entries
+
+
+def sitemap_pages(base_url):
+    """{path: lastmod} from the site's sitemap(s); empty when there is none"""
+    pages = {}
+    queue = [base_url.rstrip("/") + path for path in SITEMAP_PATHS]
+    seen = set()
+    while queue and len(seen) < MAX_SITEMAPS:
+        url = queue.pop(0)
+        # Child sitemap locs use the production domain too; re-base them
+        url = base_url.rstrip("/") + urlsplit(url).path
+        if url in seen:
+            continue
+        seen.add(url)
+        body, _, _ = fetch(url)
+        if body is None:
+            continue
+        try:
+            kind, entries = parse_sitemap(body)
+        except ET.ParseError:
+            continue
+        if kind == "index":
+            queue.extend(entries)
+        else:
+            for loc, lastmod in entries:
+                path = normalize_path(loc)
+                # The same page can appear in both sitemaps; keep the newest lastmod
+                if path not in pages or (lastmod or "") > (pages[path] or ""):
+                    pages[path] = lastmod
+    return pages
+
+
+def link_pages(base_url, seeds=SEED_PATHS, workers=DEFAULT_WORKERS, max_pages=MAX_PAGES):
+    """{path: None} for every same-site page reachable from the seeds"""
+    base_url = base_url.rstrip("/")
+    origin = urlsplit(base_url).netloc
+    found = {}
+    frontier = list(dict.fromkeys(normalize_path(seed) for seed in seeds))
+    queued = set(frontier)
+
+    def visit(path):
+        body, content_type, final_url = fetch(base_url + path)
+        if body is None or content_type != "text/html":
+            return path, False, []
+        links = []
+        for href in HtmlPage(body.decode("utf-8", "replace"), path).links:
+            # Relative hrefs resolve against the served URL (/near -> /near/)
+            target = urlsplit(urljoin(final_url, href))
+            if target.scheme in ("http", "https") and target.netloc == origin:
+                links.append(normalize_path(target.path))
+        return path, True, links
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while frontier and len(found) < max_pages:
+            next_frontier = []
+            for path, is_page, links in pool.map(visit, frontier):
+                if not is_page:
+                    continue
+                found[path] = None
+                for link in links:
+                    if link not in queued and not _ASSET_RE.search(link):
+                        queued.add(link)
+                        next_frontier.append(link)
+            frontier = next_frontier[:max_pages - len(found)]
+    return found
+
+
+def _covers_seeds(pages, seeds=SEED_PATHS):
+    """Sitemap lists something under every non-root seed (e.g. /near/...)"""
+    return all(any(path.startswith(seed.rstrip("/") + "/") for path in pages)
+               for seed in seeds if seed != "/")
+
+
+def discover_pages(base_url, workers=DEFAULT_WORKERS, max_pages=MAX_PAGES):
+    """({path: lastmod or None}, source) sorted by path; source is "sitemap", "links" or "sitemap+links" """
+    pages, source = sitemap_pages(base_url), "sitemap"
+    if not _covers_seeds(pages):
+        # No sitemap, or only the hand-written static one (astro dev serves
+        # /sitemap.xml but not the generated index): walk the links as well
+        walked = link_pages(base_url, workers=workers, max_pages=max_pages)
+        source = "sitemap+links" if pages else "links"
+        pages = {**walked, **pages}
+    pages = {path: pages[path] for path in sorted(pages) if not _ASSET_RE.search(path)}
+    return pages, source
+
+
+def adventure_types(directory=ADVENTURES_DIR):
+    """{slug: type} from the adventures content collection's frontmatter"""
+    types = {}
+    for md in sorted(Path(directory).glob("*.md")):
+        match = _FRONTMATTER_RE.match(md.read_text(encoding="utf-8"))
+        if not match:
+            continue
+        frontmatter = match.group(1)
+        kind = re.search(_FIELD_RE.format("type"), frontmatter, re.MULTILINE)
+        slug = re.search(_FIELD_RE.format("slug"), frontmatter, re.MULTILINE)
+        if kind:
+            types[slug.group(1) if slug else md.stem] = kind.group(1)
+    return types
+
+
+def pages_of_type(pages, adventure_type, types=None):
+    """Discovered paths whose last segment is an adventure slug of that type"""
+    types = adventure_types() if types is None else types
+    return [path for path in pages if types.get(path.rsplit("/", 1)[-1]) == adventure_type]
+
+
+class DiscoveryState:
+    """Sitemap lastmods from the previous run, for crawling only what changed"""
+
+    def __init__(self, namespace, cache_dir=CACHE_DIR):
+        # Namespaces usually embed a base URL; keep the file name portable
+        namespace = re.sub(r"[^\w.-]+", "-", namespace).strip("-")
+        self.path = Path(cache_dir) / f"discovery-{namespace}.json"
+        try:
+            self.lastmods = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            self.lastmods = {}
+
+    def changed(self, pages):
+        """Paths that are new, have a different lastmod, or have no lastmod at all"""
+        return [path for path, lastmod in pages.items()
+                if lastmod is None or self.lastmods.get(path) != lastmod]
+
+    def save(self, pages):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(pages, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
@@ -0,0 +1,307 @@
+"""
+External link liveness.
+
+Checks outbound links (recreation.gov, wvdnr.gov, Google Maps, state park
+sites) in one batched asyncio pass, politely:
+
+- one keep-alive connection pool per host (at most PER_HOST_CONNECTIONS open)
+- at most REQUESTS_PER_SECOND requests per host, however many links point there
+- HEAD first; GET (body read only up to GET_READ_LIMIT) when a server rejects
+  HEAD or errors on it
+- redirects followed up to MAX_REDIRECTS, Retry-After honoured once on 429/503
+- results cached on disk for CACHE_TTL (FAILURE_TTL for failures), so re-runs
+  only re-check what is new or due
+
+    checker = ExternalLinkChecker()
+    results = checker.check(["https://wvdnr.gov/", ...])   # {url: result dict}
+    checker.cache.save()
+
+Each result has status, final_url, method, error and a verdict: "ok",
+"broken" (404/410, DNS failure, refused) or "unverified" (bot walls, rate
+limits, timeouts - worth a look, not a failure).
+
+Stdlib only (http.client + asyncio; the blocking requests run in worker
+threads). Plain http:// URLs work too, so it can be pointed at a local stub
+server:
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    ExternalLinkChecker(cache=LinkStatusCache(enabled=False)).check([f"http://127.0.0.1:{port}/gone"])
+"""
+
+import asyncio
+import http.client
+import json
+import os
+import socket
+import ssl
+import time
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+from .result_cache import CACHE_DIR
+
+PER_HOST_CONNECTIONS = 2
+REQUESTS_PER_SECOND = 2.0
+MAX_CONCURRENCY = 16
+TIMEOUT = 10
+MAX_REDIRECTS = 5
+MAX_RETRY_AFTER = 10
+GET_READ_LIMIT = 64 * 1024
+
+CACHE_TTL = 24 * 3600
+FAILURE_TTL = 3600
+
+# Some agency sites reject HEAD outright or answer it differently from GET
+HEAD_FALLBACK_STATUSES = {400, 403, 404, 405, 406, 429, 500, 501, 503}
+BROKEN_STATUSES = {404, 410}
+RETRY_STATUSES = {429, 503}
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; wvwo-link-check)",
+    "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
+}
+
+
+def verdict(status, error):
+    """"ok", "broken" or "unverified" for one checked link"""
+    if error:
+        # Name resolution and refused connections mean the site is gone;
+        # timeouts and TLS trouble may be transient
+        return "broken" if error.startswith(("dns:", "refused:")) else "unverified"
+    if status < 400:
+        return "ok"
+    return "broken" if status in BROKEN_STATUSES else "unverified"
+
+
+class LinkStatusCache:
+    """JSON file of {url: result} with per-entry check time, expired by TTL"""
+
+    def __init__(self, path=None, ttl=CACHE_TTL, failure_ttl=FAILURE_TTL, enabled=True):
+        self.path = Path(path) if path else CACHE_DIR / "external-links.json"
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.enabled = enabled
+        self.hits = 0
+        self._entries = {}
+        if enabled:
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                self._entries = {}
+
+    def get(self, url):
+        entry = self._entries.get(url) if self.enabled else None
+        if entry is None:
+            return None
+        ttl = self.ttl if entry["verdict"] == "ok" else self.failure_ttl
+        if time.time() - entry["checked"] > ttl:
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, url, result):
+        self._entries[url] = result
+
+    def save(self):
+        if not self.enabled:
+            return
+        # Drop entries nobody could read back any more
+        now = time.time()
+        keep = max(self.ttl, self.failure_ttl)
+        entries = {url: e for url, e in self._entries.items() if now - e["checked"] <= keep}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(entries, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+class _HostPool:
+    """Idle keep-alive connections and the request clock for one scheme://host:port"""
+
+    def __init__(self, scheme, netloc, size, interval, timeout, ssl_context):
+        self.scheme = scheme
+        self.netloc = netloc
+        self.slots = asyncio.Semaphore(size)
+        self.interval = interval
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self.idle = []
+        self.opened = 0
+        self._clock = asyncio.Lock()
+        self._next_at = 0.0
+
+    async def throttle(self):
+        """Space request starts on this host at least `interval` apart"""
+        async with self._clock:
+            loop = asyncio.get_running_loop()
+            wait = self._next_at - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_at = loop.time() + self.interval
+
+    def acquire(self):
+        """(connection, reused) - an idle one if there is one"""
+        if self.idle:
+            return self.idle.pop(), True
+        self.opened += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.netloc, timeout=self.timeout, context=self.ssl_context), False
+        return http.client.HTTPConnection(self.netloc, timeout=self.timeout), False
+
+    def release(self, conn, reusable):
+        if reusable:
+            self.idle.append(conn)
+        else:
+            conn.close()
+
+    def close(self):
+        for conn in self.idle:
+            conn.close()
+        self.idle.clear()
+
+
+def _request(conn, method, target):
+    """Blocking request on `conn`: (status, headers, reusable)"""
+    conn.request(method, target, headers=HEADERS)
+    response = conn.getresponse()
+    response.read(GET_READ_LIMIT if method == "GET" else None)
+    # A GET body longer than the limit is left unread; that connection can't be reused
+    reusable = response.isclosed() and not response.will_close
+    return response.status, response.headers, reusable
+
+
+def _error_label(exc):
+    if isinstance(exc, socket.gaierror):
+        return f"dns: {exc}"
+    if isinstance(exc, ConnectionRefusedError):
+        return f"refused: {exc}"
+    if isinstance(exc, (socket.timeout, TimeoutError)):
+        return "timeout"
+    if isinstance(exc, ssl.SSLError):
+        return f"tls: {exc}"
+    return f"{type(exc).__name__}: {exc}"
+
+
+class ExternalLinkChecker:
+    """Checks many absolute URLs concurrently, pooled and rate-limited per host"""
+
+    def __init__(self, per_host=PER_HOST_CONNECTIONS, requests_per_second=REQUESTS_PER_SECOND,
+                 concurrency=MAX_CONCURRENCY, timeout=TIMEOUT, cache=None):
+        self.per_host = per_host
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.cache = cache if cache is not None else LinkStatusCache()
+        self.requests = 0
+        self.connections = 0
+        self.fresh = {}             # {url: result} checked over the network, not read from the cache
+        self._ssl_context = ssl.create_default_context()
+        self._pools = {}
+        self._global = None
+
+    def _pool(self, scheme, netloc):
+        key = (scheme, netloc.lower())
+        if key not in self._pools:
+            self._pools[key] = _HostPool(scheme, netloc, self.per_host, self.interval,
+                                         self.timeout, self._ssl_context)
+        return self._pools[key]
+
+    async def _fetch(self, url, method):
+        """One request through the host's pool: (status, headers) or raises"""
+        parts = urlsplit(url)
+        pool = self._pool(parts.scheme, parts.netloc)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        async with pool.slots:
+            await pool.throttle()
+            async with self._global:
+                for attempt in range(2):
+                    conn, reused = pool.acquire()
+                    self.requests += 1
+                    try:
+                        status, headers, reusable = await asyncio.to_thread(_request, conn, method, target)
+                    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                        conn.close()
+                        if reused and attempt == 0:
+                            continue  # keep-alive connection went stale; retry on a fresh one
+                        raise
+                    except Exception:
+                        conn.close()
+                        raise
+                    pool.release(conn, reusable)
+                    return status, headers
+
+    async def _check_one(self, url):
+        current, method, status, error = url, "HEAD", 0, None
+        retried = False
+        for _ in range(MAX_REDIRECTS + 1):
+            try:
+                status, headers = await self._fetch(current, method)
+            except Exception as exc:
+                if method == "HEAD":
+                    method = "GET"
+                    continue
+                error = _error_label(exc)
+                break
+            if method == "HEAD" and status in HEAD_FALLBACK_STATUSES:
+                method = "GET"
+                status, headers = await self._retry_get(current)
+                if status is None:
+                    error = headers
+                    break
+            if status in RETRY_STATUSES and not retried and headers.get("Retry-After", "").isdigit():
+                retried = True
+                await asyncio.sleep(min(int(headers["Retry-After"]), MAX_RETRY_AFTER))
+                continue
+            location = headers.get("Location")
+            if 300 <= status < 400 and location:
+                current = urljoin(current, location)
+                continue
+            break
+        else:
+            error = f"more than {MAX_REDIRECTS} redirects"
+        return {
+            "url": url,
+            "status": status,
+            "final_url": current,
+            "method": method,
+            "error": error,
+            "verdict": verdict(status, error),
+            "checked": time.time(),
+        }
+
+    async def _retry_get(self, url):
+        """GET after a rejected HEAD: (status, headers) or (None, error label)"""
+        try:
+            return await self._fetch(url, "GET")
+        except Exception as exc:
+            return None, _error_label(exc)
+
+    async def check_all(self, urls):
+        """{url: result} for every http(s) URL, cached results included"""
+        self._global = asyncio.Semaphore(self.concurrency)
+        results, pending = {}, []
+        for url in dict.fromkeys(urls):
+            if urlsplit(url).scheme not in ("http", "https"):
+                continue
+            cached = self.cache.get(url)
+            if cached is not None:
+                results[url] = cached
+            else:
+                pending.append(url)
+        try:
+            for result in await asyncio.gather(*(self._check_one(url) for url in pending)):
+                results[result["url"]] = result
+                self.fresh[result["url"]] = result
+                self.cache.put(result["url"], result)
+        finally:
+            for pool in self._pools.values():
+                self.connections += pool.opened
+                pool.close()
+            self._pools = {}
+        return results
+
+    def check(self, urls):
+        """Sync wrapper around check_all()"""
+        return asyncio.run(self.check_all(urls))
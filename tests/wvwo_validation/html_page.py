@@ -0,0 +1,82 @@
+"""
+Browserless HTML parse for DOM-only checks.
+
+HtmlPage reads a built page once with the stdlib HTMLParser and keeps what the
+DOM-only validators need: title, meta description, JSON-LD script bodies,
+<a href> targets, element ids (anchor targets) and every element's class
+attribute (rules.evaluate_rules_html matches those with the same
+[class*="..."] semantics the browser validators use).
+
+Only the static HTML is seen - content rendered client-side by React islands
+is invisible here and still needs a browser check.
+"""
+
+from html.parser import HTMLParser
+from pathlib import Path
+
+from .schema import SchemaIndex
+
+
+class _PageParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.meta = {}
+        self.jsonld_texts = []
+        self.class_attrs = []
+        self.links = []
+        self.ids = []
+        self._capture = None
+        self._buffer = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if attrs.get("class"):
+            self.class_attrs.append(attrs["class"])
+        if attrs.get("id"):
+            self.ids.append(attrs["id"])
+        if tag == "a" and attrs.get("name"):
+            self.ids.append(attrs["name"])  # legacy <a name> anchors
+        if tag == "a" and attrs.get("href"):
+            self.links.append(attrs["href"])
+        elif tag == "meta" and attrs.get("name"):
+            self.meta.setdefault(attrs["name"].lower(), attrs.get("content") or "")
+        elif tag == "title":
+            self._capture, self._buffer = "title", []
+        elif tag == "script" and (attrs.get("type") or "").lower() == "application/ld+json":
+            self._capture, self._buffer = "jsonld", []
+
+    def handle_data(self, data):
+        if self._capture:
+            self._buffer.append(data)
+
+    def handle_endtag(self, tag):
+        if self._capture == "title" and tag == "title":
+            self.title = "".join(self._buffer).strip()
+            self._capture = None
+        elif self._capture == "jsonld" and tag == "script":
+            self.jsonld_texts.append("".join(self._buffer))
+            self._capture = None
+
+
+class HtmlPage:
+    """One built page, parsed once"""
+
+    def __init__(self, html, url_path=""):
+        parser = _PageParser()
+        parser.feed(html)
+        parser.close()
+        self.url_path = url_path
+        self.html = html
+        self.title = parser.title
+        self.meta_description = parser.meta.get("description")
+        self.class_attrs = parser.class_attrs
+        self.links = parser.links
+        self.ids = parser.ids
+        self.schemas = SchemaIndex.from_texts(parser.jsonld_texts)
+        self.jsonld = self.schemas.schemas
+        self.jsonld_errors = self.schemas.errors
+
+    @classmethod
+    def from_file(cls, path, url_path=""):
+        return cls(Path(path).read_text(encoding="utf-8"), url_path)
@@ -0,0 +1,193 @@
+"""
+Image optimization audit.
+
+Compares every <img>'s intrinsic size with the size it renders at, per
+viewport, and flags what the BLUEPRINT asks for (WebP, lazy loading,
+srcset) but a page does not do:
+
+- "oversized" - more pixels than the rendered box needs at the page's DPR;
+  the extra share of the file is wasted bytes
+- "format"    - JPEG/PNG/GIF where WebP/AVIF would do (estimated saving)
+- "eager"     - below the fold at load but not loading="lazy"
+- "lazy-lcp"  - above the fold but loading="lazy" (delays LCP)
+- "srcset"    - wide image with one fixed source, or w-descriptor srcset
+                without sizes (browser then assumes 100vw)
+
+Collection is one evaluate() after a scroll pass that lets lazy images load
+(which images were above the fold is recorded first):
+
+    images = await async_collect_images(page)     # or collect_images(page)
+    findings, savings = analyze_images(images)
+
+With run_matrix(), collect at each viewport and merge with page_savings():
+one file is served to every visitor, so a page's saving is the worst case
+over viewports, not the sum.
+"""
+
+import re
+from urllib.parse import parse_qs, urlsplit
+
+from .readiness import async_wait_until_ready, wait_until_ready
+
+# Viewports for the audit, with the DPR phones and tablets actually have
+AUDIT_VIEWPORTS = [
+    ("mobile", 375, 812),
+    ("tablet", 768, 1024),
+    ("desktop", 1280, 800),
+]
+AUDIT_DPR = {"mobile": 2, "tablet": 2, "desktop": 1}
+
+MODERN_FORMATS = {"webp", "avif", "svg"}
+
+# Rough share of a JPEG/PNG/GIF a WebP encode saves (no re-encoding here)
+WEBP_SAVINGS = {"jpeg": 0.3, "png": 0.5, "gif": 0.5}
+
+# Ignore savings below this (Lighthouse's threshold too)
+MIN_WASTED_BYTES = 4096
+
+# Without byte counts (cross-origin, no Timing-Allow-Origin), flag images
+# carrying this many times the pixels they need
+OVERSIZE_PIXEL_RATIO = 4
+
+# Images rendered at least this wide (CSS px) should offer a srcset
+SRCSET_MIN_WIDTH = 300
+
+# Runs before the scroll pass: which images are in the first viewport at load
+ABOVE_FOLD_JS = """() => Array.from(document.images).map(img => {
+    const r = img.getBoundingClientRect();
+    return r.width > 0 && r.top < innerHeight && r.bottom > 0;
+})"""
+
+# Step through the page so lazy images load, then return to the top
+SCROLL_LOAD_JS = """async () => {
+    const step = Math.max(200, innerHeight * 0.8);
+    for (let y = 0; y < document.documentElement.scrollHeight; y += step) {
+        scrollTo(0, y);
+        await new Promise(resolve => requestAnimationFrame(() => setTimeout(resolve, 50)));
+    }
+    scrollTo(0, 0);
+}"""
+
+IMAGES_JS = """() => {
+    const bytes = {};
+    for (const r of performance.getEntriesByType('resource')) bytes[r.name] = r.encodedBodySize || null;
+    return Array.from(document.images).map((img, index) => {
+        const r = img.getBoundingClientRect();
+        const src = img.currentSrc || img.src;
+        return {
+            index,
+            src,
+            natural_width: img.naturalWidth,
+            natural_height: img.naturalHeight,
+            width: Math.round(r.width),
+            height: Math.round(r.height),
+            dpr: devicePixelRatio,
+            loading: img.getAttribute('loading'),
+            srcset: img.getAttribute('srcset'),
+            sizes: img.getAttribute('sizes'),
+            in_picture: img.parentElement?.tagName === 'PICTURE',
+            bytes: bytes[src] ?? null,
+        };
+    });
+}"""
+
+
+def collect_images(page):
+    """Sync page (already loaded): every <img> with sizes, attributes and bytes"""
+    above = page.evaluate(ABOVE_FOLD_JS)
+    page.evaluate(SCROLL_LOAD_JS)
+    wait_until_ready(page)
+    return _merge_fold(page.evaluate(IMAGES_JS), above)
+
+
+async def async_collect_images(page):
+    """Async page (already loaded): every <img> with sizes, attributes and bytes"""
+    above = await page.evaluate(ABOVE_FOLD_JS)
+    await page.evaluate(SCROLL_LOAD_JS)
+    await async_wait_until_ready(page)
+    return _merge_fold(await page.evaluate(IMAGES_JS), above)
+
+
+def _merge_fold(images, above):
+    for image in images:
+        image["above_fold"] = image["index"] < len(above) and above[image["index"]]
+    return images
+
+
+def image_format(url):
+    """jpeg/png/gif/webp/avif/svg from a data: URI, Astro's /_image?f= or the extension"""
+    if url.startswith("data:"):
+        match = re.match(r"data:image/([\w+]+)", url)
+        kind = match.group(1) if match else ""
+    else:
+        parts = urlsplit(url)
+        kind = (parse_qs(parts.query).get("f") or [""])[0]
+        if not kind and "." in parts.path.rsplit("/", 1)[-1]:
+            kind = parts.path.rsplit(".", 1)[-1]
+    kind = kind.lower()
+    return {"jpg": "jpeg", "svg+xml": "svg"}.get(kind, kind)
+
+
+def _label(image):
+    src = image["src"]
+    if src.startswith("data:"):
+        return f"img #{image['index']} (inline)"
+    return f"img #{image['index']} {urlsplit(src).path.rsplit('/', 1)[-1][:60]}"
+
+
+def analyze_images(images):
+    """([(kind, message, index, wasted bytes)], total wasted bytes) for one page at one viewport"""
+    findings = []
+    total = 0
+    for image in images:
+        if not image["src"] or not image["natural_width"]:
+            continue  # not loaded or no source
+        label = _label(image)
+        kind = image_format(image["src"])
+        wasted = 0
+
+        if kind != "svg" and image["width"] and image["height"]:
+            needed = (image["width"] * image["dpr"]) * (image["height"] * image["dpr"])
+            natural = image["natural_width"] * image["natural_height"]
+            if natural > needed:
+                share = 1 - needed / natural
+                if image["bytes"]:
+                    resize_waste = round(image["bytes"] * share)
+                    if resize_waste >= MIN_WASTED_BYTES:
+                        wasted += resize_waste
+                        findings.append(("oversized", f"{label}: {image['natural_width']}x{image['natural_height']} "
+                                         f"shown at {image['width']}x{image['height']} @{image['dpr']}x, "
+                                         f"~{resize_waste / 1024:.0f}KB wasted", image["index"], resize_waste))
+                elif natural >= needed * OVERSIZE_PIXEL_RATIO:
+                    findings.append(("oversized", f"{label}: {image['natural_width']}x{image['natural_height']} "
+                                     f"shown at {image['width']}x{image['height']} @{image['dpr']}x "
+                                     f"(size unknown)", image["index"], 0))
+
+        if kind in WEBP_SAVINGS:
+            # Applied to what is left after resizing, so savings don't double count
+            format_waste = round(((image["bytes"] or 0) - wasted) * WEBP_SAVINGS[kind])
+            wasted += format_waste if format_waste >= MIN_WASTED_BYTES else 0
+            saving = f", ~{format_waste / 1024:.0f}KB as WebP" if format_waste >= MIN_WASTED_BYTES else ""
+            findings.append(("format", f"{label}: {kind.upper()}{saving}", image["index"], format_waste))
+
+        lazy = (image["loading"] or "").lower() == "lazy"
+        if not image["above_fold"] and not lazy:
+            findings.append(("eager", f"{label}: below the fold without loading=\"lazy\"", image["index"], 0))
+        elif image["above_fold"] and lazy:
+            findings.append(("lazy-lcp", f"{label}: above the fold but loading=\"lazy\"", image["index"], 0))
+
+        if kind != "svg":
+            if not image["srcset"] and not image["in_picture"] and image["width"] >= SRCSET_MIN_WIDTH:
+                findings.append(("srcset", f"{label}: {image['width']}px wide with no srcset", image["index"], 0))
+            elif image["srcset"] and re.search(r"\d+w\b", image["srcset"]) and not image["sizes"]:
+                findings.append(("srcset", f"{label}: w-descriptor srcset without sizes", image["index"], 0))
+
+        total += wasted
+    return findings, total
+
+
+def page_savings(by_viewport):
+    """Merge {viewport: images} for one page: ({viewport: (findings, wasted)}, worst-case wasted bytes)"""
+    analyzed = {name: analyze_images(images) for name, images in by_viewport.items()}
+    worst = max((wasted for _, wasted in analyzed.values()), default=0)
+    return analyzed, worst
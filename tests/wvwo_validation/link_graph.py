@@ -0,0 +1,169 @@
+"""
+Internal link graph of the built site.
+
+Parses every page in dist/ once (HtmlPage), builds an adjacency index of
+page -> linked pages, then answers link questions from memory - no HTTP
+request per link:
+
+    graph = LinkGraph.from_dist(dist)
+    graph.broken_links()        # [(source, href, target path)]
+    graph.missing_anchors()     # [(source, href, target path, fragment)]
+    graph.orphans(graph.adventure_pages())   # not reachable from /
+
+A link is internal when it is relative or points at one of SITE_HOSTS (the
+pages.dev and production domains the content hard-codes). It resolves when
+its path is a built page or a file in dist/; its #fragment must be an id (or
+<a name>) on the target page. Everything else (other hosts, mailto:, tel:)
+is collected in `external` for the external link checker.
+
+Parsing is the slow part (stdlib HTMLParser), so with more than
+PARALLEL_MIN_PAGES pages it is spread over a process pool. Header, nav and
+footer links repeat on every page, so each distinct href is resolved once.
+"""
+
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from urllib.parse import unquote, urljoin, urlsplit
+
+from .discovery import adventure_types, normalize_path
+from .html_page import HtmlPage
+from .static_site import DIST_DIR, iter_pages
+
+SITE_HOSTS = {"wvwildoutdoors.pages.dev", "wvwildoutdoors.com", "www.wvwildoutdoors.com"}
+
+# Schemes that never point at a page or file
+SKIP_SCHEMES = ("mailto", "tel", "sms", "javascript", "data")
+
+# Fragments browsers resolve without a matching id
+IMPLICIT_FRAGMENTS = {"", "top"}
+
+# Route prefixes whose pages are adventures (besides slugs from the content collection)
+ADVENTURE_PREFIXES = ("/near/", "/historic/", "/backcountry/")
+
+PARALLEL_MIN_PAGES = 50
+
+_BASE = "https://" + sorted(SITE_HOSTS)[0]
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_href(base, href):
+    """("internal", path, fragment), ("external", url, None) or (None, None, None) to skip"""
+    url = urlsplit(urljoin(base, href.strip()))
+    if url.scheme in SKIP_SCHEMES:
+        return None, None, None
+    if url.scheme not in ("http", "https") or (url.hostname or "").lower() not in SITE_HOSTS:
+        return "external", url._replace(fragment="").geturl(), None
+    return "internal", normalize_path(unquote(url.path)), unquote(url.fragment)
+
+
+def _scan(item):
+    """(url_path, resolved links, ids) for one built page; runs in pool workers"""
+    url_path, html_file = item
+    page = HtmlPage.from_file(html_file, url_path)
+    # Directory-style pages (x/index.html) are served at /x/, so relative
+    # hrefs resolve against the trailing slash
+    base = _BASE + (url_path if url_path == "/" or Path(html_file).name != "index.html" else url_path + "/")
+    links = []
+    for href in page.links:
+        # Root-relative and absolute hrefs resolve the same from every page
+        key_base = _BASE if href.startswith(("/", "http:", "https:")) and not href.startswith("//") else base
+        links.append((href, *resolve_href(key_base, href)))
+    return url_path, links, page.ids
+
+
+class Link:
+    """One <a href> on a built page, resolved against the site"""
+
+    __slots__ = ("source", "href", "target", "fragment")
+
+    def __init__(self, source, href, target, fragment):
+        self.source = source
+        self.href = href
+        self.target = target
+        self.fragment = fragment
+
+
+class LinkGraph:
+    """Every internal link of a built site, indexed both ways"""
+
+    def __init__(self, root=DIST_DIR):
+        self.root = Path(root)
+        self.pages = {}       # path -> set of ids on the page
+        self.links = []       # internal Link objects, in page order
+        self.outgoing = {}    # path -> set of linked paths
+        self.incoming = {}    # path -> set of paths linking to it
+        self.external = {}    # absolute URL -> set of pages linking to it
+        self.files = set()
+
+    @classmethod
+    def from_dist(cls, root=DIST_DIR, workers=None):
+        graph = cls(root)
+        graph.files = {"/" + p.relative_to(graph.root).as_posix()
+                       for p in graph.root.rglob("*") if p.is_file()}
+        pages = list(iter_pages(graph.root))
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and len(pages) >= PARALLEL_MIN_PAGES:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                scanned = list(pool.map(_scan, pages, chunksize=max(1, len(pages) // (workers * 4))))
+        else:
+            scanned = [_scan(item) for item in pages]
+
+        for url_path, _, ids in scanned:
+            graph.pages[url_path] = set(ids)
+        for url_path, links, _ in scanned:
+            for href, kind, target, fragment in links:
+                graph.add_link(url_path, href, kind, target, fragment)
+        return graph
+
+    def add_link(self, source, href, kind, target, fragment=None):
+        """Index one resolved link (see resolve_href)"""
+        if kind == "external":
+            self.external.setdefault(target, set()).add(source)
+        elif kind == "internal":
+            self.links.append(Link(source, href, target, fragment))
+            self.outgoing.setdefault(source, set()).add(target)
+            self.incoming.setdefault(target, set()).add(source)
+
+    def resolves(self, path):
+        """Built page or file in dist/ at this site path"""
+        return path in self.pages or path in self.files
+
+    def broken_links(self):
+        """[(source page, href, target path)] for links to nothing in the build"""
+        return [(link.source, link.href, link.target) for link in self.links
+                if not self.resolves(link.target)]
+
+    def missing_anchors(self):
+        """[(source page, href, target path, fragment)] for #fragments with no matching id"""
+        return [(link.source, link.href, link.target, link.fragment) for link in self.links
+                if link.fragment not in IMPLICIT_FRAGMENTS and link.target in self.pages
+                and link.fragment not in self.pages[link.target]]
+
+    def reachable(self, start="/"):
+        """Pages reachable from `start` by following internal links"""
+        seen = {start} if start in self.pages else set()
+        frontier = list(seen)
+        while frontier:
+            path = frontier.pop()
+            for target in self.outgoing.get(path, ()):
+                if target in self.pages and target not in seen:
+                    seen.add(target)
+                    frontier.append(target)
+        return seen
+
+    def inbound(self, path):
+        """Other pages that link to `path`"""
+        return self.incoming.get(path, set()) - {path}
+
+    def adventure_pages(self, types=None):
+        """Built pages under ADVENTURE_PREFIXES or named after an adventure slug"""
+        types = adventure_types() if types is None else types
+        return sorted(path for path in self.pages
+                      if path.startswith(ADVENTURE_PREFIXES) or path.rsplit("/", 1)[-1] in types)
+
+    def orphans(self, paths, start="/"):
+        """Of `paths`, those no chain of links from `start` reaches"""
+        reachable = self.reachable(start)
+        return [path for path in paths if path not in reachable]
@@ -0,0 +1,268 @@
+"""
+Page weight and Core Web Vitals under throttled mobile emulation.
+
+Rural WV visitors are on slow mobile links, so adventure pages are measured
+cold (fresh context, empty cache) on an emulated phone with network and CPU
+throttled over CDP (Chromium only):
+
+    measurement = measure_page(browser, url, network="3g")
+    over = check_budget(measurement, PERF_BUDGETS[template_for(path)])
+
+VITALS_INIT_JS runs before any page script and records paint, LCP,
+layout-shift and long-task entries with PerformanceObserver; VITALS_JS reads
+them back as FCP, LCP, CLS (largest session window) and TBT (long-task time
+over 50ms after FCP). SPEED_INDEX_JS estimates Speed Index without a
+filmstrip, RUM-SpeedIndex style: text and backgrounds paint at FCP, each
+image in the first viewport paints when its bytes arrived, weighted by its
+visible area. Transfer bytes come from CDP Network.loadingFinished, so
+cross-origin resources count too (Resource Timing reports 0 for those).
+
+async_measure_page() is the same for async pages, for parallel batch runs.
+"""
+
+from .readiness import async_goto_ready, goto_ready
+from .tracing import TRACER, traced
+
+# Network presets: "3g" matches mobile3GOptions in performance/lighthouse-audit.mjs,
+# "slow-3g" the 3G test in performance/lighthouse-metrics.spec.ts
+NETWORK_PROFILES = {
+    "3g": {"latency": 150, "download_kbps": 1.6 * 1024, "upload_kbps": 750, "cpu_slowdown": 4},
+    "slow-3g": {"latency": 400, "download_kbps": 400, "upload_kbps": 400, "cpu_slowdown": 4},
+    "none": {"latency": 0, "download_kbps": 0, "upload_kbps": 0, "cpu_slowdown": 1},
+}
+
+# Moto G4-class phone, as Lighthouse's mobile preset
+MOBILE_CONTEXT = {
+    "viewport": {"width": 412, "height": 823},
+    "device_scale_factor": 1.75,
+    "is_mobile": True,
+    "has_touch": True,
+}
+
+# Limits per adventure template (lcp/tbt in ms, bytes in transfer bytes).
+# LCP/TBT/CLS are the "good" thresholds a 90+ mobile score needs; byte budgets
+# follow the templates' hero and gallery weight
+_VITALS = {"lcp": 2500, "cls": 0.1, "tbt": 200}
+PERF_BUDGETS = {
+    "lake": {**_VITALS, "total": 1_500_000, "image": 1_000_000, "script": 100_000, "requests": 60},
+    "wma": {**_VITALS, "total": 1_200_000, "image": 800_000, "script": 100_000, "requests": 50},
+    "ski": {**_VITALS, "total": 1_800_000, "image": 1_300_000, "script": 100_000, "requests": 70},
+    "river": {**_VITALS, "total": 1_500_000, "image": 1_000_000, "script": 100_000, "requests": 60},
+    "default": {**_VITALS, "total": 1_500_000, "image": 1_000_000, "script": 100_000, "requests": 60},
+}
+
+VITALS_INIT_JS = """(() => {
+    const v = window.__wvwoVitals = {fcp: null, lcp: null, cls: 0, tasks: []};
+    let session = 0, first = 0, last = 0;
+    const observe = (type, handle) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(handle)).observe({type, buffered: true});
+        } catch (e) {}  // entry type not supported
+    };
+    observe('paint', e => { if (e.name === 'first-contentful-paint') v.fcp = e.startTime; });
+    observe('largest-contentful-paint', e => { v.lcp = e.startTime; });
+    observe('layout-shift', e => {
+        if (e.hadRecentInput) return;
+        // Session windows: shifts under 1s apart, window capped at 5s
+        if (session && e.startTime - last < 1000 && e.startTime - first < 5000) session += e.value;
+        else { session = e.value; first = e.startTime; }
+        last = e.startTime;
+        v.cls = Math.max(v.cls, session);
+    });
+    observe('longtask', e => v.tasks.push([e.startTime, e.duration]));
+})()"""
+
+VITALS_JS = """() => {
+    const v = window.__wvwoVitals || {fcp: null, lcp: null, cls: 0, tasks: []};
+    const fcp = v.fcp || 0;
+    const nav = performance.getEntriesByType('navigation')[0] || {};
+    return {
+        fcp: v.fcp,
+        lcp: v.lcp,
+        cls: v.cls,
+        tbt: v.tasks.filter(([start]) => start >= fcp)
+                    .reduce((total, [, duration]) => total + Math.max(0, duration - 50), 0),
+        long_tasks: v.tasks.length,
+        ttfb: nav.responseStart || null,
+        load: nav.loadEventEnd || null,
+    };
+}"""
+
+# Visual progress = painted share of the first viewport over time. Images
+# (and CSS background images) count by visible area at their resource's
+# responseEnd, never before FCP; the rest of the viewport paints at FCP
+SPEED_INDEX_JS = """() => {
+    const fcp = (performance.getEntriesByName('first-contentful-paint')[0] || {}).startTime;
+    if (!fcp) return null;
+    const timing = {};
+    for (const r of performance.getEntriesByType('resource')) timing[r.name] = r.responseEnd;
+    const viewport = innerWidth * innerHeight;
+    const visibleArea = el => {
+        const r = el.getBoundingClientRect();
+        const w = Math.min(r.right, innerWidth) - Math.max(r.left, 0);
+        const h = Math.min(r.bottom, innerHeight) - Math.max(r.top, 0);
+        return w > 0 && h > 0 ? w * h : 0;
+    };
+    const paints = [];
+    for (const el of document.querySelectorAll('*')) {
+        let url = el.tagName === 'IMG' ? el.currentSrc || el.src : null;
+        if (!url) {
+            const bg = getComputedStyle(el).backgroundImage.match(/url\\(["']?([^"')]+)/);
+            url = bg ? new URL(bg[1], location.href).href : null;
+        }
+        if (!url || !(url in timing)) continue;
+        const area = visibleArea(el);
+        if (area) paints.push([Math.max(fcp, timing[url]), Math.min(area, viewport)]);
+    }
+    // Image area is capped at half the viewport so one hero can't dominate
+    const imageArea = paints.reduce((total, [, area]) => total + area, 0);
+    const scale = imageArea > viewport / 2 ? viewport / 2 / imageArea : 1;
+    let index = fcp * (1 - (imageArea * scale) / viewport);
+    for (const [time, area] of paints) index += time * (area * scale) / viewport;
+    return Math.round(index);
+}"""
+
+# CDP resource types, named as Playwright's request.resource_type
+_RESOURCE_TYPES = {
+    "Document": "document", "Stylesheet": "stylesheet", "Image": "image", "Media": "media",
+    "Font": "font", "Script": "script", "XHR": "xhr", "Fetch": "fetch",
+}
+
+
+def _throttle_commands(network):
+    profile = NETWORK_PROFILES[network]
+    return [
+        ("Network.enable", None),
+        ("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": profile["latency"],
+            # CDP wants bytes per second; -1 disables the limit
+            "downloadThroughput": profile["download_kbps"] * 1024 / 8 or -1,
+            "uploadThroughput": profile["upload_kbps"] * 1024 / 8 or -1,
+        }),
+        ("Emulation.setCPUThrottlingRate", {"rate": profile["cpu_slowdown"]}),
+    ]
+
+
+def throttle(session, network="3g"):
+    """Apply a NETWORK_PROFILES preset to a sync CDP session"""
+    for method, params in _throttle_commands(network):
+        session.send(method, params)
+
+
+async def async_throttle(session, network="3g"):
+    """Apply a NETWORK_PROFILES preset to an async CDP session"""
+    for method, params in _throttle_commands(network):
+        await session.send(method, params)
+
+
+class TransferLog:
+    """Encoded (over-the-wire) bytes and request count per resource type, from CDP events"""
+
+    def __init__(self, session):
+        self._types = {}
+        self.bytes = {}
+        self.requests = 0
+        self.failed = 0
+        session.on("Network.responseReceived", self._response)
+        session.on("Network.loadingFinished", self._finished)
+        session.on("Network.loadingFailed", self._failed)
+
+    def _response(self, event):
+        self._types[event["requestId"]] = _RESOURCE_TYPES.get(event.get("type"), "other")
+
+    def _finished(self, event):
+        kind = self._types.pop(event["requestId"], "other")
+        self.bytes[kind] = self.bytes.get(kind, 0) + int(event.get("encodedDataLength", 0))
+        self.requests += 1
+
+    def _failed(self, event):
+        self._types.pop(event["requestId"], None)
+        self.failed += 1
+
+    @property
+    def total(self):
+        return sum(self.bytes.values())
+
+
+def _measurement(url, network, vitals, speed_index, transfers):
+    return {
+        "url": url,
+        "network": network,
+        **vitals,
+        "speed_index": speed_index,
+        "total": transfers.total,
+        "requests": transfers.requests,
+        "failed_requests": transfers.failed,
+        "bytes": dict(sorted(transfers.bytes.items(), key=lambda kv: kv[1], reverse=True)),
+    }
+
+
+def measure_page(browser, url, network="3g", timeout=60000):
+    """Cold, throttled load of one page: Web Vitals plus bytes by resource type"""
+    context = browser.new_context(**MOBILE_CONTEXT)
+    try:
+        context.add_init_script(VITALS_INIT_JS)
+        page = context.new_page()
+        session = context.new_cdp_session(page)
+        throttle(session, network)
+        transfers = TransferLog(session)
+        page = traced(page)
+        with TRACER.span("measure", "perf", {"arg": url}):
+            goto_ready(page, url, timeout=timeout)
+            vitals = page.evaluate(VITALS_JS)
+            speed_index = page.evaluate(SPEED_INDEX_JS)
+        return _measurement(url, network, vitals, speed_index, transfers)
+    finally:
+        context.close()
+
+
+async def async_measure_page(browser, url, network="3g", timeout=60000):
+    """Async browser: cold, throttled load of one page (see measure_page)"""
+    context = await browser.new_context(**MOBILE_CONTEXT)
+    try:
+        await context.add_init_script(VITALS_INIT_JS)
+        page = await context.new_page()
+        session = await context.new_cdp_session(page)
+        await async_throttle(session, network)
+        transfers = TransferLog(session)
+        page = traced(page)
+        with TRACER.span("measure", "perf", {"arg": url}):
+            await async_goto_ready(page, url, timeout=timeout)
+            vitals = await page.evaluate(VITALS_JS)
+            speed_index = await page.evaluate(SPEED_INDEX_JS)
+        return _measurement(url, network, vitals, speed_index, transfers)
+    finally:
+        await context.close()
+
+
+def template_for(path, types=None, templates=PERF_BUDGETS):
+    """Template of a page: /near/<template>/..., else the slug's adventure type;
+    "default" when that is not one of `templates`"""
+    parts = path.strip("/").split("/")
+    if len(parts) > 2 and parts[1] in templates:
+        return parts[1]
+    kind = (types or {}).get(parts[-1])
+    return kind if kind in templates else "default"
+
+
+def check_budget(measurement, budget):
+    """[(metric, value, limit)] for every budget the measurement exceeds"""
+    over = []
+    for metric, limit in budget.items():
+        value = measurement.get(metric)
+        if value is None:
+            value = measurement["bytes"].get(metric)
+        if value is not None and value > limit:
+            over.append((metric, value, limit))
+    return over
+
+
+def format_metric(metric, value):
+    if metric == "cls":
+        return f"{value:.3f}"
+    if metric in ("lcp", "tbt", "fcp", "ttfb", "load", "speed_index"):
+        return f"{value:.0f}ms"
+    if metric == "requests":
+        return str(value)
+    return f"{value / 1024:.0f}KB"
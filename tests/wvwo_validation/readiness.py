@@ -0,0 +1,117 @@
+"""
+Event-driven page readiness.
+
+Replaces fixed `wait_for_timeout(500)` sleeps and `networkidle` waits. One
+evaluate() resolves as soon as the page is actually settled:
+
+- web fonts loaded (document.fonts.ready)
+- images decoded - eager ones, plus lazy ones now inside the viewport
+- finite CSS animations/transitions finished (hover, scroll-reveal); infinite
+  ones (spinners, pulses) are ignored
+- layout unchanged for STABLE_FRAMES animation frames
+
+Everything is bounded by READY_TIMEOUT, so a stuck asset delays a check by at
+most that much instead of hanging it:
+
+    goto_ready(page, url)              # instead of goto(..., "networkidle")
+    locator.hover(); wait_until_ready(page)   # instead of wait_for_timeout(400)
+    await async_goto_ready(page, url)
+"""
+
+from .tracing import TRACER
+
+# Resolves once the document size and element count are unchanged for
+# `frames` consecutive animation frames (or after `timeout` ms regardless)
+LAYOUT_STABLE_JS = """({frames, timeout}) => new Promise(resolve => {
+    const started = performance.now();
+    let last = null, stable = 0;
+    const tick = () => {
+        const doc = document.documentElement;
+        const sig = [doc.scrollWidth, doc.scrollHeight, document.getElementsByTagName('*').length].join(':');
+        stable = sig === last ? stable + 1 : 0;
+        last = sig;
+        if (stable >= frames || performance.now() - started > timeout) resolve(stable >= frames);
+        else requestAnimationFrame(tick);
+    };
+    requestAnimationFrame(tick);
+})"""
+
+# Fonts, images and animations in parallel, then layout stability; every wait
+# races the shared deadline. Returns what was waited on and how long it took.
+READY_JS = """async ({frames, timeout}) => {
+    const started = performance.now();
+    const deadline = new Promise(resolve => setTimeout(() => resolve('timeout'), timeout));
+    const bounded = p => Promise.race([p.then(() => 'ok', () => 'ok'), deadline]);
+
+    const inViewport = el => {
+        const r = el.getBoundingClientRect();
+        return r.bottom >= 0 && r.right >= 0 && r.top <= innerHeight && r.left <= innerWidth;
+    };
+    const images = Array.from(document.images).filter(img =>
+        img.currentSrc || img.src ? (img.loading !== 'lazy' || inViewport(img)) : false);
+    const animations = (document.getAnimations ? document.getAnimations() : []).filter(a =>
+        a.playState === 'running' && isFinite(a.effect?.getComputedTiming().endTime));
+
+    const [fonts, decoded, finished] = await Promise.all([
+        bounded(document.fonts ? document.fonts.ready : Promise.resolve()),
+        bounded(Promise.all(images.map(img => img.decode().catch(() => null)))),
+        bounded(Promise.all(animations.map(a => a.finished))),
+    ]);
+
+    const remaining = Math.max(0, timeout - (performance.now() - started));
+    const stable = await (""" + LAYOUT_STABLE_JS + """)({frames, timeout: remaining});
+    return {
+        fonts: fonts === 'ok',
+        images: images.length,
+        animations: animations.length,
+        stable,
+        timed_out: [fonts, decoded, finished].includes('timeout') || !stable,
+        ms: Math.round(performance.now() - started),
+    };
+}"""
+
+STABLE_FRAMES = 3
+STABLE_TIMEOUT = 2000
+READY_TIMEOUT = 5000
+
+# Playwright load state used before the readiness check; "load" already covers
+# the eager subresources networkidle was standing in for
+GOTO_WAIT_UNTIL = "load"
+
+
+def wait_for_layout_stable(page, frames=STABLE_FRAMES, timeout=STABLE_TIMEOUT):
+    """Sync page: block until layout stops changing; False if it timed out"""
+    with TRACER.span("layout-stable", "wait"):
+        return page.evaluate(LAYOUT_STABLE_JS, {"frames": frames, "timeout": timeout})
+
+
+async def async_wait_for_layout_stable(page, frames=STABLE_FRAMES, timeout=STABLE_TIMEOUT):
+    """Async page: wait until layout stops changing; False if it timed out"""
+    with TRACER.span("layout-stable", "wait"):
+        return await page.evaluate(LAYOUT_STABLE_JS, {"frames": frames, "timeout": timeout})
+
+
+def wait_until_ready(page, frames=STABLE_FRAMES, timeout=READY_TIMEOUT):
+    """Sync page: wait for fonts, images, animations and layout (see READY_JS)"""
+    with TRACER.span("readiness", "wait"):
+        return page.evaluate(READY_JS, {"frames": frames, "timeout": timeout})
+
+
+async def async_wait_until_ready(page, frames=STABLE_FRAMES, timeout=READY_TIMEOUT):
+    """Async page: wait for fonts, images, animations and layout (see READY_JS)"""
+    with TRACER.span("readiness", "wait"):
+        return await page.evaluate(READY_JS, {"frames": frames, "timeout": timeout})
+
+
+def goto_ready(page, url, timeout=30000, wait_until=GOTO_WAIT_UNTIL):
+    """Sync page: navigate, then wait until the page is ready rather than network-idle"""
+    response = page.goto(url, wait_until=wait_until, timeout=timeout)
+    wait_until_ready(page)
+    return response
+
+
+async def async_goto_ready(page, url, timeout=30000, wait_until=GOTO_WAIT_UNTIL):
+    """Async page: navigate, then wait until the page is ready rather than network-idle"""
+    response = await page.goto(url, wait_until=wait_until, timeout=timeout)
+    await async_wait_until_ready(page)
+    return response
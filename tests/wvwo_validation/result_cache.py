@@ -0,0 +1,115 @@
+"""
+Persistent content-hash result cache.
+
+A page's validation result only depends on its built HTML, the stylesheets it
+links and the version of the checks run against it. ResultCache stores each
+page's result under a key hashed from exactly those inputs, so a re-run only
+re-checks pages whose inputs changed:
+
+    cache = ResultCache(namespace="static-validation")
+    key = cache.key(html_bytes, css_hashes, version)
+    result = cache.get(url_path, key)
+    if result is None:
+        result = run_checks(...)
+        cache.put(url_path, key, result)
+    cache.save()
+
+Results must be JSON-serializable. Delete tests/.cache/ (or pass --no-cache to
+the validators) to force a full run.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache"
+
+_STYLESHEET_RE = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+_REL_RE = re.compile(r"""\brel\s*=\s*["']?([^"'>]*)""", re.IGNORECASE)
+_HREF_RE = re.compile(r"""\bhref\s*=\s*["']?([^"'\s>]+)""", re.IGNORECASE)
+
+
+def sha256(data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def linked_stylesheets(html):
+    """href of every <link rel="stylesheet"> in raw HTML, in document order"""
+    hrefs = []
+    for tag in _STYLESHEET_RE.findall(html):
+        rel = _REL_RE.search(tag)
+        href = _HREF_RE.search(tag)
+        if rel and href and "stylesheet" in rel.group(1).lower().split():
+            hrefs.append(href.group(1))
+    return hrefs
+
+
+class StylesheetHashes:
+    """Hashes of dist/ stylesheets, read once per run however many pages share them"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._hashes = {}
+
+    def __call__(self, href):
+        if href not in self._hashes:
+            path = self.root / href.split("?")[0].split("#")[0].lstrip("/")
+            # Off-site or missing stylesheets still key the page by their href
+            self._hashes[href] = sha256(path.read_bytes()) if path.is_file() else f"missing:{href}"
+        return self._hashes[href]
+
+
+class ResultCache:
+    """JSON file of {url_path: {"key": ..., "result": ...}} for one validator"""
+
+    def __init__(self, namespace, cache_dir=CACHE_DIR, enabled=True):
+        self.path = Path(cache_dir) / f"{namespace}.json"
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        if enabled and self.path.exists():
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                self._entries = {}
+        self._seen = set()
+
+    @staticmethod
+    def key(content, dependency_hashes=(), version=""):
+        """Cache key for a page: its content, what it links to, and the check version"""
+        h = hashlib.sha256()
+        h.update(str(version).encode("utf-8"))
+        h.update(b"\0")
+        h.update(content if isinstance(content, bytes) else content.encode("utf-8"))
+        for dep in dependency_hashes:
+            h.update(b"\0")
+            h.update(dep.encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, name, key):
+        self._seen.add(name)
+        entry = self._entries.get(name) if self.enabled else None
+        if entry and entry.get("key") == key:
+            self.hits += 1
+            return entry["result"]
+        self.misses += 1
+        return None
+
+    def put(self, name, key, result):
+        self._seen.add(name)
+        self._entries[name] = {"key": key, "result": result}
+
+    def save(self):
+        """Write the cache, dropping pages that no longer exist in the build"""
+        if not self.enabled:
+            return
+        entries = {name: self._entries[name] for name in sorted(self._seen) if name in self._entries}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(entries, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path)
@@ -0,0 +1,240 @@
+"""
+Structured validation results.
+
+One result model for every validator, replacing the per-script dicts of
+formatted strings:
+
+    results = ResultSet("phase3a")
+    results.suite("localbusiness")              # groups checks, restarts the clock
+    results.record("SC-001", "PASS", "LocalBusiness schema found", page=url)
+    ...
+    results.write()          # tests/results/phase3a.json + phase3a.junit.xml
+    results.print_trends()   # pass rate and slowdowns vs earlier runs
+
+A check's duration is the time since the previous record (or suite start),
+so sequential scripts get per-check timing without wrapping each check.
+write() also appends one line per run to history.jsonl, which
+print_trends() reads back; load_results() reads the previous run's JSON for
+per-page deltas.
+"""
+
+import json
+import statistics
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+
+from .tracing import TRACER
+
+RESULTS_DIR = Path(__file__).resolve().parents[1] / "results"
+HISTORY_FILE = "history.jsonl"
+
+STATUSES = ("PASS", "FAIL", "WARN", "SKIP")
+
+# A check is reported as slower when it takes this much longer than its
+# median over the previous runs (and at least SLOWER_MIN_SECONDS more)
+SLOWER_RATIO = 1.5
+SLOWER_MIN_SECONDS = 0.05
+
+
+class CheckResult:
+    """Outcome of one check: status, message, where and how long it took"""
+
+    def __init__(self, check_id, status, message="", suite="", page=None, duration=0.0, data=None):
+        if status not in STATUSES:
+            raise ValueError(f"Check {check_id}: unknown status {status!r}")
+        self.check_id = check_id
+        self.status = status
+        self.message = message
+        self.suite = suite
+        self.page = page
+        self.duration = duration
+        self.data = data or {}
+
+    @property
+    def key(self):
+        """Stable identity across runs: suite/check_id plus page when set"""
+        key = f"{self.suite}/{self.check_id}" if self.suite else self.check_id
+        return f"{key} {self.page}" if self.page else key
+
+    def to_dict(self):
+        return {
+            "id": self.check_id,
+            "suite": self.suite,
+            "status": self.status,
+            "message": self.message,
+            "page": self.page,
+            "duration": round(self.duration, 4),
+            "data": self.data,
+        }
+
+    def __str__(self):
+        return f"[{self.status}] {self.check_id}: {self.message}"
+
+
+class ResultSet:
+    """All check results of one validator run"""
+
+    def __init__(self, run):
+        self.run = run
+        self.started = datetime.now()
+        self.results = []
+        self.current_suite = ""
+        self._start = time.perf_counter()
+        self._mark = self._start
+
+    def suite(self, name):
+        """Start a named group of checks (also a top-level span under --trace)"""
+        self.current_suite = name
+        TRACER.section(name)
+        self.mark()
+
+    def mark(self):
+        """Restart the per-check clock (e.g. before a check after unrelated work)"""
+        self._mark = time.perf_counter()
+
+    def record(self, check_id, status, message="", page=None, data=None, duration=None):
+        now = time.perf_counter()
+        if duration is None:
+            duration = now - self._mark
+        self._mark = now
+        result = CheckResult(check_id, status, message, self.current_suite, page, duration, data)
+        self.results.append(result)
+        return result
+
+    def by_status(self, status):
+        return [r for r in self.results if r.status == status]
+
+    @property
+    def passed(self):
+        return self.by_status("PASS")
+
+    @property
+    def failed(self):
+        return self.by_status("FAIL")
+
+    @property
+    def warnings(self):
+        return self.by_status("WARN")
+
+    @property
+    def ok(self):
+        return not self.failed
+
+    @property
+    def duration(self):
+        return time.perf_counter() - self._start
+
+    def counts(self):
+        return {status.lower(): len(self.by_status(status)) for status in STATUSES}
+
+    def to_dict(self):
+        return {
+            "run": self.run,
+            "started": self.started.isoformat(timespec="seconds"),
+            "duration": round(self.duration, 3),
+            "summary": self.counts(),
+            "results": [r.to_dict() for r in self.results],
+        }
+
+    def to_junit(self):
+        """JUnit XML: one <testsuite> per suite; WARN passes with its message in system-out"""
+        root = ET.Element("testsuites", name=self.run, tests=str(len(self.results)),
+                          failures=str(len(self.failed)), time=f"{self.duration:.3f}")
+        suites = {}
+        for r in self.results:
+            suites.setdefault(r.suite or self.run, []).append(r)
+        for name, results in suites.items():
+            suite = ET.SubElement(root, "testsuite", name=name, tests=str(len(results)),
+                                  failures=str(sum(r.status == "FAIL" for r in results)),
+                                  skipped=str(sum(r.status == "SKIP" for r in results)),
+                                  time=f"{sum(r.duration for r in results):.3f}",
+                                  timestamp=self.started.isoformat(timespec="seconds"))
+            for r in results:
+                case = ET.SubElement(suite, "testcase", classname=f"{self.run}.{name}",
+                                     name=f"{r.check_id} [{r.page}]" if r.page else r.check_id,
+                                     time=f"{r.duration:.3f}")
+                if r.status == "FAIL":
+                    ET.SubElement(case, "failure", message=r.message).text = r.message
+                elif r.status == "SKIP":
+                    ET.SubElement(case, "skipped", message=r.message)
+                elif r.status == "WARN":
+                    ET.SubElement(case, "system-out").text = f"WARN: {r.message}"
+        ET.indent(root)
+        return ET.tostring(root, encoding="unicode", xml_declaration=True)
+
+    def history_entry(self):
+        """Compact per-run line for history.jsonl: counts plus [status, duration] per check"""
+        return {
+            "run": self.run,
+            "started": self.started.isoformat(timespec="seconds"),
+            "duration": round(self.duration, 3),
+            "summary": self.counts(),
+            "checks": {r.key: [r.status, round(r.duration, 4)] for r in self.results},
+        }
+
+    def write(self, directory=RESULTS_DIR, basename=None, history_dir=RESULTS_DIR):
+        """Write <basename>.json and <basename>.junit.xml; append the run to history.jsonl"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        basename = basename or self.run
+        json_path = directory / f"{basename}.json"
+        junit_path = directory / f"{basename}.junit.xml"
+        json_path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        junit_path.write_text(self.to_junit(), encoding="utf-8")
+        history_dir = Path(history_dir)
+        history_dir.mkdir(parents=True, exist_ok=True)
+        with open(history_dir / HISTORY_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(self.history_entry()) + "\n")
+        return json_path, junit_path
+
+    def print_trends(self, directory=RESULTS_DIR, window=10):
+        """Pass rate over the last runs and checks slower than their recent median"""
+        history = [h for h in load_history(directory) if h["run"] == self.run]
+        # write() may already have appended this run
+        if history and history[-1]["started"] == self.started.isoformat(timespec="seconds"):
+            history = history[:-1]
+        history = history[-window:]
+        if not history:
+            return
+
+        rates = []
+        for h in history + [self.history_entry()]:
+            s = h["summary"]
+            total = s["pass"] + s["fail"]
+            rates.append(f"{s['pass']}/{total}" if total else "-")
+        print(f"\nPass rate, last {len(rates)} runs: {' '.join(rates)}")
+
+        slower = []
+        for r in self.results:
+            previous = [h["checks"][r.key][1] for h in history if r.key in h["checks"]]
+            if not previous:
+                continue
+            median = statistics.median(previous)
+            if r.duration > median * SLOWER_RATIO and r.duration - median > SLOWER_MIN_SECONDS:
+                slower.append((r.duration - median, r, median))
+        for delta, r, median in sorted(slower, key=lambda s: s[0], reverse=True)[:10]:
+            print(f"  [SLOWER] {r.key}: {r.duration:.2f}s (median {median:.2f}s over {len(history)} runs)")
+
+
+def load_history(directory=RESULTS_DIR):
+    """Every run recorded in <directory>/history.jsonl, oldest first"""
+    path = Path(directory) / HISTORY_FILE
+    if not path.exists():
+        return []
+    history = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            history.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return history
+
+
+def load_results(run, directory=RESULTS_DIR):
+    """The last written <run>.json (see ResultSet.write), or None"""
+    try:
+        return json.loads((Path(directory) / f"{run}.json").read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
@@ -0,0 +1,138 @@
+"""
+Request routing profiles.
+
+DOM and schema checks only need the HTML (plus first-party CSS/JS for
+anything layout-dependent), yet a normal load also pulls analytics, map
+embeds, CDN fonts and full-size hero images. A RequestRouter installed on a
+page or context decides, per request, whether to let it through, stub it
+with a tiny local response, or abort it, according to a named profile:
+
+    router = RequestRouter("dom")
+    router.install(page)                  # or a context; sync API
+    await router.async_install(context)   # async API
+    router.print_summary()
+
+Profiles (ROUTE_PROFILES):
+- "full"   - everything loads; screenshots and visual checks
+- "styles" - first-party CSS, JS and fonts load; images are stubbed, media
+             and third parties cut. For computed-style checks
+- "dom"    - first-party HTML/JS only; CSS, images and third parties
+             stubbed, fonts and media aborted. For DOM, text and schema checks
+
+Hosts of main-frame navigations (and any `first_party` passed in) are first
+party; every other host is third party.
+"""
+
+from urllib.parse import urlsplit
+
+# 1x1 transparent GIF: stubbed images still "load" and decode, so readiness
+# checks and <img>.complete behave as on a real page
+TRANSPARENT_GIF = (
+    b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"!\xf9\x04\x01\x00\x00\x00\x00,\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
+)
+
+# Stub responses by Playwright resource type; anything else stubs as 204
+STUBS = {
+    "image": ("image/gif", TRANSPARENT_GIF),
+    "script": ("application/javascript", b""),
+    "stylesheet": ("text/css", b""),
+}
+
+# Action per request: "continue", "stub" or "abort". "third_party" applies to
+# every request off the first-party hosts (embeds included); "types" to
+# first-party subresources by resource type
+ROUTE_PROFILES = {
+    "full": {"third_party": "continue", "types": {}},
+    "styles": {"third_party": "stub", "types": {"image": "stub", "media": "abort"}},
+    "dom": {
+        "third_party": "stub",
+        "types": {"image": "stub", "media": "abort", "font": "abort", "stylesheet": "stub"},
+    },
+}
+
+
+def route_action(profile, resource_type, is_first_party):
+    """What `profile` does with one request"""
+    if not is_first_party:
+        return profile["third_party"]
+    if resource_type == "document":
+        return "continue"
+    return profile["types"].get(resource_type, "continue")
+
+
+class RequestRouter:
+    """Applies one routing profile to every request of a page or context"""
+
+    def __init__(self, profile="full", first_party=()):
+        if isinstance(profile, str):
+            if profile not in ROUTE_PROFILES:
+                raise ValueError(f"unknown route profile {profile!r} (expected one of {', '.join(ROUTE_PROFILES)})")
+            self.name, profile = profile, ROUTE_PROFILES[profile]
+        else:
+            self.name = profile.get("name", "custom")
+        self.profile = profile
+        self.first_party = {host.lower() for host in first_party}
+        self.counts = {"continue": 0, "stub": 0, "abort": 0}
+
+    @property
+    def passthrough(self):
+        """Profile lets everything through, so installing a route is pure overhead"""
+        return self.profile["third_party"] == "continue" and not any(
+            action != "continue" for action in self.profile["types"].values())
+
+    def action(self, request):
+        host = (urlsplit(request.url).hostname or "").lower()
+        if request.is_navigation_request() and request.frame.parent_frame is None:
+            self.first_party.add(host)
+        if request.url.startswith(("data:", "blob:")):
+            action = "continue"
+        else:
+            action = route_action(self.profile, request.resource_type, host in self.first_party)
+        self.counts[action] += 1
+        return action
+
+    @staticmethod
+    def _stub(resource_type):
+        content_type, body = STUBS.get(resource_type, (None, None))
+        if content_type is None:
+            return {"status": 204, "body": b""}
+        return {"status": 200, "content_type": content_type, "body": body}
+
+    def handle(self, route):
+        """Sync API route handler"""
+        action = self.action(route.request)
+        if action == "abort":
+            route.abort("blockedbyclient")
+        elif action == "stub":
+            route.fulfill(**self._stub(route.request.resource_type))
+        else:
+            route.continue_()
+
+    async def async_handle(self, route):
+        """Async API route handler"""
+        action = self.action(route.request)
+        if action == "abort":
+            await route.abort("blockedbyclient")
+        elif action == "stub":
+            await route.fulfill(**self._stub(route.request.resource_type))
+        else:
+            await route.continue_()
+
+    def install(self, target):
+        """Route every request of a sync page or context through this profile"""
+        if not self.passthrough:
+            target.route("**/*", self.handle)
+        return target
+
+    async def async_install(self, target):
+        """Route every request of an async page or context through this profile"""
+        if not self.passthrough:
+            await target.route("**/*", self.async_handle)
+        return target
+
+    def print_summary(self):
+        total = sum(self.counts.values())
+        if total:
+            print(f"   Requests ({self.name} profile): {self.counts['continue']} loaded, "
+                  f"{self.counts['stub']} stubbed, {self.counts['abort']} blocked")
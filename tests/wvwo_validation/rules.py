@@ -0,0 +1,260 @@
+"""
+WVWO compliance rule engine.
+
+Rules are declared once, as data, in a rule pack. compile_pack() checks and
+normalizes the pack; evaluate_rules() ships it to the page and evaluates every
+rule in a single DOM traversal, so N rules cost one evaluate() instead of N
+locator queries. Class rules can also run offline against an HtmlPage.
+
+Rule kinds:
+    class  - elements whose class attribute contains any `match` substring
+             (same semantics as a [class*="..."] locator)
+    style  - computed style check on rendered elements; `op` is "gt_px"
+             (any of `properties` above `value` px) or "contains_any"
+             (any of `properties` contains one of `values`)
+    area   - percentage of page area painted in one of `colors`
+             (computed background-color), compared against `max_pct`
+
+Severity: "error" fails the run, "warn" is reported, "info" is a usage count.
+`max` is the allowed count for class/style rules (default 0; None for info).
+"""
+
+FORBIDDEN_ROUNDED = ["rounded-md", "rounded-lg", "rounded-xl", "rounded-2xl", "rounded-3xl"]
+FORBIDDEN_FONTS = ["Inter", "Poppins", "DM Sans", "system-ui", "Montserrat", "Space Grotesk"]
+
+# brand-orange (#FF6F00) and brand-orange-muted (#E65100) as computed colors
+ORANGE_COLORS = ["rgb(255, 111, 0)", "rgb(230, 81, 0)"]
+
+RADIUS_CORNERS = ["borderTopLeftRadius", "borderTopRightRadius",
+                  "borderBottomRightRadius", "borderBottomLeftRadius"]
+
+WVWO_PACK = {
+    "name": "wvwo",
+    "version": 1,
+    "rules": [
+        # Border radius: rounded-sm (0.125rem = 2px) is the only allowed rounding
+        {"id": "rounded-class", "kind": "class", "match": FORBIDDEN_ROUNDED,
+         "message": "forbidden rounded classes"},
+        {"id": "rounded-computed", "kind": "style", "op": "gt_px",
+         "properties": RADIUS_CORNERS, "value": 2.0,
+         "message": "computed border-radius over 2px"},
+        {"id": "rounded-sm", "kind": "class", "match": ["rounded-sm"], "severity": "info"},
+
+        # Glassmorphism
+        {"id": "glass-class", "kind": "class", "match": ["backdrop-blur"],
+         "message": "backdrop-blur classes"},
+        {"id": "glass-computed", "kind": "style", "op": "contains_any",
+         "properties": ["backdropFilter", "webkitBackdropFilter"], "values": ["blur"],
+         "message": "computed backdrop-filter blur"},
+
+        # Fonts
+        {"id": "forbidden-font", "kind": "style", "op": "contains_any",
+         "properties": ["fontFamily"], "values": FORBIDDEN_FONTS,
+         "message": "forbidden fonts in computed styles"},
+        {"id": "font-display", "kind": "class", "match": ["font-display"], "severity": "info"},
+        {"id": "font-hand", "kind": "class", "match": ["font-hand"], "severity": "info"},
+        {"id": "font-body", "kind": "class", "match": ["font-body"], "severity": "info"},
+
+        # Colors
+        {"id": "forbidden-color", "kind": "class", "match": ["purple", "pink-"],
+         "message": "off-brand purple/pink classes"},
+        {"id": "brand-colors", "kind": "class", "severity": "info",
+         "match": ["sign-green", "brand-brown", "brand-mud", "brand-cream", "brand-orange"]},
+        {"id": "orange-area", "kind": "area", "colors": ORANGE_COLORS, "max_pct": 5.0,
+         "severity": "warn", "message": "brand-orange area over 5% of page"},
+
+        # Border-left accents
+        {"id": "accent-green", "kind": "class", "match": ["border-l-sign-green"], "severity": "info"},
+        {"id": "accent-brown", "kind": "class", "match": ["border-l-brand-brown"], "severity": "info"},
+        {"id": "accent-orange", "kind": "class", "match": ["border-l-brand-orange"], "severity": "info"},
+    ],
+}
+
+# Sample elements listed per rule; counts always cover the whole page
+MAX_REPORTED = 20
+
+RULES_JS = """({rules, maxReported}) => {
+    const out = {};
+    for (const r of rules) out[r.id] = {count: 0, matched: {}, samples: [], max: 0, pct: 0};
+    const classRules = rules.filter(r => r.kind === 'class');
+    const styleRules = rules.filter(r => r.kind === 'style');
+    const areaRules = rules.filter(r => r.kind === 'area');
+    const needStyle = styleRules.length > 0 || areaRules.length > 0;
+    const areaHits = areaRules.map(() => new Set());
+    const areaTotals = areaRules.map(() => 0);
+    let rendered = 0;
+
+    const sample = (o, el, value) => {
+        if (o.samples.length < maxReported) o.samples.push({
+            tag: el.tagName,
+            value: value,
+            classes: (el.getAttribute('class') || '').substring(0, 50)
+        });
+    };
+
+    for (const el of document.querySelectorAll('*')) {
+        const cls = el.getAttribute('class') || '';
+        if (cls) {
+            for (const r of classRules) {
+                const o = out[r.id];
+                let hit = false;
+                for (const m of r.match) {
+                    if (cls.includes(m)) { o.matched[m] = (o.matched[m] || 0) + 1; hit = true; }
+                }
+                if (hit) { o.count++; sample(o, el, cls.substring(0, 50)); }
+            }
+        }
+        if (!needStyle) continue;
+
+        const rect = el.getBoundingClientRect();
+        if (rect.width === 0 && rect.height === 0) continue;
+        const cs = window.getComputedStyle(el);
+        if (cs.display === 'none' || cs.visibility === 'hidden') continue;
+        rendered++;
+
+        for (const r of styleRules) {
+            const o = out[r.id];
+            const values = r.properties.map(p => cs[p] || '');
+            if (r.op === 'gt_px') {
+                const px = Math.max(...values.map(v => parseFloat(v) || 0));
+                o.max = Math.max(o.max, px);
+                if (px > r.value) { o.count++; sample(o, el, values.join(' ')); }
+            } else {
+                const hit = values.find(v => r.values.some(x => v.includes(x)));
+                if (hit) { o.count++; o.matched[hit] = (o.matched[hit] || 0) + 1; sample(o, el, hit); }
+            }
+        }
+
+        // Count each colored region once, not its same-colored children
+        areaRules.forEach((r, i) => {
+            if (!r.colors.includes(cs.backgroundColor)) return;
+            areaHits[i].add(el);
+            let parent = el.parentElement, nested = false;
+            while (parent && !nested) { nested = areaHits[i].has(parent); parent = parent.parentElement; }
+            if (!nested) { areaTotals[i] += rect.width * rect.height; out[r.id].count++; }
+        });
+    }
+
+    const doc = document.documentElement;
+    const pageArea = doc.scrollWidth * doc.scrollHeight;
+    areaRules.forEach((r, i) => { out[r.id].pct = pageArea > 0 ? (areaTotals[i] / pageArea) * 100 : 0; });
+    return {elements: rendered, results: out};
+}"""
+
+_KIND_FIELDS = {
+    "class": ["match"],
+    "style": ["op", "properties"],
+    "area": ["colors", "max_pct"],
+}
+
+
+def compile_pack(pack):
+    """Validate a rule pack and fill defaults; returns the JS-ready rule list"""
+    compiled = []
+    seen = set()
+    for rule in pack["rules"]:
+        rule_id = rule.get("id")
+        kind = rule.get("kind")
+        if not rule_id or rule_id in seen:
+            raise ValueError(f"Rule pack {pack.get('name')}: missing or duplicate rule id {rule_id!r}")
+        if kind not in _KIND_FIELDS:
+            raise ValueError(f"Rule {rule_id}: unknown kind {kind!r}")
+        missing = [f for f in _KIND_FIELDS[kind] if f not in rule]
+        if kind == "style":
+            missing += [f for f in (["value"] if rule.get("op") == "gt_px" else ["values"]) if f not in rule]
+            if rule.get("op") not in ("gt_px", "contains_any"):
+                raise ValueError(f"Rule {rule_id}: unknown style op {rule.get('op')!r}")
+        if missing:
+            raise ValueError(f"Rule {rule_id}: missing {', '.join(missing)}")
+        seen.add(rule_id)
+
+        compiled_rule = dict(rule)
+        compiled_rule.setdefault("severity", "error")
+        compiled_rule.setdefault("message", rule_id)
+        if compiled_rule["severity"] == "info":
+            compiled_rule.setdefault("max", None)
+        else:
+            compiled_rule.setdefault("max", 0)
+        compiled.append(compiled_rule)
+    return compiled
+
+
+class RuleReport:
+    """Per-rule results of one evaluation, keyed by rule id"""
+
+    def __init__(self, rules, raw, elements=None, offline=False):
+        self.elements = elements
+        self.offline = offline
+        self.results = {}
+        for rule in rules:
+            result = dict(raw.get(rule["id"], {"count": 0, "matched": {}, "samples": [], "max": 0, "pct": 0}))
+            result["id"] = rule["id"]
+            result["severity"] = rule["severity"]
+            result["message"] = rule["message"]
+            result["skipped"] = rule["id"] not in raw
+            if result["skipped"] or rule["severity"] == "info":
+                result["passed"] = True
+            elif rule["kind"] == "area":
+                result["passed"] = result["pct"] <= rule["max_pct"]
+            else:
+                result["passed"] = result["count"] <= rule["max"]
+            self.results[rule["id"]] = result
+
+    def __getitem__(self, rule_id):
+        return self.results[rule_id]
+
+    def __iter__(self):
+        return iter(self.results.values())
+
+    def count(self, rule_id):
+        return self.results[rule_id]["count"]
+
+    def failures(self):
+        return [r for r in self if not r["passed"] and r["severity"] == "error"]
+
+    def warnings(self):
+        return [r for r in self if not r["passed"] and r["severity"] == "warn"]
+
+    @property
+    def passed(self):
+        return not self.failures()
+
+
+def _args(compiled):
+    return {"rules": compiled, "maxReported": MAX_REPORTED}
+
+
+def evaluate_rules(page, pack=WVWO_PACK):
+    """Evaluate a whole rule pack on a loaded sync page in one DOM pass"""
+    compiled = compile_pack(pack)
+    raw = page.evaluate(RULES_JS, _args(compiled))
+    return RuleReport(compiled, raw["results"], raw["elements"])
+
+
+async def async_evaluate_rules(page, pack=WVWO_PACK):
+    """Evaluate a whole rule pack on a loaded async page in one DOM pass"""
+    compiled = compile_pack(pack)
+    raw = await page.evaluate(RULES_JS, _args(compiled))
+    return RuleReport(compiled, raw["results"], raw["elements"])
+
+
+def evaluate_rules_html(html_page, pack=WVWO_PACK):
+    """Evaluate the class rules of a pack against an HtmlPage (no browser).
+
+    Style and area rules need computed styles and are reported as skipped.
+    """
+    compiled = compile_pack(pack)
+    class_rules = [r for r in compiled if r["kind"] == "class"]
+    raw = {r["id"]: {"count": 0, "matched": {}, "samples": [], "max": 0, "pct": 0} for r in class_rules}
+    for attr in html_page.class_attrs:
+        for rule in class_rules:
+            hits = [m for m in rule["match"] if m in attr]
+            if not hits:
+                continue
+            result = raw[rule["id"]]
+            result["count"] += 1
+            for m in hits:
+                result["matched"][m] = result["matched"].get(m, 0) + 1
+            if len(result["samples"]) < MAX_REPORTED:
+                result["samples"].append({"tag": "", "value": attr[:50], "classes": attr[:50]})
+    return RuleReport(compiled, raw, offline=True)
@@ -0,0 +1,139 @@
+"""
+JSON-LD extraction and type index.
+
+All <script type="application/ld+json"> bodies come back from one evaluate()
+call (or from raw HTML via html_page.HtmlPage), @graph containers are
+flattened, and SchemaIndex maps every @type - plus its schema.org supertypes -
+to the nodes that carry it, so lookups are dict hits instead of linear scans:
+
+    schemas = extract_schemas(page)
+    schemas.first("LocalBusiness")   # finds a SportingGoodsStore node too
+"""
+
+import json
+
+# Returns every JSON-LD script body on the page in a single round trip
+JSONLD_JS = """() => Array.from(
+    document.querySelectorAll('script[type="application/ld+json"]'),
+    s => s.textContent
+)"""
+
+# schema.org parents for the types the site emits; lookups by a parent type
+# also match these subtypes (SportingGoodsStore is a LocalBusiness)
+SUPERTYPES = {
+    "SportingGoodsStore": ["Store"],
+    "GunStore": ["Store"],
+    "Store": ["LocalBusiness"],
+    "LocalBusiness": ["Organization", "Place"],
+    "SportsActivityLocation": ["LocalBusiness"],
+    "SkiResort": ["SportsActivityLocation"],
+    "LodgingBusiness": ["LocalBusiness"],
+    "Campground": ["CivicStructure", "LodgingBusiness"],
+    "CivicStructure": ["Place"],
+    "Park": ["CivicStructure"],
+    "StatePark": ["Park"],
+    "TouristAttraction": ["Place"],
+    "TouristDestination": ["Place"],
+    "LandmarksOrHistoricalBuildings": ["Place"],
+    "BodyOfWater": ["Landform"],
+    "LakeBodyOfWater": ["BodyOfWater"],
+    "RiverBodyOfWater": ["BodyOfWater"],
+    "Landform": ["Place"],
+    "CollectionPage": ["WebPage"],
+    "ItemPage": ["WebPage"],
+    "AboutPage": ["WebPage"],
+    "ContactPage": ["WebPage"],
+    "FAQPage": ["WebPage"],
+    "WebPage": ["CreativeWork"],
+    "Article": ["CreativeWork"],
+    "BreadcrumbList": ["ItemList"],
+}
+
+
+def parse_jsonld(texts):
+    """Parse raw JSON-LD script bodies into (schemas, errors), flattening @graph"""
+    schemas = []
+    errors = []
+    for text in texts:
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            errors.append(str(e))
+            continue
+        _flatten(data, schemas)
+    return schemas, errors
+
+
+def _flatten(data, out):
+    if isinstance(data, list):
+        for item in data:
+            _flatten(item, out)
+    elif isinstance(data, dict) and "@graph" in data:
+        _flatten(data["@graph"], out)
+    else:
+        out.append(data)
+
+
+def type_closure(schema_type):
+    """A type plus all of its known supertypes, nearest first"""
+    seen = []
+    pending = [schema_type]
+    while pending:
+        t = pending.pop(0)
+        if t not in seen:
+            seen.append(t)
+            pending.extend(SUPERTYPES.get(t, []))
+    return seen
+
+
+class SchemaIndex:
+    """JSON-LD nodes of one page, indexed by @type and supertypes"""
+
+    def __init__(self, schemas, errors=()):
+        self.schemas = schemas
+        self.errors = list(errors)
+        self._by_type = {}
+        for schema in schemas:
+            if not isinstance(schema, dict):
+                continue
+            types = schema.get("@type", [])
+            if isinstance(types, str):
+                types = [types]
+            keys = []
+            for t in types:
+                for key in type_closure(t):
+                    if key not in keys:
+                        keys.append(key)
+            for key in keys:
+                self._by_type.setdefault(key, []).append(schema)
+
+    @classmethod
+    def from_texts(cls, texts):
+        return cls(*parse_jsonld(texts))
+
+    def first(self, schema_type):
+        """First node (document order) that is schema_type or a subtype of it"""
+        nodes = self._by_type.get(schema_type)
+        return nodes[0] if nodes else None
+
+    def all(self, schema_type):
+        return list(self._by_type.get(schema_type, []))
+
+    def types(self):
+        return set(self._by_type)
+
+    def __contains__(self, schema_type):
+        return schema_type in self._by_type
+
+    def __len__(self):
+        return len(self.schemas)
+
+
+def extract_schemas(page):
+    """SchemaIndex for a loaded sync Playwright page, in one evaluate() call"""
+    return SchemaIndex.from_texts(page.evaluate(JSONLD_JS))
+
+
+async def async_extract_schemas(page):
+    """SchemaIndex for a loaded async Playwright page, in one evaluate() call"""
+    return SchemaIndex.from_texts(await page.evaluate(JSONLD_JS))
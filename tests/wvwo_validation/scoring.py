@@ -0,0 +1,58 @@
+"""
+Lighthouse-style performance score.
+
+Each metric is scored 0-1 on a log-normal curve fixed by two control points
+(the value scoring 0.9 and the median scoring 0.5), then the weighted sum is
+the 0-100 performance score - Lighthouse 10's mobile curves and weights, so
+a page scoring 90 here is in the same place as a 90 from PageSpeed:
+
+    score, parts = performance_score({"fcp": 1900, "speed_index": 3500,
+                                      "lcp": 2600, "tbt": 150, "cls": 0.02})
+
+Measured locally (perf.async_measure_page) rather than by Lighthouse's
+simulated throttling, so absolute numbers drift from PageSpeed; the ranking
+and run-to-run deltas are what to read.
+"""
+
+import math
+
+# metric: (p10 - value scoring 0.9, median - value scoring 0.5, weight)
+SCORING = {
+    "fcp": (1800, 3000, 0.10),
+    "speed_index": (3387, 5800, 0.10),
+    "lcp": (2500, 4000, 0.25),
+    "tbt": (200, 600, 0.30),
+    "cls": (0.1, 0.25, 0.25),
+}
+
+# erfc^-1(0.2): scales the log ratio so p10 lands exactly on 0.9
+_INVERSE_ERFC_ONE_FIFTH = 0.9061938024368232
+
+
+def log_normal_score(value, p10, median):
+    """0-1 score of one metric value; 1 for zero, 0.5 at the median"""
+    if value <= 0:
+        return 1.0
+    standardized = math.log(value / median) * _INVERSE_ERFC_ONE_FIFTH / -math.log(p10 / median)
+    score = math.erfc(standardized) / 2
+    # Clamp to the band the value is in, as Lighthouse does, so rounding
+    # never moves a value across the p10 / median boundaries
+    if value <= p10:
+        return max(0.9, min(1.0, score))
+    if value <= median:
+        return max(0.5, min(0.8999999999999999, score))
+    return max(0.0, min(0.49999999999999994, score))
+
+
+def performance_score(metrics, scoring=SCORING):
+    """(0-100 score, {metric: 0-1 score}); missing metrics are left out and
+    the remaining weights renormalised"""
+    parts = {}
+    for metric, (p10, median, _) in scoring.items():
+        if metrics.get(metric) is not None:
+            parts[metric] = log_normal_score(metrics[metric], p10, median)
+    weight = sum(scoring[metric][2] for metric in parts)
+    if not weight:
+        return None, parts
+    score = sum(parts[metric] * scoring[metric][2] for metric in parts) / weight
+    return round(score * 100), parts
@@ -0,0 +1,170 @@
+"""
+Screenshot store with content-hash dedupe and baseline diffing.
+
+ScreenshotStore replaces `page.screenshot(path=...)` in the validators:
+
+    store = ScreenshotStore(SCREENSHOT_DIR)
+    shot = store.capture(page, "spec13-mobile")            # or a locator
+    shot = await store.async_capture(page, "spec-15/x", full_page=True)
+    store.print_summary()
+
+Each capture is hashed; the PNG is only written when its bytes changed since
+the last run. It is then compared with baseline/<name>.png: the first capture
+seeds the baseline, identical hashes short-circuit, and anything else is
+diffed tile by tile. Only the changed regions are written, as crops under
+diff/. Accept intentional changes with --update-baseline.
+
+Region diffs need Pillow (pip install pillow). Without it a changed hash is
+reported as one whole-image region.
+"""
+
+import hashlib
+import io
+import json
+import sys
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageChops
+except ImportError:  # optional: hash-only comparison
+    Image = None
+
+SCREENSHOT_DIR = Path(__file__).resolve().parents[1] / "screenshots"
+
+TILE_SIZE = 32
+# Per-channel difference a pixel must exceed to count (absorbs anti-aliasing)
+PIXEL_TOLERANCE = 16
+
+
+def png_size(png):
+    """(width, height) from a PNG's IHDR chunk"""
+    return int.from_bytes(png[16:20], "big"), int.from_bytes(png[20:24], "big")
+
+
+def diff_regions(before_png, after_png, tile=TILE_SIZE, tolerance=PIXEL_TOLERANCE):
+    """Changed regions between two PNGs as (left, top, right, bottom) boxes.
+
+    The images are compared in tile x tile blocks; neighbouring changed tiles
+    are merged into one box.
+    """
+    if Image is None:
+        return [(0, 0, *png_size(after_png))]
+    before = Image.open(io.BytesIO(before_png)).convert("RGB")
+    after = Image.open(io.BytesIO(after_png)).convert("RGB")
+    if before.size != after.size:
+        return [(0, 0, after.width, after.height)]
+
+    # Max channel difference per pixel, thresholded to a 0/255 mask
+    r, g, b = ImageChops.difference(before, after).split()
+    mask = ImageChops.lighter(ImageChops.lighter(r, g), b).point(lambda v: 255 if v > tolerance else 0)
+    bbox = mask.getbbox()
+    if bbox is None:
+        return []
+
+    # Only tiles inside the overall changed bounding box need checking
+    cols = range(bbox[0] // tile, (bbox[2] - 1) // tile + 1)
+    rows = range(bbox[1] // tile, (bbox[3] - 1) // tile + 1)
+    changed = {
+        (cx, cy) for cy in rows for cx in cols
+        if mask.crop((cx * tile, cy * tile, (cx + 1) * tile, (cy + 1) * tile)).getbbox()
+    }
+
+    regions = []
+    while changed:
+        stack = [changed.pop()]
+        x0 = x1 = stack[0][0]
+        y0 = y1 = stack[0][1]
+        while stack:
+            cx, cy = stack.pop()
+            x0, x1, y0, y1 = min(x0, cx), max(x1, cx), min(y0, cy), max(y1, cy)
+            for n in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+                if n in changed:
+                    changed.remove(n)
+                    stack.append(n)
+        regions.append((x0 * tile, y0 * tile,
+                        min((x1 + 1) * tile, after.width), min((y1 + 1) * tile, after.height)))
+    return sorted(regions, key=lambda box: (box[1], box[0]))
+
+
+class ScreenshotStore:
+    """Hash-deduped screenshot directory with a baseline/ and diff/ beside it"""
+
+    def __init__(self, root=SCREENSHOT_DIR, update_baseline=None):
+        self.root = Path(root)
+        self.baseline_dir = self.root / "baseline"
+        self.diff_dir = self.root / "diff"
+        if update_baseline is None:
+            update_baseline = "--update-baseline" in sys.argv
+        self.update_baseline = update_baseline
+        self.manifest_path = self.root / ".hashes.json"
+        try:
+            self.manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            self.manifest = {}
+        self.results = []
+
+    def capture(self, target, name, **kwargs):
+        """Screenshot a sync page or locator and store it under name"""
+        return self.save(name, target.screenshot(**kwargs))
+
+    async def async_capture(self, target, name, **kwargs):
+        """Screenshot an async page or locator and store it under name"""
+        return self.save(name, await target.screenshot(**kwargs))
+
+    def save(self, name, png):
+        digest = hashlib.sha256(png).hexdigest()
+        path = self.root / f"{name}.png"
+        written = self.manifest.get(name) != digest or not path.exists()
+        if written:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(png)
+            self.manifest[name] = digest
+            self._save_manifest()
+
+        baseline = self.baseline_dir / f"{name}.png"
+        regions = []
+        if not baseline.exists() or self.update_baseline:
+            status = "baseline" if baseline.exists() else "new"
+            baseline.parent.mkdir(parents=True, exist_ok=True)
+            baseline.write_bytes(png)
+        else:
+            before = baseline.read_bytes()
+            regions = [] if hashlib.sha256(before).hexdigest() == digest else diff_regions(before, png)
+            status = "changed" if regions else "same"
+            self._write_regions(name, png, regions)
+
+        result = {"name": name, "path": str(path), "status": status,
+                  "written": written, "regions": regions}
+        self.results.append(result)
+        return result
+
+    def _write_regions(self, name, png, regions):
+        for old in self.diff_dir.glob(f"{name}-region-*.png"):
+            old.unlink()
+        if not regions or Image is None:
+            return
+        image = Image.open(io.BytesIO(png))
+        for i, box in enumerate(regions, 1):
+            out = self.diff_dir / f"{name}-region-{i}.png"
+            out.parent.mkdir(parents=True, exist_ok=True)
+            image.crop(box).save(out)
+
+    def _save_manifest(self):
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(json.dumps(self.manifest, indent=1, sort_keys=True), encoding="utf-8")
+
+    def changed(self):
+        return [r for r in self.results if r["status"] == "changed"]
+
+    def print_summary(self):
+        written = sum(1 for r in self.results if r["written"])
+        print(f"\nScreenshots: {len(self.results)} captured, {written} written, "
+              f"{len(self.results) - written} unchanged on disk")
+        for r in self.changed():
+            boxes = ", ".join(f"{l},{t}-{rt},{b}" for l, t, rt, b in r["regions"][:5])
+            print(f"  [DIFF] {r['name']}: {len(r['regions'])} changed region(s) vs baseline ({boxes})")
+        new = [r["name"] for r in self.results if r["status"] in ("new", "baseline")]
+        if new:
+            print(f"  Baseline {'updated' if self.update_baseline else 'seeded'}: {', '.join(new)}")
+        if self.changed() and Image is None:
+            print("  (install Pillow for per-region diffs: pip install pillow)")
@@ -0,0 +1,74 @@
+"""
+Single-load page snapshots.
+
+Every validator suite used to open its own page and goto() the same URL.
+SnapshotCache loads each URL once, captures the DOM and JSON-LD, runs the
+WVWO rule pack on demand (once per pack), and hands the same
+PageSnapshot to every suite that asks for that URL.
+
+SnapshotCache(browser, profile="dom") loads pages through a request routing
+profile (see routing.py) when no suite needs images, fonts or third parties.
+"""
+
+from .schema import SchemaIndex
+from .readiness import GOTO_WAIT_UNTIL, goto_ready
+from .routing import RequestRouter
+from .tracing import traced
+from .rules import WVWO_PACK, evaluate_rules
+
+# Captured in one evaluate() call so a snapshot costs a single IPC round trip
+CAPTURE_JS = """() => ({
+    html: document.documentElement.outerHTML,
+    title: document.title,
+    jsonld: Array.from(
+        document.querySelectorAll('script[type="application/ld+json"]'),
+        s => s.textContent
+    )
+})"""
+
+
+class PageSnapshot:
+    """One loaded page plus everything captured from it at load time"""
+
+    def __init__(self, url, page, capture):
+        self.url = url
+        self.page = page
+        self.html = capture["html"]
+        self.title = capture["title"]
+        self.schemas = SchemaIndex.from_texts(capture["jsonld"])
+        self.jsonld = self.schemas.schemas
+        self.jsonld_errors = self.schemas.errors
+        self._reports = {}
+
+    def rules(self, pack=WVWO_PACK):
+        """RuleReport for the page as loaded (see rules.py)"""
+        key = (pack["name"], pack["version"])
+        if key not in self._reports:
+            self._reports[key] = evaluate_rules(self.page, pack)
+        return self._reports[key]
+
+
+class SnapshotCache:
+    """Loads each URL once per run and serves the capture to every suite"""
+
+    def __init__(self, browser, wait_until=GOTO_WAIT_UNTIL, profile="full"):
+        self.browser = browser
+        self.wait_until = wait_until
+        self.router = RequestRouter(profile)
+        self.loads = 0
+        self._snapshots = {}
+
+    def get(self, url):
+        snapshot = self._snapshots.get(url)
+        if snapshot is None:
+            page = traced(self.router.install(self.browser.new_page()))
+            goto_ready(page, url, wait_until=self.wait_until)
+            self.loads += 1
+            snapshot = PageSnapshot(url, page, page.evaluate(CAPTURE_JS))
+            self._snapshots[url] = snapshot
+        return snapshot
+
+    def close(self):
+        for snapshot in self._snapshots.values():
+            snapshot.page.close()
+        self._snapshots.clear()
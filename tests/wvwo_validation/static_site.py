@@ -0,0 +1,86 @@
+"""
+Offline access to the built site in wv-wild-web/dist.
+
+Two ways to validate a build without a Cloudflare preview or `npm run dev`:
+
+- StaticServer: zero-config HTTP server over dist/ on a free localhost port,
+  for browser-based validators (pass --dist to phase3a-validation.py or
+  comprehensive-spec-validation.py).
+- iter_pages(): walks dist/ and yields every built page for the pure-HTML
+  checks in html_page.py / static-validation.py, no browser needed.
+
+Build first: cd wv-wild-web && npm run build
+"""
+
+import functools
+import sys
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+DIST_DIR = Path(__file__).resolve().parents[2] / "wv-wild-web" / "dist"
+
+
+def dist_dir_from_argv(argv=None):
+    """dist/ path from `--dist [PATH]`, defaulting to wv-wild-web/dist"""
+    argv = sys.argv if argv is None else argv
+    if "--dist" not in argv:
+        return None
+    i = argv.index("--dist")
+    if i + 1 < len(argv) and not argv[i + 1].startswith("--"):
+        return Path(argv[i + 1])
+    return DIST_DIR
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class StaticServer:
+    """Serves a dist/ directory on 127.0.0.1 from a background thread"""
+
+    def __init__(self, root=DIST_DIR, port=0):
+        self.root = Path(root)
+        if not (self.root / "index.html").exists():
+            raise FileNotFoundError(f"No built site at {self.root} (run: cd wv-wild-web && npm run build)")
+        handler = functools.partial(_QuietHandler, directory=str(self.root))
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def url_path_for(root, html_file):
+    """URL path a built file is served at: near/x/index.html -> /near/x"""
+    rel = Path(html_file).relative_to(root).as_posix()
+    if rel == "index.html":
+        return "/"
+    if rel.endswith("/index.html"):
+        return "/" + rel[:-len("/index.html")]
+    return "/" + rel[:-len(".html")]
+
+
+def iter_pages(root=DIST_DIR):
+    """Yield (url_path, html_file) for every built page, sorted by path"""
+    root = Path(root)
+    for html_file in sorted(root.rglob("*.html")):
+        yield url_path_for(root, html_file), html_file
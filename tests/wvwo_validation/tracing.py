@@ -0,0 +1,234 @@
+"""
+Span tracing for the validators.
+
+Run any validator with --trace to see where its wall time goes:
+
+    python tests/comprehensive-spec-validation.py --trace [path/to/trace.json]
+
+Pages wrapped with traced() record a span for every navigation, evaluate(),
+screenshot and locator call. The readiness waits are spans of their own, and
+ResultSet.suite() opens a top-level section per suite. TRACER.report() then
+prints a flame-style tree of total time per call path and writes Chrome
+trace JSON that chrome://tracing or https://ui.perfetto.dev can open. It
+writes to tests/results/<run>.trace.json unless a path follows --trace.
+
+    page = traced(browser.new_page())
+    with TRACER.span("parse sitemap"):
+        ...
+    TRACER.report("phase3a")
+
+Without --trace, traced() returns the page untouched and span() is a no-op.
+"""
+
+import asyncio
+import contextvars
+import inspect
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Calls that build a Locator without talking to the browser: wrapped, not timed
+LOCATOR_FACTORIES = {
+    "locator", "get_by_role", "get_by_text", "get_by_label", "get_by_placeholder",
+    "get_by_alt_text", "get_by_title", "get_by_test_id", "nth", "filter", "and_", "or_",
+    "frame_locator",
+}
+
+SPAN_CATEGORIES = {
+    "goto": "navigation", "reload": "navigation", "go_back": "navigation",
+    "wait_for_load_state": "navigation", "wait_for_url": "navigation",
+    "evaluate": "evaluate", "evaluate_handle": "evaluate", "evaluate_all": "evaluate",
+    "screenshot": "screenshot",
+}
+
+# Tree rows below this share of the run are folded away in the summary
+MIN_SUMMARY_SHARE = 0.005
+MAX_CHILDREN = 8
+
+# Chrome traces go beside the run's results files (see results.RESULTS_DIR)
+TRACE_DIR = Path(__file__).resolve().parents[1] / "results"
+
+_path = contextvars.ContextVar("wvwo_trace_path", default=())
+
+
+def trace_path_from_argv(argv=None):
+    """Path given after --trace, if any (None when --trace is bare or absent)"""
+    argv = sys.argv if argv is None else argv
+    if "--trace" not in argv:
+        return None
+    i = argv.index("--trace")
+    if i + 1 < len(argv) and not argv[i + 1].startswith("--"):
+        return Path(argv[i + 1])
+    return None
+
+
+class Tracer:
+    """Collects nested timing spans across threads and asyncio tasks"""
+
+    def __init__(self, enabled=None):
+        self.enabled = "--trace" in sys.argv if enabled is None else enabled
+        self.events = []
+        self._t0 = time.perf_counter()
+        self._lanes = {}
+        self._section = None
+
+    def _lane(self):
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = id(task) if task is not None else threading.get_ident()
+        return self._lanes.setdefault(key, len(self._lanes) + 1)
+
+    @contextmanager
+    def span(self, name, cat="check", args=None):
+        if not self.enabled:
+            yield
+            return
+        path = _path.get() + (name,)
+        token = _path.set(path)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.events.append((path, cat, start, time.perf_counter() - start, self._lane(), args))
+            _path.reset(token)
+
+    def section(self, name):
+        """Start a top-level section (one per suite); ends the previous one"""
+        if not self.enabled:
+            return
+        self.end_section()
+        _path.set((name,))
+        self._section = (name, time.perf_counter(), self._lane())
+
+    def end_section(self):
+        if self._section is None:
+            return
+        name, start, lane = self._section
+        self.events.append(((name,), "section", start, time.perf_counter() - start, lane, None))
+        self._section = None
+        _path.set(())
+
+    def tree(self):
+        """{path: [total seconds, calls]} aggregated over every span"""
+        totals = {}
+        for path, _, _, duration, _, _ in self.events:
+            entry = totals.setdefault(path, [0.0, 0])
+            entry[0] += duration
+            entry[1] += 1
+        return totals
+
+    def print_summary(self):
+        totals = self.tree()
+        if not totals:
+            return
+        wall = time.perf_counter() - self._t0
+        children = {}
+        for path in totals:
+            children.setdefault(path[:-1], []).append(path)
+
+        print(f"\nTrace: {len(self.events)} spans over {wall:.2f}s (total / self / calls)")
+
+        def show(parent, depth):
+            rows = sorted(children.get(parent, []), key=lambda p: totals[p][0], reverse=True)
+            for path in rows[:MAX_CHILDREN]:
+                total, calls = totals[path]
+                if total < wall * MIN_SUMMARY_SHARE:
+                    continue
+                own = total - sum(totals[c][0] for c in children.get(path, []))
+                label = "  " * depth + path[-1]
+                print(f"  {label[:48]:<48} {total:7.2f}s {max(own, 0):7.2f}s {calls:5}x  {total / wall:5.1%}")
+                show(path, depth + 1)
+
+        show((), 0)
+
+    def chrome_trace(self):
+        """Trace Event Format (complete events), timestamps in microseconds"""
+        events = []
+        for path, cat, start, duration, lane, args in self.events:
+            event = {"name": path[-1], "cat": cat, "ph": "X", "pid": 1, "tid": lane,
+                     "ts": round((start - self._t0) * 1e6), "dur": round(duration * 1e6)}
+            if args:
+                event["args"] = args
+            events.append(event)
+        events.sort(key=lambda e: e["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def report(self, run, path=None):
+        """Print the flame summary and write Chrome trace JSON (only with --trace)"""
+        if not self.enabled:
+            return None
+        self.end_section()
+        self.print_summary()
+        path = Path(path or trace_path_from_argv() or TRACE_DIR / f"{run}.trace.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+        print(f"  Chrome trace: {path} (open in chrome://tracing or ui.perfetto.dev)")
+        return path
+
+
+TRACER = Tracer()
+
+
+def _describe(args, kwargs):
+    """Short span args: the URL / selector / script head the call was made with"""
+    for value in args:
+        if isinstance(value, str):
+            value = " ".join(value.split())
+            return {"arg": value if len(value) <= 80 else value[:77] + "..."}
+    if "path" in kwargs:
+        return {"arg": str(kwargs["path"])}
+    return None
+
+
+def _wrap(value, tracer):
+    if type(value).__name__ in ("Locator", "FrameLocator"):
+        return _Traced(value, tracer, "locator")
+    if isinstance(value, list) and value and type(value[0]).__name__ == "Locator":
+        return [_Traced(v, tracer, "locator") for v in value]
+    return value
+
+
+class _Traced:
+    """Proxy that times every browser round trip made through a page or locator"""
+
+    def __init__(self, target, tracer, kind):
+        self._target = target
+        self._tracer = tracer
+        self._kind = kind
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        tracer = self._tracer
+        if not callable(attr):
+            return _wrap(attr, tracer)  # .first / .last / .mouse ...
+        if name in LOCATOR_FACTORIES:
+            return lambda *args, **kwargs: _wrap(attr(*args, **kwargs), tracer)
+
+        span_name = f"{self._kind}.{name}"
+        cat = SPAN_CATEGORIES.get(name, self._kind)
+
+        if inspect.iscoroutinefunction(attr):
+            async def call_async(*args, **kwargs):
+                with tracer.span(span_name, cat, _describe(args, kwargs)):
+                    return _wrap(await attr(*args, **kwargs), tracer)
+            return call_async
+
+        def call(*args, **kwargs):
+            with tracer.span(span_name, cat, _describe(args, kwargs)):
+                return _wrap(attr(*args, **kwargs), tracer)
+        return call
+
+    def __repr__(self):
+        return f"traced({self._target!r})"
+
+
+def traced(page, tracer=TRACER):
+    """Page whose browser calls are recorded as spans; the page itself when tracing is off"""
+    if not tracer.enabled or isinstance(page, _Traced):
+        return page
+    return _Traced(page, tracer, "page")
@@ -0,0 +1,74 @@
+"""
+Viewport matrix runner.
+
+Runs a visit over every (url, viewport) pair with one warm browser context per
+viewport. Each context keeps its page(s) and loops the URLs through them, so
+no context or page is created per pair, and all viewports run concurrently:
+
+    results = asyncio.run(run_matrix(urls, VIEWPORTS, visit))
+    results[(url, "mobile")]
+
+visit(page, url, viewport_name) is async and runs once the page has loaded and
+is ready (fonts, images, animations, stable layout - see readiness.py); no
+fixed sleeps.
+"""
+
+import asyncio
+
+from playwright.async_api import async_playwright
+
+from .browser_pool import async_launch_browser
+from .crawl import CrawlError
+from .readiness import GOTO_WAIT_UNTIL, async_goto_ready
+from .tracing import traced
+
+
+async def run_matrix(urls, viewports, visit, workers_per_viewport=1, wait_until=GOTO_WAIT_UNTIL, timeout=30000,
+                     context_options=None):
+    """Visit every url at every (name, width, height) viewport.
+
+    context_options maps a viewport name to extra new_context() keyword
+    arguments (e.g. {"mobile": {"device_scale_factor": 2}}).
+
+    Returns {(url, viewport_name): result} in url-major, viewport-minor
+    order; a pair whose load or visit raised maps to a CrawlError.
+    """
+    results = {}
+
+    async def viewport_worker(context, name, queue):
+        page = traced(await context.new_page())
+        try:
+            while True:
+                try:
+                    url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    await async_goto_ready(page, url, timeout=timeout, wait_until=wait_until)
+                    results[(url, name)] = await visit(page, url, name)
+                except Exception as e:
+                    results[(url, name)] = CrawlError(f"{url} @ {name}", e)
+        finally:
+            await page.close()
+
+    async with async_playwright() as p:
+        browser = await async_launch_browser(p)
+        contexts = []
+        workers = []
+        for name, width, height in viewports:
+            options = (context_options or {}).get(name, {})
+            context = await browser.new_context(viewport={"width": width, "height": height}, **options)
+            contexts.append(context)
+            queue = asyncio.Queue()
+            for url in urls:
+                queue.put_nowait(url)
+            for _ in range(max(1, min(workers_per_viewport, len(urls)))):
+                workers.append(viewport_worker(context, name, queue))
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for context in contexts:
+                await context.close()
+            await browser.close()
+
+    return {(url, name): results[(url, name)] for url in urls for name, _, _ in viewports}
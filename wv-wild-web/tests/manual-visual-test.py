@@ -13,9 +13,8 @@ Tests implemented features from git history:
 """
 
 from playwright.sync_api import sync_playwright
-import json
 import os
-from datetime import datetime
+import sys
 from pathlib import Path
 
 # Output directory - in the repo
@@ -23,27 +22,25 @@ SCRIPT_DIR = Path(__file__).parent
 OUTPUT_DIR = SCRIPT_DIR / "output"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
-# Test results storage
-RESULTS = {
-    "timestamp": datetime.now().isoformat(),
-    "tests": [],
-    "summary": {"passed": 0, "failed": 0, "warnings": 0}
-}
+# Shared validator helpers live in the root tests/ directory
+sys.path.insert(0, str(SCRIPT_DIR.resolve().parents[1] / "tests"))
+from wvwo_validation.browser_pool import launch_browser
+from wvwo_validation.image_audit import analyze_images, collect_images
+from wvwo_validation.readiness import goto_ready
+from wvwo_validation.results import ResultSet
+from wvwo_validation.screenshots import ScreenshotStore
+from wvwo_validation.tracing import TRACER, traced
+
+# Screenshots are only rewritten when they change, and diffed against output/baseline/
+SCREENSHOTS = ScreenshotStore(OUTPUT_DIR)
+
+# Test results storage - output/test-results.json + JUnit XML; run history
+# accumulates in tests/results/history.jsonl
+RESULTS = ResultSet("manual-visual")
 
 def log_result(name, status, details=""):
     """Log test result"""
-    RESULTS["tests"].append({
-        "name": name,
-        "status": status,
-        "details": details
-    })
-    if status == "PASS":
-        RESULTS["summary"]["passed"] += 1
-    elif status == "FAIL":
-        RESULTS["summary"]["failed"] += 1
-    else:
-        RESULTS["summary"]["warnings"] += 1
-    print(f"[{status}] {name}: {details}")
+    print(RESULTS.record(name, status, details))
 
 
 def test_homepage_aesthetics(page):
@@ -51,11 +48,10 @@ def test_homepage_aesthetics(page):
     print("\n=== Testing Homepage Aesthetics ===")
 
     # Check page loads
-    page.goto('http://localhost:4321')
-    page.wait_for_load_state('networkidle')
+    goto_ready(page, 'http://localhost:4321')
 
     # Screenshot for visual verification
-    page.screenshot(path=str(OUTPUT_DIR / 'homepage.png'), full_page=True)
+    SCREENSHOTS.capture(page, 'homepage', full_page=True)
     log_result("Homepage loads", "PASS", "Page loaded successfully")
 
     # Check title
@@ -85,8 +81,7 @@ def test_navigation(page):
     """Test navigation links work"""
     print("\n=== Testing Navigation ===")
 
-    page.goto('http://localhost:4321')
-    page.wait_for_load_state('networkidle')
+    goto_ready(page, 'http://localhost:4321')
 
     # Check nav links exist
     nav_links = page.locator('nav a').all()
@@ -98,13 +93,20 @@ def test_navigation(page):
     log_result("Anchor links", "PASS" if len(anchor_links) > 0 else "WARN",
                f"Found {len(anchor_links)} anchor links")
 
+    # Anchor links must land on an element (site-wide: python tests/link-check.py)
+    missing = page.evaluate("""() => Array.from(document.querySelectorAll('a[href^="#"]'))
+        .map(a => decodeURIComponent(a.getAttribute('href').slice(1)))
+        .filter(id => id && id !== 'top' && !document.getElementById(id))""")
+    log_result("Anchor targets", "FAIL" if missing else "PASS",
+               f"Missing targets: {', '.join(sorted(set(missing)))}" if missing
+               else f"All {len(anchor_links)} anchor links have targets")
+
 
 def test_shop_section(page):
     """Test shop/inventory display"""
     print("\n=== Testing Shop Section ===")
 
-    page.goto('http://localhost:4321')
-    page.wait_for_load_state('networkidle')
+    goto_ready(page, 'http://localhost:4321')
 
     # Look for shop section
     shop = page.locator('#shop')
@@ -112,7 +114,7 @@ def test_shop_section(page):
         log_result("Shop section exists", "PASS", "Shop section found")
         try:
             shop.scroll_into_view_if_needed()
-            page.screenshot(path=str(OUTPUT_DIR / 'shop.png'))
+            SCREENSHOTS.capture(page, 'shop')
         except Exception:
             pass  # Screenshot optional
     else:
@@ -133,8 +135,7 @@ def test_contact_section(page):
     """Test contact section and form"""
     print("\n=== Testing Contact Section ===")
 
-    page.goto('http://localhost:4321')
-    page.wait_for_load_state('networkidle')
+    goto_ready(page, 'http://localhost:4321')
 
     # Check for contact section
     contact = page.locator('#contact')
@@ -155,13 +156,12 @@ def test_ffl_transfer_page(page):
     """Test FFL transfer page"""
     print("\n=== Testing FFL Transfer Page ===")
 
-    page.goto('http://localhost:4321/ffl-transfers')
-    page.wait_for_load_state('networkidle')
+    goto_ready(page, 'http://localhost:4321/ffl-transfers')
 
     # Check page loads
     if page.url.endswith('/ffl-transfers') or page.url.endswith('/ffl-transfers/'):
         log_result("FFL page loads", "PASS", "FFL transfer page accessible")
-        page.screenshot(path=str(OUTPUT_DIR / 'ffl-transfer.png'), full_page=True)
+        SCREENSHOTS.capture(page, 'ffl-transfer', full_page=True)
     else:
         log_result("FFL page loads", "WARN", f"Redirected to: {page.url}")
 
@@ -186,8 +186,7 @@ def test_accessibility(page):
     """Test basic accessibility features"""
     print("\n=== Testing Accessibility ===")
 
-    page.goto('http://localhost:4321')
-    page.wait_for_load_state('networkidle')
+    goto_ready(page, 'http://localhost:4321')
 
     # Check for aria-hidden on decorative elements
     aria_hidden = page.locator('[aria-hidden="true"]').all()
@@ -203,6 +202,15 @@ def test_accessibility(page):
         log_result("Image alt text", "WARN",
                    f"{len(images_without_alt)}/{len(images)} images missing alt text")
 
+    # WebP, lazy loading, srcset and sizing (every page and viewport: python tests/image-audit.py)
+    findings, wasted = analyze_images(collect_images(page))
+    if findings:
+        kinds = sorted({kind for kind, _, _, _ in findings})
+        log_result("Image optimization", "WARN",
+                   f"{len(findings)} findings ({', '.join(kinds)}), ~{wasted / 1024:.0f}KB potential savings")
+    else:
+        log_result("Image optimization", "PASS", f"All {len(images)} images sized, lazy-loaded and modern-format")
+
     # Check for focus-visible styles (buttons/links should be focusable)
     buttons = page.locator('button, a').all()
     log_result("Interactive elements", "PASS" if len(buttons) > 0 else "WARN",
@@ -222,12 +230,11 @@ def test_responsive_layout(page, browser):
     for vp in viewports:
         # Create new context with viewport
         context = browser.new_context(viewport={"width": vp["width"], "height": vp["height"]})
-        test_page = context.new_page()
-        test_page.goto('http://localhost:4321')
-        test_page.wait_for_load_state('networkidle')
+        test_page = traced(context.new_page())
+        goto_ready(test_page, 'http://localhost:4321')
 
         # Screenshot at this viewport
-        test_page.screenshot(path=str(OUTPUT_DIR / f'responsive-{vp["name"].lower()}.png'), full_page=True)
+        SCREENSHOTS.capture(test_page, f'responsive-{vp["name"].lower()}', full_page=True)
         log_result(f"Viewport {vp['name']}", "PASS", f"{vp['width']}x{vp['height']} rendered")
 
         context.close()
@@ -237,8 +244,7 @@ def test_footer(page):
     """Test footer content"""
     print("\n=== Testing Footer ===")
 
-    page.goto('http://localhost:4321')
-    page.wait_for_load_state('networkidle')
+    goto_ready(page, 'http://localhost:4321')
 
     footer = page.locator('footer')
     if footer.count() > 0:
@@ -266,18 +272,26 @@ def run_all_tests():
     print("=" * 60)
 
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1280, "height": 800})
+        browser = launch_browser(p)
+        page = traced(browser.new_page(viewport={"width": 1280, "height": 800}))
 
         try:
             # Run all test suites
+            RESULTS.suite("homepage")
             test_homepage_aesthetics(page)
+            RESULTS.suite("navigation")
             test_navigation(page)
+            RESULTS.suite("shop")
             test_shop_section(page)
+            RESULTS.suite("contact")
             test_contact_section(page)
+            RESULTS.suite("ffl-transfer")
             test_ffl_transfer_page(page)
+            RESULTS.suite("accessibility")
             test_accessibility(page)
+            RESULTS.suite("responsive")
             test_responsive_layout(page, browser)
+            RESULTS.suite("footer")
             test_footer(page)
 
         except Exception as e:
@@ -290,16 +304,17 @@ def run_all_tests():
     print("\n" + "=" * 60)
     print("TEST SUMMARY")
     print("=" * 60)
-    print(f"Passed:   {RESULTS['summary']['passed']}")
-    print(f"Failed:   {RESULTS['summary']['failed']}")
-    print(f"Warnings: {RESULTS['summary']['warnings']}")
+    print(f"Passed:   {len(RESULTS.passed)}")
+    print(f"Failed:   {len(RESULTS.failed)}")
+    print(f"Warnings: {len(RESULTS.warnings)}")
     print("=" * 60)
 
     # Save results
-    results_file = OUTPUT_DIR / 'test-results.json'
-    with open(results_file, 'w') as f:
-        json.dump(RESULTS, f, indent=2)
-    print(f"\nResults saved to {results_file}")
+    results_file, junit_file = RESULTS.write(OUTPUT_DIR, basename="test-results")
+    SCREENSHOTS.print_summary()
+    RESULTS.print_trends()
+    TRACER.report(RESULTS.run)
+    print(f"\nResults saved to {results_file} ({junit_file.name})")
     print(f"Screenshots saved to {OUTPUT_DIR}/")
 
     return RESULTS